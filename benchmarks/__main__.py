@@ -0,0 +1,228 @@
+import json
+import os
+import platform
+import tempfile
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import typer
+from rich.table import Table
+from benchmarks.generator import (
+    DEFAULT_LEVELS,
+    DEFAULT_MODULES,
+    DEFAULT_VERSIONS,
+    ThorLogGenerator,
+)
+from benchmarks.stages import StageBenchmarks, peak_rss_mb, run_end_to_end
+from benchmarks.startup import run_startup
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.utils.json_codec import JsonCodec
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+app = typer.Typer(add_completion=False, help="thor2ts throughput benchmarks")
+
+
+def _parse_mix(values: List[str], default: Dict[str, float]) -> Dict[str, float]:
+    if not values:
+        return default
+    mix: Dict[str, float] = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise typer.BadParameter(f"Invalid mix entry '{value}', use NAME=WEIGHT")
+    return mix
+
+
+def _tool_version() -> str:
+    try:
+        return version("thor2timesketch")
+    except PackageNotFoundError:
+        return "unknown (development)"
+
+
+def _meta(**details: Any) -> Dict[str, Any]:
+    return {
+        "thor2ts_version": _tool_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": JsonCodec.backend,
+        "date": datetime.now(timezone.utc).isoformat(),
+        **details,
+    }
+
+
+def _write_results(results: Dict[str, Any], output: Optional[Path]) -> None:
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        ConsoleConfig.success(f"Benchmark results written to '{output}'")
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    table = Table(title="thor2ts benchmark", title_justify="left")
+    for column in ("stage", "items", "seconds", "items/s"):
+        table.add_column(column, justify="left" if column == "stage" else "right")
+    for stage in results["stages"]:
+        table.add_row(
+            stage["stage"],
+            f"{stage['items']:,}",
+            f"{stage['seconds']:.3f}",
+            f"{stage['items_per_second']:,.0f}",
+        )
+    for run in results["end_to_end"]:
+        table.add_row(
+            f"end-to-end (workers={run['workers']})",
+            f"{run['events']:,}",
+            f"{run['seconds']:.3f}",
+            f"{run['events_per_second']:,.0f}",
+        )
+    ConsoleConfig.console.print(table)
+    for run in results["end_to_end"]:
+        if run["peak_rss_mb"] is not None:
+            ConsoleConfig.info(
+                f"Peak RSS (workers={run['workers']}): {run['peak_rss_mb']} MB"
+            )
+
+
+@app.command()
+def run(
+    logs: int = typer.Option(50_000, "--logs", "-n", min=1, help="Log lines"),
+    seed: int = typer.Option(0, "--seed", help="Generator seed"),
+    version_mix: List[str] = typer.Option(
+        [], "--version-mix", help="Log version weight, e.g. v2.0.0=0.8"
+    ),
+    module_mix: List[str] = typer.Option(
+        [], "--module-mix", help="THOR module weight, e.g. Filescan=0.5"
+    ),
+    level_mix: List[str] = typer.Option(
+        [], "--level-mix", help="THOR level weight, e.g. Alert=0.1"
+    ),
+    input_file: Optional[Path] = typer.Option(
+        None, "--input", "-i", help="Benchmark an existing THOR log instead"
+    ),
+    repeat: int = typer.Option(3, "--repeat", "-r", min=1, help="Best of N runs"),
+    workers: List[int] = typer.Option(
+        [1], "--workers", "-w", help="Worker counts for the end-to-end run"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write results as JSON"
+    ),
+) -> None:
+    ConsoleConfig.min_level = ConsoleConfig.LEVELS["WARNING"]
+    source = str(input_file) if input_file is not None else "generated"
+    with tempfile.TemporaryDirectory(prefix="thor2ts-bench-") as tmp:
+        work_dir = Path(tmp)
+        if input_file is None:
+            generator = ThorLogGenerator(
+                seed=seed,
+                versions=_parse_mix(version_mix, DEFAULT_VERSIONS),
+                modules=_parse_mix(module_mix, DEFAULT_MODULES),
+                levels=_parse_mix(level_mix, DEFAULT_LEVELS),
+            )
+            input_file = generator.write(work_dir / "thor_bench.json", logs)
+        else:
+            with input_file.open("rb") as file:
+                logs = sum(1 for _ in file)
+
+        stages = StageBenchmarks(input_file, work_dir, repeat).run()
+        stage_rss = peak_rss_mb(resource.RUSAGE_SELF) if resource else None
+        end_to_end = [
+            run_end_to_end(input_file, work_dir, logs, count) for count in workers
+        ]
+
+    results = {
+        "meta": _meta(seed=seed, logs=logs, input=source, repeat=repeat),
+        "stages": [stage.to_dict() for stage in stages],
+        "stages_peak_rss_mb": stage_rss,
+        "end_to_end": [result.to_dict() for result in end_to_end],
+    }
+    ConsoleConfig.min_level = ConsoleConfig.LEVELS["INFO"]
+    _print_results(results)
+    _write_results(results, output)
+
+
+@app.command()
+def startup(
+    repeat: int = typer.Option(10, "--repeat", "-r", min=1, help="Runs per scenario"),
+    logs: int = typer.Option(20, "--logs", "-n", min=1, help="Log lines to convert"),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write results as JSON"
+    ),
+) -> None:
+    with tempfile.TemporaryDirectory(prefix="thor2ts-startup-") as tmp:
+        startup_results = run_startup(Path(tmp), repeat, logs)
+    results = {
+        "meta": _meta(logs=logs, repeat=repeat),
+        "startup": [result.to_dict() for result in startup_results],
+    }
+    table = Table(title="thor2ts startup", title_justify="left")
+    for column in ("scenario", "best s", "median s", "heavy modules"):
+        table.add_column(column, justify="right" if " s" in column else "left")
+    for result in startup_results:
+        table.add_row(
+            result.scenario,
+            f"{result.best:.3f}",
+            f"{result.median:.3f}",
+            ", ".join(result.loaded) or "-",
+        )
+    ConsoleConfig.console.print(table)
+    _write_results(results, output)
+
+
+@app.command()
+def compare(baseline: Path, candidate: Path) -> None:
+    before = json.loads(baseline.read_text(encoding="utf-8"))
+    after = json.loads(candidate.read_text(encoding="utf-8"))
+    if "startup" in before and "startup" in after:
+        _compare_rows(
+            f"{baseline.name} -> {candidate.name}",
+            ("scenario", "before s", "after s", "change"),
+            {run["scenario"]: run["median_seconds"] for run in before["startup"]},
+            {run["scenario"]: run["median_seconds"] for run in after["startup"]},
+            "{:.3f}",
+        )
+        return
+
+    def rates(results: Dict[str, Any]) -> Dict[str, float]:
+        rows = {s["stage"]: s["items_per_second"] for s in results["stages"]}
+        for run in results["end_to_end"]:
+            rows[f"end-to-end (workers={run['workers']})"] = run["events_per_second"]
+        return rows
+
+    _compare_rows(
+        f"{baseline.name} -> {candidate.name}",
+        ("stage", "before/s", "after/s", "change"),
+        rates(before),
+        rates(after),
+        "{:,.0f}",
+    )
+
+
+def _compare_rows(
+    title: str,
+    columns: Tuple[str, ...],
+    before: Dict[str, float],
+    after: Dict[str, float],
+    number: str,
+) -> None:
+    table = Table(title=title, title_justify="left")
+    for column in columns:
+        table.add_column(column, justify="left" if column == columns[0] else "right")
+    for row, old in before.items():
+        new = after.get(row)
+        if new is None:
+            continue
+        change = (new / old - 1) * 100 if old else 0.0
+        table.add_row(row, number.format(old), number.format(new), f"{change:+.1f}%")
+    ConsoleConfig.console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,206 @@
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+DEFAULT_VERSIONS = {"v1.0.0": 0.35, "v2.0.0": 0.55, "findings": 0.07, "info": 0.03}
+DEFAULT_MODULES = {
+    "Filescan": 0.45,
+    "ProcessCheck": 0.2,
+    "Registry": 0.1,
+    "Eventlog": 0.1,
+    "Users": 0.05,
+    "ServiceCheck": 0.05,
+    "Autoruns": 0.05,
+}
+DEFAULT_LEVELS = {"Alert": 0.05, "Warning": 0.15, "Notice": 0.3, "Info": 0.5}
+SCAN_START = datetime(2025, 5, 7, 11, 45, 0, tzinfo=timezone.utc)
+
+
+class ThorLogGenerator:
+
+    def __init__(
+        self,
+        seed: int = 0,
+        versions: Optional[Mapping[str, float]] = None,
+        modules: Optional[Mapping[str, float]] = None,
+        levels: Optional[Mapping[str, float]] = None,
+        hosts: int = 4,
+    ) -> None:
+        self.random = random.Random(seed)
+        self.versions = dict(versions or DEFAULT_VERSIONS)
+        self.modules = dict(modules or DEFAULT_MODULES)
+        self.levels = dict(levels or DEFAULT_LEVELS)
+        self.hosts = [f"WKS-{index:03d}" for index in range(hosts)]
+
+    def logs(self, count: int) -> Iterator[Dict[str, Any]]:
+        for index in range(count):
+            version = self._choice(self.versions)
+            if version == "findings":
+                yield self._audit_findings(index)
+            elif version == "info":
+                yield self._audit_info(index)
+            elif version == "v1.0.0":
+                yield self._v1(index)
+            else:
+                yield self._v2(index)
+
+    def write(self, output_file: Path, count: int) -> Path:
+        with output_file.open("w", encoding="utf-8") as file:
+            for log in self.logs(count):
+                file.write(json.dumps(log))
+                file.write("\n")
+        return output_file
+
+    def _choice(self, weights: Mapping[str, float]) -> str:
+        return self.random.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _time(self, index: int, days_back: int = 0) -> str:
+        offset = timedelta(
+            seconds=index, days=-days_back, microseconds=self.random.randrange(1000)
+        )
+        return (SCAN_START + offset).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def _old_time(self, index: int) -> str:
+        return self._time(index, days_back=self.random.randrange(1, 2000))
+
+    def _hash(self, length: int) -> str:
+        return "".join(self.random.choices("0123456789abcdef", k=length))
+
+    def _path(self, index: int) -> str:
+        folder = self.random.choice(["Windows\\System32", "Users\\Public", "Temp"])
+        return f"C:\\{folder}\\sample_{index}.exe"
+
+    def _reasons(self) -> Any:
+        return [
+            {
+                "name": f"SUSP_Rule_{self.random.randrange(500)}",
+                "score": self.random.choice([40, 60, 75, 100]),
+                "sigtype": self.random.choice(["YARA", "Sigma", "Filename IOC"]),
+                "ruledate": "2024-03-01",
+                "matched": [f"string{self.random.randrange(20)}"],
+            }
+            for _ in range(self.random.randint(1, 3))
+        ]
+
+    def _v2(self, index: int) -> Dict[str, Any]:
+        module = self._choice(self.modules)
+        log: Dict[str, Any] = {
+            "time": self._time(index),
+            "hostname": self.random.choice(self.hosts),
+            "level": self._choice(self.levels),
+            "module": module,
+            "message": f"{module} finding {index}",
+            "log_version": "v2.0.0",
+            "scan_id": "S-bench",
+            "score": self.random.randrange(101),
+        }
+        if module in ("Filescan", "Autoruns", "ServiceCheck"):
+            log["file"] = {
+                "path": self._path(index),
+                "size": self.random.randrange(1, 10_000_000),
+                "created": self._old_time(index),
+                "modified": self._old_time(index),
+                "accessed": self._time(index),
+                "hashes": {
+                    "md5": self._hash(32),
+                    "sha1": self._hash(40),
+                    "sha256": self._hash(64),
+                },
+                "pe": {"company": "Example Corp", "signed": self.random.random() < 0.5},
+            }
+        elif module == "ProcessCheck":
+            log["process"] = {
+                "pid": self.random.randrange(65536),
+                "name": f"proc{index % 50}.exe",
+                "command": f"{self._path(index)} --flag {index}",
+                "created": self._old_time(index),
+                "parent": {"pid": self.random.randrange(65536), "name": "explorer.exe"},
+            }
+        elif module == "Registry":
+            log["key"] = f"HKLM\\Software\\Run\\entry{index}"
+            log["value"] = self._path(index)
+            log["modified"] = self._old_time(index)
+        elif module == "Users":
+            log["user"] = {
+                "name": f"user{index % 100}",
+                "last_logon": self._old_time(index),
+                "password_changed": self._old_time(index),
+            }
+        else:
+            log["event"] = {"id": self.random.randrange(10000), "channel": "Security"}
+        log["reasons"] = self._reasons()
+        return log
+
+    def _v1(self, index: int) -> Dict[str, Any]:
+        module = self._choice(self.modules)
+        log: Dict[str, Any] = {
+            "time": self._time(index),
+            "hostname": self.random.choice(self.hosts),
+            "level": self._choice(self.levels),
+            "module": module,
+            "message": f"{module} finding {index}",
+            "log_version": "v1.0.0",
+            "scanid": "S-bench",
+            "score": self.random.randrange(101),
+        }
+        if module in ("Filescan", "Autoruns", "ServiceCheck"):
+            log.update(
+                {
+                    "file": self._path(index),
+                    "size": self.random.randrange(1, 10_000_000),
+                    "created": self._old_time(index),
+                    "modified": self._old_time(index),
+                    "md5": self._hash(32),
+                    "sha256": self._hash(64),
+                }
+            )
+        elif module == "ProcessCheck":
+            log.update(
+                {
+                    "pid": self.random.randrange(65536),
+                    "process": self._path(index),
+                    "created": self._old_time(index),
+                }
+            )
+        else:
+            log.update({"key": f"entry{index}", "modified": self._old_time(index)})
+        for number, reason in enumerate(self._reasons(), start=1):
+            log[f"reason_{number}"] = reason["name"]
+        return log
+
+    def _audit_timestamps(self, index: int) -> Dict[str, str]:
+        return {
+            name: self._old_time(index)
+            for name in ("Created", "Modified", "Accessed")
+            if self.random.random() < 0.8
+        } or {"Created": self._old_time(index)}
+
+    def _audit_findings(self, index: int) -> Dict[str, Any]:
+        return {
+            "findings": [
+                {
+                    "Module": self._choice(self.modules),
+                    "Level": self._choice(self.levels),
+                    "Message": f"Audit finding {index}.{number}",
+                    "Timestamps": self._audit_timestamps(index),
+                    "Details": {
+                        "Path": self._path(index),
+                        "Sha256": self._hash(64),
+                        "Size": self.random.randrange(1, 10_000_000),
+                    },
+                }
+                for number in range(self.random.randint(1, 4))
+            ]
+        }
+
+    def _audit_info(self, index: int) -> Dict[str, Any]:
+        return {
+            "info": {
+                "Name": f"Audit info {index}",
+                "Id": f"ID-{index}",
+                "Timestamps": self._audit_timestamps(index),
+                "Details": {"Host": self.random.choice(self.hosts)},
+            }
+        }
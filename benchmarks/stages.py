@@ -0,0 +1,164 @@
+import copy
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from thor2timesketch.constants import LOG_VERSION
+from thor2timesketch.input.json_reader import JsonReader
+from thor2timesketch.mappers.json_log_version import JsonLogVersion
+from thor2timesketch.mappers.mapper_loader import load_all_mappers
+from thor2timesketch.output.file_writer import FileWriter
+from thor2timesketch.transformation.pretransformation_processor import (
+    PreTransformationProcessor,
+)
+from thor2timesketch.utils.json_flattener import JSONFlattener
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+
+class StageResult(NamedTuple):
+    stage: str
+    items: int
+    seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "items": self.items,
+            "seconds": round(self.seconds, 6),
+            "items_per_second": round(self.items_per_second, 1),
+        }
+
+
+class EndToEndResult(NamedTuple):
+    workers: int
+    logs: int
+    events: int
+    seconds: float
+    peak_rss_mb: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "logs": self.logs,
+            "events": self.events,
+            "seconds": round(self.seconds, 6),
+            "events_per_second": round(self.events / self.seconds, 1),
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+
+
+def peak_rss_mb(who: int) -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class StageBenchmarks:
+
+    def __init__(self, input_file: Path, work_dir: Path, repeat: int = 3) -> None:
+        self.input_file = input_file
+        self.work_dir = work_dir
+        self.repeat = repeat
+        load_all_mappers()
+
+    def run(self) -> List[StageResult]:
+        raw_logs = list(JsonReader().read_valid_data(self.input_file))
+        pre_transform = PreTransformationProcessor()
+        logs = self._pretransform(pre_transform, raw_logs)
+        thor_logs = [log for log in logs if LOG_VERSION in log]
+        flattened = [JSONFlattener.flatten_json(log) for log in thor_logs]
+        extractor = RegexTimestampExtractor()
+        events = self._map(copy.deepcopy(logs))
+        output_file = self.work_dir / "stage_output.jsonl"
+        return [
+            self._measure("read", len(raw_logs), lambda _: self._read()),
+            self._measure(
+                "pretransform",
+                len(raw_logs),
+                lambda _: self._pretransform(pre_transform, raw_logs),
+            ),
+            self._measure("version", len(logs), lambda _: self._resolve(logs)),
+            self._measure(
+                "flatten",
+                len(thor_logs),
+                lambda _: [JSONFlattener.flatten_json(log) for log in thor_logs],
+            ),
+            self._measure(
+                "timestamps",
+                len(flattened),
+                lambda _: [extractor.extract(log) for log in flattened],
+            ),
+            self._measure(
+                "map", len(logs), self._map, prepare=lambda: copy.deepcopy(logs)
+            ),
+            self._measure(
+                "write",
+                len(events),
+                lambda _: FileWriter(output_file).write_to_file(iter(events)),
+                prepare=lambda: output_file.unlink(missing_ok=True),
+            ),
+        ]
+
+    def _read(self) -> int:
+        return sum(1 for _ in JsonReader().read_valid_data(self.input_file))
+
+    def _pretransform(
+        self, pre_transform: PreTransformationProcessor, raw_logs: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        return pre_transform.transformation_batch(raw_logs)
+
+    def _resolve(self, logs: List[Dict[str, Any]]) -> List[Any]:
+        return JsonLogVersion().group_by_mapper(logs)
+
+    def _map(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            event
+            for mapper, group in JsonLogVersion().group_by_mapper(logs)
+            for event in mapper.map_thor_events_batch(group)
+        ]
+
+    def _measure(
+        self,
+        stage: str,
+        items: int,
+        func: Callable[[Any], Any],
+        prepare: Optional[Callable[[], Any]] = None,
+    ) -> StageResult:
+        best = float("inf")
+        for _ in range(self.repeat):
+            data = prepare() if prepare is not None else None
+            start = time.perf_counter()
+            func(data)
+            best = min(best, time.perf_counter() - start)
+        return StageResult(stage, items, best)
+
+
+def run_end_to_end(
+    input_file: Path, work_dir: Path, logs: int, workers: int = 1
+) -> EndToEndResult:
+    output_file = work_dir / "end_to_end.jsonl"
+    output_file.unlink(missing_ok=True)
+    command = [sys.executable, "-m", "thor2timesketch", str(input_file)]
+    command += ["-o", str(output_file)]
+    if workers > 1:
+        command += ["-w", str(workers)]
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, env=dict(os.environ))
+    seconds = time.perf_counter() - start
+    with output_file.open("rb") as file:
+        events = sum(1 for _ in file)
+    rss = peak_rss_mb(resource.RUSAGE_CHILDREN) if resource is not None else None
+    return EndToEndResult(workers, logs, events, seconds, rss)
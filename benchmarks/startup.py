@@ -0,0 +1,92 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+from benchmarks.generator import ThorLogGenerator
+
+HEAVY_MODULES = (
+    "timesketch_api_client",
+    "timesketch_import_client",
+    "pandas",
+    "yaml",
+    "multiprocessing",
+)
+
+
+class StartupResult(NamedTuple):
+    scenario: str
+    runs: int
+    best: float
+    median: float
+    loaded: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "runs": self.runs,
+            "best_seconds": round(self.best, 6),
+            "median_seconds": round(self.median, 6),
+            "heavy_modules": self.loaded,
+        }
+
+
+def _scenarios(work_dir: Path, logs: int) -> Dict[str, List[str]]:
+    input_file = ThorLogGenerator(seed=0).write(work_dir / "startup.json", logs)
+    filter_file = work_dir / "startup_filter.yaml"
+    filter_file.write_text("filters:\n  levels: [Alert, Warning]\n", encoding="utf-8")
+    output_file = str(work_dir / "startup_output.jsonl")
+    cli = ["-m", "thor2timesketch"]
+    return {
+        "interpreter": ["-c", "pass"],
+        "version": cli + ["--version"],
+        "convert": cli + [str(input_file), "-o", output_file],
+        "convert (filter)": cli
+        + [str(input_file), "-o", output_file, "-F", str(filter_file)],
+    }
+
+
+def _loaded_modules(arguments: List[str]) -> List[str]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=dict(os.environ),
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    return [module for module in HEAVY_MODULES if module in imported]
+
+
+def run_startup(
+    work_dir: Path, repeat: int = 10, logs: int = 20
+) -> List[StartupResult]:
+    results = []
+    for scenario, arguments in _scenarios(work_dir, logs).items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, *arguments],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                env=dict(os.environ),
+            )
+            timings.append(time.perf_counter() - start)
+        results.append(
+            StartupResult(
+                scenario,
+                repeat,
+                min(timings),
+                statistics.median(timings),
+                _loaded_modules(arguments),
+            )
+        )
+    return results
@@ -1,12 +1,29 @@
 import typer
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from importlib.metadata import version, PackageNotFoundError
 from thor2timesketch.config.console_config import ConsoleConfig
-from thor2timesketch.config.filter_creator import FilterCreator
+from thor2timesketch.constants import (
+    CHECKPOINT_SUFFIX,
+    DEFAULT_JSON_BACKEND,
+    JSON_BACKENDS,
+    OUTPUT_COMPRESSION_EXTENSIONS,
+)
 from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.output.checkpoint import CheckpointTracker
 from thor2timesketch.output.output_writer import OutputWriter
-from thor2timesketch.exceptions import Thor2tsError
+from thor2timesketch.exceptions import (
+    InputError,
+    OutputError,
+    ProcessingError,
+    Thor2tsError,
+)
+from thor2timesketch.input.input_collector import InputCollector
+from thor2timesketch.utils.json_codec import JsonCodec
+from thor2timesketch.utils.progress_bar import ProgressBar
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+from thor2timesketch.utils.stage_profiler import StageProfiler
+from thor2timesketch.utils.thor_finding_id import ThorFindingId
 
 app = typer.Typer(
     help="Convert THOR security scanner logs to Timesketch format",
@@ -27,6 +44,32 @@ def _show_version(value: bool) -> None:
         raise typer.Exit()
 
 
+_MODIFIER_REQUIRES = {
+    "workers": {"output_file", "sketch"},
+    "uploaders": {"sketch"},
+    "upload_queue_size": {"sketch"},
+    "output_compression": {"output_file"},
+    "output_max_size": {"output_file"},
+    "output_max_events": {"output_file"},
+    "learn_timestamp_paths": {"output_file", "sketch"},
+    "deterministic_ids": {"output_file", "sketch"},
+    "id_salt": {"output_file", "sketch"},
+    "resume": {"output_file", "sketch"},
+    "checkpoint_file": {"output_file", "sketch"},
+    "profile": {"output_file", "sketch"},
+    "profile_report": {"output_file", "sketch"},
+    "follow": {"output_file", "sketch"},
+    "follow_timeout": {"output_file", "sketch"},
+}
+_RECEIVER_UNSUPPORTED = {
+    "workers": "-w/--workers",
+    "resume": "--resume",
+    "checkpoint_file": "--checkpoint-file",
+    "follow": "--follow",
+    "follow_timeout": "--follow-timeout",
+}
+
+
 def _validate_args(
     input_file: Optional[Path],
     output_file: Optional[Path],
@@ -34,6 +77,8 @@ def _validate_args(
     buffer_size: Optional[int],
     filter_path: Optional[Path],
     generate_filters: bool,
+    modifiers: Optional[Dict[str, Any]] = None,
+    listen: bool = False,
 ) -> None:
     allowed = {
         frozenset(["generate_filters"]),
@@ -44,10 +89,14 @@ def _validate_args(
         frozenset(["input_file", "output_file", "filter"]),
         frozenset(["input_file", "sketch", "filter"]),
         frozenset(["input_file", "sketch", "filter", "buffer_size"]),
+        frozenset(["input_file", "output_file", "sketch"]),
+        frozenset(["input_file", "output_file", "sketch", "buffer_size"]),
+        frozenset(["input_file", "output_file", "sketch", "filter"]),
+        frozenset(["input_file", "output_file", "sketch", "filter", "buffer_size"]),
     }
 
     active = set()
-    if input_file:
+    if input_file or listen:
         active.add("input_file")
     if generate_filters:
         active.add("generate_filters")
@@ -60,12 +109,167 @@ def _validate_args(
     if filter_path:
         active.add("filter")
 
+    for modifier, value in (modifiers or {}).items():
+        if value and not active & _MODIFIER_REQUIRES[modifier]:
+            ConsoleConfig.error("Check -h for valid arguments")
+            raise typer.Exit(code=1)
+
     if active not in allowed:
         ConsoleConfig.error("Check -h for valid arguments")
         raise typer.Exit(code=1)
 
 
+def _configure_json_backend(json_backend: str) -> None:
+    try:
+        JsonCodec.configure(json_backend)
+    except Thor2tsError as e:
+        ConsoleConfig.error(f"{e}")
+        raise typer.Exit(code=1)
+
+
+def _checkpoint_tracker(
+    input_file: Path, output_file: Optional[Path], checkpoint_file: Optional[Path]
+) -> CheckpointTracker:
+    if checkpoint_file is None:
+        checkpoint_file = (
+            output_file.with_name(output_file.name + CHECKPOINT_SUFFIX)
+            if output_file
+            else Path(input_file.name + CHECKPOINT_SUFFIX)
+        )
+    return CheckpointTracker(checkpoint_file, input_file)
+
+
+def _resume_hint(checkpoint: CheckpointTracker) -> None:
+    if checkpoint.sinks and checkpoint.exists():
+        ConsoleConfig.info(
+            f"Progress was saved to '{checkpoint.checkpoint_file}', "
+            f"run the same command with --resume to continue"
+        )
+
+
+def _transformer(workers: Optional[int]) -> JsonTransformer:
+    if workers and workers > 1:
+        from thor2timesketch.transformation.parallel_transformer import (
+            ParallelTransformer,
+        )
+
+        return ParallelTransformer(workers)
+    return JsonTransformer()
+
+
+def _follow_transformer(
+    input_file: Path,
+    workers: Optional[int],
+    checkpointed: bool,
+    follow_timeout: Optional[float],
+) -> JsonTransformer:
+    from thor2timesketch.input.file_follower import FileFollower
+
+    if workers and workers > 1:
+        raise InputError("--follow transforms events in a single process")
+    if checkpointed:
+        raise InputError(
+            "--follow cannot be combined with --resume or --checkpoint-file"
+        )
+    transformer = JsonTransformer(follower=FileFollower(timeout=follow_timeout))
+    transformer.check_followable(input_file)
+    return transformer
+
+
+def _convert_batch(
+    input_path: Path,
+    output_dir: Optional[Path],
+    workers: Optional[int],
+    resume: bool,
+    **settings: Any,
+) -> None:
+    from thor2timesketch.transformation.batch_converter import (
+        BatchConverter,
+        BatchSettings,
+    )
+
+    if resume:
+        raise InputError("--resume and --checkpoint-file need a single input file")
+    if output_dir is not None and output_dir.is_file():
+        raise OutputError(
+            f"Output '{output_dir}' must be a directory when converting multiple files"
+        )
+    collector = InputCollector()
+    input_files = collector.collect(input_path)
+    output_files = (
+        collector.output_files(input_files, output_dir) if output_dir else None
+    )
+    results = BatchConverter(BatchSettings(**settings), workers).convert(
+        input_files, output_files
+    )
+    BatchConverter.print_summary(results)
+    failed = sum(1 for result in results if result.error is not None)
+    if failed:
+        raise ProcessingError(f"Failed to convert '{failed}' of '{len(results)}' files")
+    ConsoleConfig.success(
+        f"✓ thor2ts successfully converted '{len(results)}' files with "
+        f"'{sum(result.events for result in results)}' events"
+    )
+
+
+def _receive(
+    listen: List[str],
+    input_file: Optional[Path],
+    output_dir: Optional[Path],
+    unsupported: Dict[str, Any],
+    **settings: Any,
+) -> None:
+    from thor2timesketch.input.network_receiver import ListenAddress
+    from thor2timesketch.transformation.batch_converter import (
+        BatchConverter,
+        BatchSettings,
+    )
+    from thor2timesketch.transformation.receiver_converter import ReceiverConverter
+
+    if input_file is not None:
+        raise InputError("--listen receives events instead of reading an input file")
+    for modifier, value in unsupported.items():
+        if value:
+            raise InputError(
+                f"--listen cannot be combined with {_RECEIVER_UNSUPPORTED[modifier]}"
+            )
+    if output_dir is not None and output_dir.is_file():
+        raise OutputError(
+            f"Output '{output_dir}' must be a directory when receiving events"
+        )
+    addresses = [ListenAddress.parse(value) for value in listen]
+    results = ReceiverConverter(
+        addresses, BatchSettings(**settings), output_dir
+    ).receive()
+    if not results:
+        ConsoleConfig.warning("No events were received")
+        return
+    BatchConverter.print_summary(results, "thor2ts received events")
+    failed = sum(1 for result in results if result.error is not None)
+    if failed:
+        raise ProcessingError(
+            f"Failed to convert events from '{failed}' of '{len(results)}' sources"
+        )
+    ConsoleConfig.success(
+        f"✓ thor2ts successfully converted '{sum(result.events for result in results)}' "
+        f"events from '{len(results)}' sources"
+    )
+
+
+def _profile_summary(profile_report: Optional[Path]) -> None:
+    report = StageProfiler.report()
+    StageProfiler.print_summary(report)
+    if profile_report is None:
+        return
+    try:
+        StageProfiler.write_report(report, profile_report)
+    except Thor2tsError as e:
+        ConsoleConfig.error(f"{e}")
+
+
 def _filter_generation(input_file: Optional[Path]) -> None:
+    from thor2timesketch.config.filter_creator import FilterCreator
+
     try:
         FilterCreator(input_file).generate_yaml_file()
     except Thor2tsError as e:
@@ -76,7 +280,9 @@ def _filter_generation(input_file: Optional[Path]) -> None:
 @app.command()
 def main(
     input_file: Optional[Path] = typer.Argument(
-        None, help="Path to the THOR file", metavar="[THOR JSON LOGS]"
+        None,
+        help="Path to the THOR file, or a directory or glob pattern of THOR files",
+        metavar="[THOR JSON LOGS]",
     ),
     output_file: Optional[Path] = typer.Option(
         None, "--output", "-o", help="Write converted THOR logs to specified JSONL file"
@@ -93,14 +299,111 @@ def main(
         "-b",
         help="Number of events to buffer before sending to Timesketch (default: 50_000 events)",
     ),
+    uploaders: Optional[int] = typer.Option(
+        None,
+        "--uploaders",
+        min=1,
+        help="Number of threads uploading to Timesketch, each creates its own timeline part (default: 1)",
+    ),
+    upload_queue_size: Optional[int] = typer.Option(
+        None,
+        "--upload-queue-size",
+        min=1,
+        help="Number of converted events queued for the Timesketch uploaders (default: 10_000 events)",
+    ),
+    output_compression: Optional[str] = typer.Option(
+        None,
+        "--output-compression",
+        help=f"Compress the output file: {', '.join(OUTPUT_COMPRESSION_EXTENSIONS)}",
+    ),
+    output_max_size: Optional[int] = typer.Option(
+        None,
+        "--output-max-size",
+        min=1,
+        help="Start a new numbered output part file after this many MB (uncompressed)",
+    ),
+    output_max_events: Optional[int] = typer.Option(
+        None,
+        "--output-max-events",
+        min=1,
+        help="Start a new numbered output part file after this many events",
+    ),
     filter_path: Optional[Path] = typer.Option(
         None, "--filter", "-F", help="Path to a YAML filter configuration file"
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of worker processes used to transform THOR logs (default: 1)",
+    ),
     generate_filters: bool = typer.Option(
         False,
         "--generate-filters",
         help="Generate a default filters YAML file with name 'thor_filter.yaml'",
     ),
+    learn_timestamp_paths: bool = typer.Option(
+        False,
+        "--learn-timestamp-paths",
+        help="Only check timestamp fields learned from earlier events with the same module and fields (faster, may miss timestamps in other fields)",
+    ),
+    deterministic_ids: bool = typer.Option(
+        False,
+        "--deterministic-ids",
+        help="Derive event_group_id from a keyed hash of each THOR log instead of a random ID, so re-runs produce the same IDs",
+    ),
+    id_salt: Optional[str] = typer.Option(
+        None,
+        "--id-salt",
+        help="Secret or per-scan salt for the event_group_id hash (implies --deterministic-ids)",
+    ),
+    json_backend: str = typer.Option(
+        DEFAULT_JSON_BACKEND,
+        "--json-backend",
+        help=f"JSON library used to parse and write events: {', '.join(JSON_BACKENDS)}",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted run from its checkpoint into the same output file or timeline",
+    ),
+    checkpoint_file: Optional[Path] = typer.Option(
+        None,
+        "--checkpoint-file",
+        help=f"Checkpoint file recording durable progress (default: output file or input file name + '{CHECKPOINT_SUFFIX}')",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print wall/CPU time, calls and events per pipeline stage at the end",
+    ),
+    profile_report: Optional[Path] = typer.Option(
+        None,
+        "--profile-report",
+        help="Write the per-stage profile as JSON to this file (implies --profile)",
+    ),
+    follow: bool = typer.Option(
+        False,
+        "--follow",
+        help="Keep reading new lines appended to the input file by a running THOR scan, until Ctrl+C",
+    ),
+    follow_timeout: Optional[float] = typer.Option(
+        None,
+        "--follow-timeout",
+        min=0,
+        help="Stop following after this many seconds without new lines",
+    ),
+    listen: Optional[List[str]] = typer.Option(
+        None,
+        "--listen",
+        help="Receive THOR JSON events instead of reading a file, on tcp://, udp:// (syslog) or http:// (POST) [HOST]:PORT; repeatable, one timeline or output file per source",
+    ),
+    no_progress: bool = typer.Option(
+        False,
+        "--no-progress",
+        help="Headless mode for non-interactive runs: no live progress bar and no forced terminal colors",
+    ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Enable verbose debugging output"
     ),
@@ -112,6 +415,9 @@ def main(
         help="thor2ts version",
     ),
 ) -> None:
+    if no_progress:
+        ConsoleConfig.set_headless(True)
+        ProgressBar.enabled = False
     ConsoleConfig.panel(
         "Convert THOR security scanner logs to Timesketch format",
         title="thor2ts powered by Nextron Systems",
@@ -119,27 +425,143 @@ def main(
     )
 
     ConsoleConfig.set_verbose(verbose)
+    _configure_json_backend(json_backend)
+    RegexTimestampExtractor.configure_path_index(learn_timestamp_paths)
+    ThorFindingId.configure(deterministic_ids, id_salt)
     _validate_args(
-        input_file, output_file, sketch, buffer_size, filter_path, generate_filters
+        input_file,
+        output_file,
+        sketch,
+        buffer_size,
+        filter_path,
+        generate_filters,
+        {
+            "workers": workers,
+            "uploaders": uploaders,
+            "upload_queue_size": upload_queue_size,
+            "output_compression": output_compression,
+            "output_max_size": output_max_size,
+            "output_max_events": output_max_events,
+            "learn_timestamp_paths": learn_timestamp_paths,
+            "deterministic_ids": deterministic_ids,
+            "id_salt": id_salt,
+            "resume": resume,
+            "checkpoint_file": checkpoint_file,
+            "profile": profile,
+            "profile_report": profile_report,
+            "follow": follow,
+            "follow_timeout": follow_timeout,
+        },
+        listen=bool(listen),
     )
 
     if generate_filters:
         _filter_generation(input_file)
         raise typer.Exit()
 
+    if profile or profile_report:
+        StageProfiler.enable()
+    if listen:
+        try:
+            _receive(
+                listen,
+                input_file,
+                output_file,
+                {
+                    "workers": workers is not None and workers > 1,
+                    "resume": resume,
+                    "checkpoint_file": checkpoint_file,
+                    "follow": follow,
+                    "follow_timeout": follow_timeout is not None,
+                },
+                filter_path=filter_path,
+                sketch=sketch,
+                buffer_size=buffer_size,
+                uploaders=uploaders,
+                upload_queue_size=upload_queue_size,
+                output_compression=output_compression,
+                output_max_size=output_max_size,
+                output_max_events=output_max_events,
+            )
+        except Thor2tsError as e:
+            ConsoleConfig.error(f"{e}")
+            raise typer.Exit(code=1)
+        finally:
+            if StageProfiler.enabled:
+                _profile_summary(profile_report)
+        return
     if not input_file:
         ConsoleConfig.error("Input file is required")
         raise typer.Exit(code=1)
+    checkpoint = _checkpoint_tracker(input_file, output_file, checkpoint_file)
     try:
-        events = JsonTransformer().transform_thor_logs(input_file, filter_path)
-        OutputWriter(input_file, output_file, sketch, buffer_size).write(events)
+        if follow_timeout is not None and not follow:
+            raise InputError("--follow-timeout needs --follow")
+        if InputCollector.is_batch(input_file):
+            if follow:
+                raise InputError("--follow needs a single input file")
+            _convert_batch(
+                input_file,
+                output_file,
+                workers,
+                resume or checkpoint_file is not None,
+                filter_path=filter_path,
+                sketch=sketch,
+                buffer_size=buffer_size,
+                uploaders=uploaders,
+                upload_queue_size=upload_queue_size,
+                output_compression=output_compression,
+                output_max_size=output_max_size,
+                output_max_events=output_max_events,
+            )
+            return
+        tracker: Optional[CheckpointTracker] = checkpoint
+        if follow:
+            transformer = _follow_transformer(
+                input_file,
+                workers,
+                resume or checkpoint_file is not None,
+                follow_timeout,
+            )
+            tracker = None
+        else:
+            if resume:
+                checkpoint.load()
+            elif checkpoint.exists():
+                ConsoleConfig.warning(
+                    f"Replacing checkpoint '{checkpoint.checkpoint_file}' of an "
+                    f"earlier run, use --resume to continue that run instead"
+                )
+            transformer = _transformer(workers)
+        events = transformer.transform_thor_logs(input_file, filter_path, tracker)
+        OutputWriter(
+            input_file,
+            output_file,
+            sketch,
+            buffer_size,
+            uploaders=uploaders,
+            upload_queue_size=upload_queue_size,
+            output_compression=output_compression,
+            output_max_size=output_max_size,
+            output_max_events=output_max_events,
+            checkpoint=tracker,
+            follow=follow,
+        ).write(events)
+        if tracker is not None:
+            tracker.remove()
         ConsoleConfig.success("✓ thor2ts successfully completed")
     except Thor2tsError as e:
         ConsoleConfig.error(f"{e}")
+        _resume_hint(checkpoint)
         raise typer.Exit(code=1)
     except KeyboardInterrupt:
         ConsoleConfig.warning("⚠ Processing interrupted by user")
+        _resume_hint(checkpoint)
         raise typer.Exit(code=130)
     except Exception as e:
         ConsoleConfig.error(f"Unexpected error: {e}")
+        _resume_hint(checkpoint)
         raise typer.Exit(code=1)
+    finally:
+        if StageProfiler.enabled:
+            _profile_summary(profile_report)
@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Callable, Union
 from rich.console import Console
 from rich.panel import Panel
 from rich import box
 from rich.align import Align
-from rich.table import Table
+from rich.text import Text
+
+Message = Union[str, Callable[[], str]]
 
 
 class ConsoleConfig:
@@ -30,35 +33,38 @@ class ConsoleConfig:
         return datetime.now().strftime("%d %b %Y %H:%M:%S")
 
     @classmethod
-    def _print(cls, level: str, message: str) -> None:
+    def is_enabled(cls, level: str) -> bool:
+        return cls.LEVELS[level] >= cls.min_level
+
+    @classmethod
+    def _print(cls, level: str, message: Message) -> None:
         if cls.LEVELS[level] < cls.min_level:
             return
-        table = Table(show_header=False, box=None)
-        table.add_column("timestamp", style=cls.LEVEL_STYLES[level], min_width=20)
-        table.add_column("level", style=cls.LEVEL_STYLES[level], min_width=9)
-        table.add_column("message", style=cls.LEVEL_STYLES[level])
-        ts = cls.timestamp()
-        table.add_row(ts, f"[{level}]", message)
-        cls.console.print(table, markup=True, highlight=False)
+        if callable(message):
+            message = message()
+        style = cls.LEVEL_STYLES[level]
+        line = Text(f" {cls.timestamp():<20}  {f'[{level}]':<9}  ", style=style)
+        line.append_text(Text.from_markup(message, style=style))
+        cls.console.print(line, highlight=False)
 
     @classmethod
-    def info(cls, message: str) -> None:
+    def info(cls, message: Message) -> None:
         cls._print("INFO", message)
 
     @classmethod
-    def debug(cls, message: str) -> None:
+    def debug(cls, message: Message) -> None:
         cls._print("DEBUG", message)
 
     @classmethod
-    def warning(cls, message: str) -> None:
+    def warning(cls, message: Message) -> None:
         cls._print("WARNING", message)
 
     @classmethod
-    def error(cls, message: str) -> None:
+    def error(cls, message: Message) -> None:
         cls._print("ERROR", message)
 
     @classmethod
-    def success(cls, message: str) -> None:
+    def success(cls, message: Message) -> None:
         cls._print("SUCCESS", message)
 
     @classmethod
@@ -76,3 +82,11 @@ class ConsoleConfig:
     @classmethod
     def set_verbose(cls, verbose: bool) -> None:
         cls.min_level = cls.LEVELS["DEBUG"] if verbose else cls.LEVELS["INFO"]
+
+    @classmethod
+    def set_headless(cls, headless: bool) -> None:
+        cls.console = (
+            Console(force_terminal=False, soft_wrap=True)
+            if headless
+            else Console(force_terminal=True)
+        )
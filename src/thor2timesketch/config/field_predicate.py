@@ -0,0 +1,189 @@
+import operator
+import re
+from datetime import date, datetime, time, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from thor2timesketch.exceptions import FilterConfigError
+from thor2timesketch.utils.timestamp_normalizer import TimestampNormalizer
+
+Predicate = Callable[[Dict[str, Any]], bool]
+ValueCheck = Callable[[Any], bool]
+
+_MISSING = object()
+_COMPARISONS: Dict[str, Callable[[float, float], bool]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class FieldPredicate:
+    FIELD_KEY = "field"
+    IGNORE_CASE_KEY = "ignore_case"
+    OPERATORS = (
+        "equals",
+        "not_equals",
+        "in",
+        "regex",
+        "prefix",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+        "after",
+        "before",
+    )
+
+    @classmethod
+    def compile(cls, conditions: Any) -> Optional[Predicate]:
+        if not conditions:
+            return None
+        if not isinstance(conditions, list):
+            raise FilterConfigError("'fields' must be a list of field conditions")
+        tests = [cls._compile_condition(condition) for condition in conditions]
+
+        def matches(json_log: Dict[str, Any]) -> bool:
+            for test in tests:
+                if not test(json_log):
+                    return False
+            return True
+
+        return matches
+
+    @classmethod
+    def _compile_condition(cls, condition: Any) -> Predicate:
+        if not isinstance(condition, dict) or not isinstance(
+            condition.get(cls.FIELD_KEY), str
+        ):
+            raise FilterConfigError(
+                f"Invalid field condition {condition!r}: expected a mapping with "
+                f"a '{cls.FIELD_KEY}' name"
+            )
+        field = condition[cls.FIELD_KEY]
+        ignore_case = bool(condition.get(cls.IGNORE_CASE_KEY, False))
+        checks: List[ValueCheck] = []
+        for name, expected in condition.items():
+            if name in (cls.FIELD_KEY, cls.IGNORE_CASE_KEY):
+                continue
+            if name not in cls.OPERATORS:
+                raise FilterConfigError(
+                    f"Unknown operator '{name}' for field '{field}'. "
+                    f"Expected one of: {list(cls.OPERATORS)}"
+                )
+            checks.append(cls._compile_check(field, name, expected, ignore_case))
+        if not checks:
+            raise FilterConfigError(f"No condition given for field '{field}'")
+        get_value = cls._getter(tuple(field.split(".")))
+
+        def matches(json_log: Dict[str, Any]) -> bool:
+            value = get_value(json_log)
+            if value is _MISSING or value is None:
+                return False
+            for check in checks:
+                if not check(value):
+                    return False
+            return True
+
+        return matches
+
+    @staticmethod
+    def _getter(path: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Any]:
+        if len(path) == 1:
+            key = path[0]
+            return lambda json_log: json_log.get(key, _MISSING)
+
+        def get_nested(json_log: Dict[str, Any]) -> Any:
+            value: Any = json_log
+            for key in path:
+                if not isinstance(value, dict):
+                    return _MISSING
+                value = value.get(key, _MISSING)
+            return value
+
+        return get_nested
+
+    @classmethod
+    def _compile_check(
+        cls, field: str, name: str, expected: Any, ignore_case: bool
+    ) -> ValueCheck:
+        try:
+            if name in ("equals", "not_equals", "in"):
+                return cls._membership(name, expected, ignore_case)
+            if name == "regex":
+                pattern = re.compile(str(expected), re.IGNORECASE if ignore_case else 0)
+                return lambda value: pattern.search(str(value)) is not None
+            if name == "prefix":
+                prefix = cls._text(expected, ignore_case)
+                return lambda value: cls._text(value, ignore_case).startswith(prefix)
+            if name in ("gt", "gte", "lt", "lte"):
+                return cls._numeric(name, expected)
+            return cls._time_range(name, expected)
+        except (re.error, TypeError, ValueError, OverflowError) as e:
+            raise FilterConfigError(
+                f"Invalid '{name}' condition for field '{field}': {e}"
+            ) from e
+
+    @classmethod
+    def _membership(cls, name: str, expected: Any, ignore_case: bool) -> ValueCheck:
+        values = expected if isinstance(expected, list) else [expected]
+        if name != "in" and isinstance(expected, list):
+            raise TypeError("expected a single value, use 'in' for a list")
+        allowed = {cls._text(value, ignore_case) for value in values}
+        if name == "not_equals":
+            return lambda value: cls._text(value, ignore_case) not in allowed
+        return lambda value: cls._text(value, ignore_case) in allowed
+
+    @staticmethod
+    def _numeric(name: str, expected: Any) -> ValueCheck:
+        if isinstance(expected, bool) or not isinstance(expected, (int, float)):
+            raise TypeError(f"expected a number, got {expected!r}")
+        limit = float(expected)
+        compare = _COMPARISONS[name]
+
+        def check(value: Any) -> bool:
+            if isinstance(value, bool):
+                return False
+            try:
+                return compare(float(value), limit)
+            except (TypeError, ValueError):
+                return False
+
+        return check
+
+    @classmethod
+    def _time_range(cls, name: str, expected: Any) -> ValueCheck:
+        limit = cls._datetime(expected)
+        if limit is None:
+            raise ValueError(f"expected an ISO 8601 timestamp, got {expected!r}")
+        compare = operator.gt if name == "after" else operator.lt
+
+        def check(value: Any) -> bool:
+            moment = cls._datetime(value)
+            return moment is not None and bool(compare(moment, limit))
+
+        return check
+
+    @staticmethod
+    def _datetime(value: Any) -> Optional[datetime]:
+        if isinstance(value, datetime):
+            moment = value
+        elif isinstance(value, date):
+            moment = datetime.combine(value, time())
+        elif isinstance(value, str):
+            try:
+                moment = TimestampNormalizer.parse(value)
+            except (ValueError, OverflowError):
+                return None
+        else:
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return moment
+
+    @staticmethod
+    def _text(value: Any, ignore_case: bool) -> str:
+        if isinstance(value, bool):
+            text = str(value).lower()
+        else:
+            text = str(value)
+        return text.lower() if ignore_case else text
@@ -10,6 +10,7 @@ from thor2timesketch.constants import (
     DEFAULT_LEVELS,
     DEFAULT_FILTERS_YAML,
     VALID_JSON_EXTENSIONS,
+    COMPRESSED_EXTENSIONS,
     AUDIT_INFO,
     AUDIT_FINDING,
 )
@@ -31,7 +32,10 @@ class FilterCreator:
     def generate_yaml_file(self) -> None:
         try:
             if self.input_file:
-                validator = FileValidator(valid_extensions=VALID_JSON_EXTENSIONS)
+                validator = FileValidator(
+                    valid_extensions=VALID_JSON_EXTENSIONS,
+                    compressed_extensions=COMPRESSED_EXTENSIONS,
+                )
                 valid_input_file = validator.validate_file(self.input_file)
                 events = self.json_reader.get_valid_data(valid_input_file)
                 first_event = next(events)
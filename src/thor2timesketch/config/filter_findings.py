@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from thor2timesketch.config.field_predicate import FieldPredicate, Predicate
 from thor2timesketch.config.console_config import ConsoleConfig
 from thor2timesketch.config.yaml_config_reader import YamlConfigReader
 from thor2timesketch.constants import YAML_FILTERS
@@ -7,13 +8,28 @@ from pathlib import Path
 
 
 class FilterFindings:
-    def __init__(self, levels: set[str], modules: set[str]) -> None:
+    def __init__(
+        self,
+        levels: set[str],
+        modules: set[str],
+        fields: Optional[Predicate] = None,
+    ) -> None:
         self._levels = {level.lower() for level in levels}
         self._modules = {module.lower() for module in modules}
+        self._fields = fields
         ConsoleConfig.debug(
-            f"Filter initialized with levels={levels}, modules={modules}"
+            f"Filter initialized with levels={levels}, modules={modules}, "
+            f"field conditions={fields is not None}"
         )
 
+    @property
+    def levels(self) -> frozenset[str]:
+        return frozenset(self._levels)
+
+    @property
+    def modules(self) -> frozenset[str]:
+        return frozenset(self._modules)
+
     @classmethod
     def read_filters_yaml(
         cls, config_filter: Optional[Path] = None
@@ -61,15 +77,18 @@ class FilterFindings:
         modules_filtered = modules_include - modules_exclude
         features_filtered = features_include - features_exclude
         modules_final = modules_filtered | features_filtered
+        conditions = filter_section.get("fields") or []
+        fields = FieldPredicate.compile(conditions)
 
-        if not levels and not modules_final:
+        if not levels and not modules_final and fields is None:
             raise FilterConfigError(
-                f"Empty filter config in {config_filter}: at least one filter include (levels or modules) must be provided"
+                f"Empty filter config in {config_filter}: at least one filter include (levels, modules or fields) must be provided"
             )
         ConsoleConfig.info(
-            f"Filter config loaded from {config_filter}: levels={levels}, modules={modules_final}"
+            f"Filter config loaded from {config_filter}: levels={levels}, modules={modules_final}, "
+            f"field conditions={len(conditions)}"
         )
-        return cls(levels, modules_final)
+        return cls(levels, modules_final, fields)
 
     @classmethod
     def null_filter(cls) -> "FilterFindings":
@@ -80,12 +99,32 @@ class FilterFindings:
     ) -> bool:
         norm_level = level.lower() if level is not None else None
         norm_module = module.lower() if module is not None else None
+        if not self._levels and not self._modules:
+            return True
         if self._levels and not self._modules:
             return norm_level in self._levels
         if self._modules and not self._levels:
             return norm_module in self._modules
         return norm_level in self._levels and norm_module in self._modules
 
+    def matches_fields(self, json_log: Dict[str, Any]) -> bool:
+        return self._fields is None or self._fields(json_log)
+
+    def select(
+        self,
+        get_fields: Callable[[Dict[str, Any]], Tuple[Optional[str], Optional[str]]],
+        json_logs: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        if not self._levels and not self._modules and self._fields is None:
+            return json_logs
+        matches = self.matches_filter_criteria
+        matches_fields = self.matches_fields
+        return [
+            json_log
+            for json_log in json_logs
+            if matches(*get_fields(json_log)) and matches_fields(json_log)
+        ]
+
 
 class _NullFilterFindings(FilterFindings):
     def matches_filter_criteria(
@@ -0,0 +1,81 @@
+import re
+from typing import Iterable, Optional, Pattern
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.config.filter_findings import FilterFindings
+from thor2timesketch.constants import DEFAULT_ENCODING, LOG_VERSION
+
+
+class LinePrefilter:
+
+    def __init__(
+        self,
+        selectors: FilterFindings,
+        log_versions: Iterable[str],
+        level_field: str,
+        module_field: str,
+    ) -> None:
+        self.levels = self._encode(selectors.levels)
+        self.modules = self._encode(selectors.modules)
+        self.log_versions = self._encode(log_versions)
+        self._version_token = self._token(LOG_VERSION)
+        self._level_token = self._token(level_field)
+        self._module_token = self._token(module_field)
+        self.skipped = 0
+
+    @classmethod
+    def compile(
+        cls,
+        selectors: FilterFindings,
+        log_versions: Iterable[str],
+        level_field: str,
+        module_field: str,
+    ) -> Optional["LinePrefilter"]:
+        if not (selectors.levels or selectors.modules):
+            return None
+        prefilter = cls(selectors, log_versions, level_field, module_field)
+        ConsoleConfig.debug(
+            f"Prefiltering raw lines of log versions {sorted(log_versions)}"
+        )
+        return prefilter
+
+    def accepts(self, line: bytes) -> bool:
+        if self._mismatches(line) and self._is_object(line):
+            self.skipped += 1
+            return False
+        return True
+
+    def _mismatches(self, line: bytes) -> bool:
+        log_version = self._unique_value(self._version_token, line)
+        if log_version is None or log_version not in self.log_versions:
+            return False
+        if self.levels:
+            level = self._unique_value(self._level_token, line)
+            if level is not None and level not in self.levels:
+                return True
+        if self.modules:
+            module = self._unique_value(self._module_token, line)
+            if module is not None and module not in self.modules:
+                return True
+        return False
+
+    @staticmethod
+    def _is_object(line: bytes) -> bool:
+        stripped = line.strip()
+        return stripped[:1] == b"{" and stripped[-1:] == b"}"
+
+    @staticmethod
+    def _unique_value(token: Pattern[bytes], line: bytes) -> Optional[bytes]:
+        values = token.findall(line)
+        if len(values) != 1 or not values[0].isascii():
+            return None
+        value: bytes = values[0].lower()
+        return value
+
+    @staticmethod
+    def _token(field: str) -> Pattern[bytes]:
+        name = re.escape(field.encode(DEFAULT_ENCODING))
+        return re.compile(rb'"' + name + rb'"\s*:\s*"([^"\\]*)"')
+
+    @staticmethod
+    def _encode(values: Iterable[str]) -> frozenset[bytes]:
+        return frozenset(value.lower().encode(DEFAULT_ENCODING) for value in values)
@@ -6,7 +6,6 @@ from thor2timesketch.constants import (
 from thor2timesketch.exceptions import FilterConfigError, FileValidationError
 from thor2timesketch.input.file_validator import FileValidator
 from typing import Dict, Any
-import yaml
 from pathlib import Path
 
 
@@ -14,6 +13,8 @@ class YamlConfigReader:
 
     @staticmethod
     def load_yaml(config_path: Path) -> Dict[str, Any]:
+        import yaml
+
         try:
             validator = FileValidator(valid_extensions=VALID_YAML_EXTENSIONS)
             yaml_file = validator.validate_file(config_path)
@@ -11,6 +11,7 @@ OUTPUT_FILE_EXTENSION = ".jsonl"
 TS_SCOPE = ["user", "shared"]
 MAX_WRITE_ERRORS = 5
 PREFIX = "TF"
+FINDING_ID_SIZE = 16
 THOR_TAG = "thor"
 EXTRA_TAG = "ts_extra"
 DELIMITER = "_"
@@ -20,7 +21,44 @@ AUDIT_INFO = "info"
 AUDIT_INFO_TAG = "audit_info"
 AUDIT_FINDING = "findings"
 AUDIT_FINDING_TAG = "audit_finding"
+MAPPER_ENTRY_POINT_GROUP = "thor2timesketch.mappers"
 DEFAULT_FILTERS_YAML = "default_filter.yaml"
 OUTPUT_YAML_FILE = "thor_filter.yaml"
 YAML_FILTERS = "filters"
 DEFAULT_LEVELS = ["Alert", "Warning", "Notice", "Info"]
+WORKER_CHUNK_SIZE = 8 * MB_CONVERTER
+MAX_PENDING_CHUNKS_PER_WORKER = 2
+JSON_BACKENDS = ["auto", "orjson", "msgspec", "json"]
+AUTO_JSON_BACKENDS = ["orjson", "msgspec", "json"]
+DEFAULT_JSON_BACKEND = "auto"
+READ_BLOCK_SIZE = 4 * MB_CONVERTER
+PIPELINE_BATCH_SIZE = 1_000
+FOLLOW_POLL_INTERVAL = 1.0
+FOLLOW_FLUSH_INTERVAL = 5.0
+RECEIVER_PROTOCOLS = ["tcp", "udp", "http"]
+RECEIVER_READ_SIZE = 64 * 1024
+RECEIVER_QUEUE_CHUNKS = 64
+RECEIVER_MAX_SOURCES = 256
+RECEIVER_MAX_MESSAGE = 16 * MB_CONVERTER
+RECEIVER_RETRY_DELAY = 0.01
+TEE_BATCH_SIZE = 1_000
+TEE_QUEUE_BATCHES = 8
+INGEST_BATCH_SIZE = 1_000
+DEFAULT_INGEST_QUEUE_SIZE = 10_000
+DEFAULT_UPLOADERS = 1
+COMPRESSED_EXTENSIONS = [".gz", ".bz2", ".xz", ".zst"]
+GLOB_CHARACTERS = "*?["
+DECOMPRESS_QUEUE_BLOCKS = 4
+OUTPUT_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+OUTPUT_GZIP_LEVEL = 6
+OUTPUT_ZSTD_LEVEL = 3
+OUTPUT_BUFFER_SIZE = 4 * MB_CONVERTER
+OUTPUT_QUEUE_BLOCKS = 4
+TIMESTAMP_CACHE_SIZE = 65_536
+TIMESTAMP_INDEX_SIZE = 1_024
+FLATTEN_PLAN_CACHE_SIZE = 4_096
+CHECKPOINT_SUFFIX = ".thor2ts-checkpoint"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_PRUNE_SIZE = 65_536
+DEFAULT_TS_BUFFER_SIZE = 50_000
+PROGRESS_REFRESH_PER_SECOND = 4
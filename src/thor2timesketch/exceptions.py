@@ -41,6 +41,10 @@ class JsonParseError(InputError):
     pass
 
 
+class DecompressionError(InputError):
+    pass
+
+
 # processing errors
 class ProcessingError(Thor2tsError):
     pass
@@ -67,5 +71,13 @@ class OutputError(Thor2tsError):
     pass
 
 
+class CheckpointError(OutputError):
+    pass
+
+
 class TimesketchError(Thor2tsError):
     pass
+
+
+class JsonCodecError(Thor2tsError):
+    pass
@@ -0,0 +1,32 @@
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from thor2timesketch.constants import WORKER_CHUNK_SIZE
+from thor2timesketch.exceptions import InputError
+
+
+class FileChunk(NamedTuple):
+    start: int
+    end: int
+
+
+class FileChunker:
+
+    def __init__(self, chunk_size: int = WORKER_CHUNK_SIZE) -> None:
+        if chunk_size <= 0:
+            raise InputError(f"Invalid chunk size: {chunk_size}")
+        self.chunk_size = chunk_size
+
+    def split(self, input_file: Path, start: int = 0) -> Iterator[FileChunk]:
+        try:
+            file_size = input_file.stat().st_size
+            with input_file.open("rb") as file:
+                while start < file_size:
+                    file.seek(min(start + self.chunk_size, file_size))
+                    file.readline()
+                    end = file.tell()
+                    yield FileChunk(start=start, end=end)
+                    start = end
+        except OSError as error:
+            raise InputError(
+                f"Error splitting file '{input_file}' into chunks: {error}"
+            ) from error
@@ -0,0 +1,124 @@
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import FOLLOW_POLL_INTERVAL, READ_BLOCK_SIZE
+from thor2timesketch.input.line_reader import RawLine
+
+
+class FileFollower:
+
+    def __init__(
+        self,
+        poll_interval: float = FOLLOW_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        block_size: int = READ_BLOCK_SIZE,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.block_size = block_size
+        self.position = 0
+        self.line_num = 1
+        self.pending = b""
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def follow(
+        self, input_file: Path, start: int = 0, first_line: int = 1
+    ) -> Iterator[Optional[RawLine]]:
+        file = input_file.open("rb")
+        restore = self._stop_on_interrupt()
+        try:
+            file.seek(start)
+            self._reset(start, first_line)
+            last_data = time.monotonic()
+            while not self._stopped.is_set():
+                block = file.read(self.block_size)
+                if block:
+                    last_data = time.monotonic()
+                    yield from self._split(block)
+                    continue
+                yield None
+                if self._replaced(input_file, file):
+                    yield from self._split(file.read())
+                    yield from self._rest()
+                    file.close()
+                    file = input_file.open("rb")
+                    self._reset(0, 1)
+                    ConsoleConfig.info(
+                        f"Input file '{input_file}' was rotated, following the new file"
+                    )
+                    continue
+                if os.fstat(file.fileno()).st_size < file.tell():
+                    ConsoleConfig.warning(
+                        f"Input file '{input_file}' was truncated, following it from the start"
+                    )
+                    file.seek(0)
+                    self._reset(0, 1)
+                    continue
+                if self.timeout is not None and (
+                    time.monotonic() - last_data >= self.timeout
+                ):
+                    ConsoleConfig.info(
+                        f"No new lines in '{input_file}' for {self.timeout:g} seconds"
+                    )
+                    break
+                self._stopped.wait(self.poll_interval)
+            if self._stopped.is_set():
+                ConsoleConfig.info(f"Stopped following '{input_file}'")
+            yield from self._rest()
+        finally:
+            restore()
+            file.close()
+
+    def _stop_on_interrupt(self) -> Callable[[], None]:
+        if threading.current_thread() is not threading.main_thread():
+            return lambda: None
+        previous: Any = signal.getsignal(signal.SIGINT)
+        if previous is None:
+            previous = signal.default_int_handler
+
+        def interrupt(signum: int, frame: Optional[FrameType]) -> None:
+            restore()
+            self.stop()
+
+        def restore() -> None:
+            signal.signal(signal.SIGINT, previous)
+
+        signal.signal(signal.SIGINT, interrupt)
+        return restore
+
+    def _reset(self, position: int, line_num: int) -> None:
+        self.position = position
+        self.line_num = line_num
+        self.pending = b""
+
+    def _split(self, block: bytes) -> Iterator[RawLine]:
+        lines = (self.pending + block).split(b"\n")
+        self.pending = lines.pop()
+        for line in lines:
+            line_end = self.position + len(line) + 1
+            yield RawLine(self.line_num, self.position, line_end, line)
+            self.position = line_end
+            self.line_num += 1
+
+    def _rest(self) -> Iterator[RawLine]:
+        if self.pending:
+            line_end = self.position + len(self.pending)
+            yield RawLine(self.line_num, self.position, line_end, self.pending)
+            self._reset(line_end, self.line_num + 1)
+
+    @staticmethod
+    def _replaced(input_file: Path, file: BinaryIO) -> bool:
+        try:
+            current = input_file.stat()
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(file.fileno())
+        return (current.st_ino, current.st_dev) != (opened.st_ino, opened.st_dev)
@@ -11,17 +11,28 @@ from thor2timesketch.exceptions import (
 
 
 class FileValidator:
-    def __init__(self, valid_extensions: Sequence[str]) -> None:
+    def __init__(
+        self,
+        valid_extensions: Sequence[str],
+        compressed_extensions: Sequence[str] = (),
+    ) -> None:
         self.valid_extensions = {ext.lower() for ext in valid_extensions}
+        self.compressed_extensions = {ext.lower() for ext in compressed_extensions}
 
-    def validate_file(self, file_path: Union[str, Path]) -> Path:
+    def validate_file(
+        self, file_path: Union[str, Path], allow_empty: bool = False
+    ) -> Path:
         file_path = Path(file_path)
         self._check_file_exists(file_path)
         self._check_file_readable(file_path)
-        self._check_file_not_empty(file_path)
+        if not allow_empty:
+            self._check_file_not_empty(file_path)
         self._check_file_extension(file_path)
         return file_path
 
+    def has_valid_extension(self, file_path: Path) -> bool:
+        return self._data_extension(file_path) in self.valid_extensions
+
     def _check_file_exists(self, file_path: Path) -> None:
         if not file_path.is_file():
             raise FileNotFound(f"File '{file_path}' does not exist.")
@@ -43,7 +54,7 @@ class FileValidator:
         ConsoleConfig.debug(f"File '{file_path}' is not empty.")
 
     def _check_file_extension(self, file_path: Path) -> None:
-        ext = file_path.suffix.lower()
+        ext = self._data_extension(file_path)
         if ext not in self.valid_extensions:
             expected = ", ".join(self.valid_extensions)
             error_msg = (
@@ -52,3 +63,9 @@ class FileValidator:
             )
             raise InvalidFileExtensionError(error_msg)
         ConsoleConfig.debug(f"File '{file_path}' has a valid extension: '{ext}'")
+
+    def _data_extension(self, file_path: Path) -> str:
+        suffixes = [suffix.lower() for suffix in file_path.suffixes]
+        if len(suffixes) > 1 and suffixes[-1] in self.compressed_extensions:
+            return suffixes[-2]
+        return file_path.suffix.lower()
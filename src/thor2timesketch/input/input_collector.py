@@ -0,0 +1,78 @@
+import glob
+import os
+from collections import Counter
+from pathlib import Path
+from typing import List
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import (
+    COMPRESSED_EXTENSIONS,
+    GLOB_CHARACTERS,
+    OUTPUT_FILE_EXTENSION,
+    VALID_JSON_EXTENSIONS,
+)
+from thor2timesketch.exceptions import InputError
+from thor2timesketch.input.file_validator import FileValidator
+
+
+class InputCollector:
+
+    def __init__(self) -> None:
+        self.file_validator = FileValidator(
+            valid_extensions=VALID_JSON_EXTENSIONS,
+            compressed_extensions=COMPRESSED_EXTENSIONS,
+        )
+
+    @staticmethod
+    def is_batch(input_path: Path) -> bool:
+        if input_path.is_file():
+            return False
+        return input_path.is_dir() or any(
+            character in str(input_path) for character in GLOB_CHARACTERS
+        )
+
+    def collect(self, input_path: Path) -> List[Path]:
+        if input_path.is_dir():
+            candidates = [path for path in input_path.rglob("*") if path.is_file()]
+        else:
+            candidates = [
+                Path(name)
+                for name in glob.glob(str(input_path), recursive=True)
+                if os.path.isfile(name)
+            ]
+        input_files = sorted(
+            path for path in candidates if self.file_validator.has_valid_extension(path)
+        )
+        if not input_files:
+            raise InputError(f"No THOR log files found in '{input_path}'")
+        ConsoleConfig.info(
+            f"Found '{len(input_files)}' THOR log files in '{input_path}'"
+        )
+        return input_files
+
+    @staticmethod
+    def output_files(input_files: List[Path], output_dir: Path) -> List[Path]:
+        base = Path(os.path.commonpath([path.parent for path in input_files]))
+        output_files = []
+        for input_file in input_files:
+            name = Path(input_file.name)
+            if name.suffix.lower() in COMPRESSED_EXTENSIONS:
+                name = name.with_suffix("")
+            relative = input_file.parent.relative_to(base)
+            output_files.append(
+                output_dir / relative / name.with_suffix(OUTPUT_FILE_EXTENSION)
+            )
+        counts = Counter(output_files)
+        output_files = [
+            (
+                output_file
+                if counts[output_file] == 1
+                else output_file.with_name(input_file.name + OUTPUT_FILE_EXTENSION)
+            )
+            for input_file, output_file in zip(input_files, output_files)
+        ]
+        if len(set(output_files)) < len(output_files):
+            raise InputError(
+                "Several input files map to the same output file, "
+                "convert them into separate output directories"
+            )
+        return output_files
@@ -1,4 +1,5 @@
-from typing import Iterator, Dict, Any, Union
+import itertools
+from typing import Callable, Iterator, Dict, Any, List, Optional, Union
 from thor2timesketch.exceptions import (
     JsonValidationError,
     InputError,
@@ -7,42 +8,137 @@ from thor2timesketch.exceptions import (
 )
 from thor2timesketch.input.file_validator import FileValidator
 from thor2timesketch.input.json_validator import JsonValidator
+from thor2timesketch.input.file_follower import FileFollower
+from thor2timesketch.input.line_reader import LineReader, RawLine
 from thor2timesketch.config.console_config import ConsoleConfig
-from thor2timesketch.constants import VALID_JSON_EXTENSIONS, DEFAULT_ENCODING
+from thor2timesketch.constants import (
+    COMPRESSED_EXTENSIONS,
+    PIPELINE_BATCH_SIZE,
+    VALID_JSON_EXTENSIONS,
+)
 from pathlib import Path
 
 
 class JsonReader:
 
     def __init__(self) -> None:
-        self.file_validator = FileValidator(valid_extensions=VALID_JSON_EXTENSIONS)
+        self.file_validator = FileValidator(
+            valid_extensions=VALID_JSON_EXTENSIONS,
+            compressed_extensions=COMPRESSED_EXTENSIONS,
+        )
         self.json_validator = JsonValidator()
+        self.line_reader = LineReader()
 
-    def _validate_file(self, input_file: Union[str, Path]) -> Path:
-        valid_file: Path = self.file_validator.validate_file(input_file)
+    def _validate_file(
+        self, input_file: Union[str, Path], allow_empty: bool = False
+    ) -> Path:
+        valid_file: Path = self.file_validator.validate_file(input_file, allow_empty)
         return valid_file
 
-    def get_valid_data(self, input_file: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    def validate_input(
+        self, input_file: Union[str, Path], allow_empty: bool = False
+    ) -> Path:
         try:
-            valid_file = self._validate_file(input_file)
+            valid_file = self._validate_file(input_file, allow_empty)
             ConsoleConfig.info("File is valid and ready for processing.")
         except FileValidationError as e:
             raise InputError(f"File validation error: {e}") from e
-        return self._generate_valid_json(valid_file)
+        return valid_file
+
+    def get_valid_data(self, input_file: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        valid_file = self.validate_input(input_file)
+        return self.read_valid_data(valid_file)
+
+    def read_valid_data(
+        self,
+        valid_file: Path,
+        start: int = 0,
+        first_line: int = 1,
+        mark: Optional[Callable[[int, int], None]] = None,
+        prefilter: Optional[Callable[[bytes], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        return itertools.chain.from_iterable(
+            self.read_valid_batches(valid_file, start, first_line, mark, prefilter)
+        )
+
+    def read_valid_batches(
+        self,
+        valid_file: Path,
+        start: int = 0,
+        first_line: int = 1,
+        mark: Optional[Callable[[int, int], None]] = None,
+        prefilter: Optional[Callable[[bytes], bool]] = None,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        lines = self.line_reader.read_lines(valid_file, start, first_line=first_line)
+        return self._valid_batches(valid_file, lines, mark, prefilter, batch_size)
+
+    def follow_valid_batches(
+        self,
+        valid_file: Path,
+        follower: FileFollower,
+        prefilter: Optional[Callable[[bytes], bool]] = None,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        lines = follower.follow(valid_file)
+        return self._valid_batches(valid_file, lines, None, prefilter, batch_size)
+
+    def receive_valid_batches(
+        self,
+        source: str,
+        lines: Iterator[Optional[RawLine]],
+        prefilter: Optional[Callable[[bytes], bool]] = None,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        return self._valid_batches(
+            source, lines, None, prefilter, batch_size, strict=False
+        )
 
-    def _generate_valid_json(self, valid_file: Path) -> Iterator[Dict[str, Any]]:
+    def _valid_batches(
+        self,
+        valid_file: Union[str, Path],
+        lines: Iterator[Optional[RawLine]],
+        mark: Optional[Callable[[int, int], None]],
+        prefilter: Optional[Callable[[bytes], bool]],
+        batch_size: int,
+        strict: bool = True,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        validate = self.json_validator.validate_json_log
+        batch: List[Dict[str, Any]] = []
         try:
-            with valid_file.open("r", encoding=DEFAULT_ENCODING) as file:
-                for line_num, line in enumerate(file, start=1):
-                    try:
-                        json_data = self.json_validator.validate_json_log(line)
-                        if json_data is not None:
-                            yield json_data
-                    except (JsonParseError, JsonValidationError) as error:
-                        raise InputError(
-                            f"Error parsing JSON at line {line_num}: {error}"
+            for line in lines:
+                if line is None:
+                    if batch:
+                        yield batch
+                        batch = []
+                    continue
+                if prefilter is not None and not prefilter(line.data):
+                    continue
+                try:
+                    json_data = validate(line.data)
+                except (JsonParseError, JsonValidationError) as error:
+                    if not strict:
+                        ConsoleConfig.warning(
+                            f"Skipped invalid JSON message {line.line_num} "
+                            f"from '{valid_file}': {error}"
                         )
+                        continue
+                    if batch:
+                        yield batch
+                    raise InputError(
+                        f"Error parsing JSON at line {line.line_num}: {error}"
+                    )
+                if json_data is None:
+                    continue
+                if not batch and mark is not None:
+                    mark(line.start, line.line_num)
+                batch.append(json_data)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
         except IOError as error:
             raise InputError(
                 f"Error opening or reading file '{valid_file}': {error}"
             ) from error
+        if batch:
+            yield batch
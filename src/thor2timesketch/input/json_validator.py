@@ -1,21 +1,21 @@
-import json
 from typing import Dict, Any, Optional
 from thor2timesketch.exceptions import JsonValidationError, JsonParseError
+from thor2timesketch.utils.json_codec import JsonCodec, JsonInput
 
 
 class JsonValidator:
 
-    def validate_json_log(self, json_log: str) -> Optional[Dict[str, Any]]:
+    def validate_json_log(self, json_log: JsonInput) -> Optional[Dict[str, Any]]:
         if not json_log.strip():
             return None
         json_obj = self._parse_json_log(json_log)
         valid_json = self._validate_json_log(json_obj)
         return valid_json
 
-    def _parse_json_log(self, json_log: str) -> Dict[str, Any]:
+    def _parse_json_log(self, json_log: JsonInput) -> Dict[str, Any]:
         try:
-            result: Dict[str, Any] = json.loads(json_log)
-        except json.JSONDecodeError as e:
+            result: Dict[str, Any] = JsonCodec.loads(json_log)
+        except ValueError as e:
             raise JsonParseError(f"JSON decode error: {e}")
         return result
 
@@ -0,0 +1,118 @@
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import READ_BLOCK_SIZE
+from thor2timesketch.input.stream_decompressor import StreamDecompressor
+from thor2timesketch.utils.progress_bar import ProgressBar
+
+
+class RawLine(NamedTuple):
+    line_num: int
+    start: int
+    end: int
+    data: bytes
+
+
+class LineReader:
+
+    def __init__(self, use_mmap: bool = True, block_size: int = READ_BLOCK_SIZE):
+        self.use_mmap = use_mmap
+        self.block_size = block_size
+        self.decompressor = StreamDecompressor(block_size)
+
+    def read_lines(
+        self,
+        input_file: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        first_line: int = 1,
+    ) -> Iterator[RawLine]:
+        compression = StreamDecompressor.detect(input_file)
+        if compression is not None:
+            blocks = self.decompressor.read_blocks(input_file, compression)
+            yield from self._split_blocks(
+                self._slice_blocks(blocks, start, end), start, first_line
+            )
+            return
+        with input_file.open("rb") as file:
+            mapped = self._map_file(file) if self.use_mmap else None
+            if mapped is None:
+                yield from self._split_blocks(
+                    self._file_blocks(file, start, end), start, first_line
+                )
+                return
+            with mapped:
+                yield from self._read_mapped(mapped, start, end, first_line)
+
+    def _map_file(self, file: BinaryIO) -> Optional[mmap.mmap]:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            ConsoleConfig.debug(f"Memory mapping not available, reading blocks: {e}")
+            return None
+
+    def _read_mapped(
+        self, mapped: mmap.mmap, start: int, end: Optional[int], line_num: int
+    ) -> Iterator[RawLine]:
+        stop = len(mapped) if end is None else min(end, len(mapped))
+        find = mapped.find
+        position = start
+        while position < stop:
+            newline = find(b"\n", position, stop)
+            if newline == -1:
+                yield RawLine(line_num, position, stop, mapped[position:stop])
+                return
+            ProgressBar.input_offset = newline + 1
+            yield RawLine(line_num, position, newline + 1, mapped[position:newline])
+            position = newline + 1
+            line_num += 1
+
+    def _file_blocks(
+        self, file: BinaryIO, start: int, end: Optional[int]
+    ) -> Iterator[bytes]:
+        file.seek(start)
+        remaining = end - start if end is not None else None
+        while remaining is None or remaining > 0:
+            size = (
+                self.block_size
+                if remaining is None
+                else min(self.block_size, remaining)
+            )
+            block = file.read(size)
+            if not block:
+                return
+            ProgressBar.input_offset = file.tell()
+            if remaining is not None:
+                remaining -= len(block)
+            yield block
+
+    def _slice_blocks(
+        self, blocks: Iterator[bytes], start: int, end: Optional[int]
+    ) -> Iterator[bytes]:
+        offset = 0
+        for block in blocks:
+            block_end = offset + len(block)
+            if block_end > start:
+                low = max(start - offset, 0)
+                high = len(block) if end is None else min(end - offset, len(block))
+                if high > low:
+                    yield block[low:high]
+            offset = block_end
+            if end is not None and offset >= end:
+                return
+
+    def _split_blocks(
+        self, blocks: Iterator[bytes], position: int, line_num: int
+    ) -> Iterator[RawLine]:
+        pending = b""
+        for block in blocks:
+            lines = (pending + block).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                line_end = position + len(line) + 1
+                yield RawLine(line_num, position, line_end, line)
+                position = line_end
+                line_num += 1
+        if pending:
+            yield RawLine(line_num, position, position + len(pending), pending)
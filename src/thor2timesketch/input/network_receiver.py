@@ -0,0 +1,357 @@
+import asyncio
+import re
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import (
+    FOLLOW_POLL_INTERVAL,
+    RECEIVER_MAX_MESSAGE,
+    RECEIVER_MAX_SOURCES,
+    RECEIVER_PROTOCOLS,
+    RECEIVER_QUEUE_CHUNKS,
+    RECEIVER_READ_SIZE,
+    RECEIVER_RETRY_DELAY,
+)
+from thor2timesketch.exceptions import InputError
+from thor2timesketch.input.line_reader import RawLine
+
+_DIGITS = frozenset(b"0123456789")
+_SOURCE_NAME = re.compile(r"[^\w.-]")
+_HTTP_ACCEPTED = "202 Accepted"
+
+
+def _payload(message: bytes) -> bytes:
+    if message[:1] == b"{":
+        return message
+    start = message.find(b"{")
+    return message[start:] if start != -1 else message
+
+
+class ListenAddress(NamedTuple):
+    protocol: str
+    host: str
+    port: int
+
+    @classmethod
+    def parse(cls, value: str) -> "ListenAddress":
+        protocol, separator, address = value.partition("://")
+        host, _, port = address.rpartition(":")
+        protocol = protocol.lower()
+        if (
+            not separator
+            or protocol not in RECEIVER_PROTOCOLS
+            or not port.isdigit()
+            or int(port) > 65535
+        ):
+            raise InputError(
+                f"Invalid listen address '{value}', expected "
+                f"{'|'.join(RECEIVER_PROTOCOLS)}://[HOST]:PORT"
+            )
+        return cls(protocol, host.strip("[]") or "0.0.0.0", int(port))
+
+    def __str__(self) -> str:
+        return f"{self.protocol}://{self.host}:{self.port}"
+
+
+class SyslogFramer:
+
+    def __init__(self, max_message: int = RECEIVER_MAX_MESSAGE) -> None:
+        self.max_message = max_message
+        self.pending = b""
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buffer = self.pending + data if self.pending else data
+        size = len(buffer)
+        position = 0
+        messages: List[bytes] = []
+        while position < size:
+            if buffer[position] in _DIGITS:
+                space = buffer.find(b" ", position, position + 11)
+                if space != -1 and buffer[position:space].isdigit():
+                    end = space + 1 + int(buffer[position:space])
+                    if end > size:
+                        break
+                    messages.append(buffer[space + 1 : end])
+                    position = end
+                    continue
+                if space == -1 and buffer[position:].isdigit():
+                    break
+            newline = buffer.find(b"\n", position)
+            if newline == -1:
+                break
+            messages.append(buffer[position:newline])
+            position = newline + 1
+        self.pending = buffer[position:]
+        if len(self.pending) > self.max_message:
+            self.pending = b""
+            raise InputError(
+                f"Message exceeds the maximum size of {self.max_message} bytes"
+            )
+        return messages
+
+    def flush(self) -> List[bytes]:
+        messages = [self.pending] if self.pending else []
+        self.pending = b""
+        return messages
+
+
+class ReceivedSource:
+
+    def __init__(
+        self,
+        name: str,
+        queue_chunks: int = RECEIVER_QUEUE_CHUNKS,
+        poll_interval: float = FOLLOW_POLL_INTERVAL,
+    ) -> None:
+        self.name = name
+        self.poll_interval = poll_interval
+        self.chunks: "Queue[Optional[List[bytes]]]" = Queue(maxsize=queue_chunks)
+        self.messages = 0
+        self.dropped = 0
+        self.failed = False
+
+    async def put(self, messages: List[bytes]) -> None:
+        while messages and not self.failed:
+            try:
+                self.chunks.put_nowait(messages)
+                return
+            except Full:
+                await asyncio.sleep(RECEIVER_RETRY_DELAY)
+
+    def offer(self, messages: List[bytes]) -> None:
+        if self.failed:
+            return
+        try:
+            self.chunks.put_nowait(messages)
+        except Full:
+            self.dropped += len(messages)
+
+    def close(self) -> None:
+        if self.dropped:
+            ConsoleConfig.warning(
+                f"Dropped '{self.dropped}' datagrams from '{self.name}' "
+                f"while its queue was full"
+            )
+        while not self.failed:
+            try:
+                self.chunks.put(None, timeout=self.poll_interval)
+                return
+            except Full:
+                continue
+
+    def lines(self) -> Iterator[Optional[RawLine]]:
+        position = 0
+        while True:
+            try:
+                chunk = self.chunks.get(timeout=self.poll_interval)
+            except Empty:
+                yield None
+                continue
+            if chunk is None:
+                return
+            for message in chunk:
+                self.messages += 1
+                end = position + len(message) + 1
+                yield RawLine(self.messages, position, end, _payload(message))
+                position = end
+            if self.chunks.empty():
+                yield None
+
+
+class _DatagramReceiver(asyncio.DatagramProtocol):
+
+    def __init__(self, receiver: "NetworkReceiver") -> None:
+        self.receiver = receiver
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        source = self.receiver.source(addr)
+        if source is not None:
+            source.offer(data.split(b"\n"))
+
+
+class NetworkReceiver:
+
+    def __init__(
+        self,
+        addresses: List[ListenAddress],
+        on_source: Callable[[ReceivedSource], None],
+        max_sources: int = RECEIVER_MAX_SOURCES,
+        queue_chunks: int = RECEIVER_QUEUE_CHUNKS,
+    ) -> None:
+        self.addresses = addresses
+        self.on_source = on_source
+        self.max_sources = max_sources
+        self.queue_chunks = queue_chunks
+        self.sources: Dict[str, ReceivedSource] = {}
+        self.bound: List[ListenAddress] = []
+        self.ready = threading.Event()
+        self.stopped = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._rejected: Set[str] = set()
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            ConsoleConfig.info("Stopped receiving events")
+        finally:
+            self.ready.set()
+            for source in self.sources.values():
+                source.close()
+
+    def stop(self) -> None:
+        self.stopped = True
+        if self._loop is None or self._stop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        except RuntimeError:
+            pass
+
+    def source(self, peer: Any) -> Optional[ReceivedSource]:
+        host = str(peer[0]) if isinstance(peer, tuple) and peer else "unknown"
+        name = _SOURCE_NAME.sub("_", host)
+        source = self.sources.get(name)
+        if source is not None:
+            return source
+        if len(self.sources) >= self.max_sources:
+            if name not in self._rejected:
+                self._rejected.add(name)
+                ConsoleConfig.warning(
+                    f"Ignoring events from '{name}', already receiving from "
+                    f"'{self.max_sources}' sources"
+                )
+            return None
+        source = ReceivedSource(name, self.queue_chunks)
+        self.sources[name] = source
+        ConsoleConfig.info(f"Receiving events from new source '{name}'")
+        self.on_source(source)
+        return source
+
+    async def _serve(self) -> None:
+        self._stop = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        closers: List[Callable[[], None]] = []
+        try:
+            for address in self.addresses:
+                closers.append(await self._listen(address))
+            self.ready.set()
+            if not self.stopped:
+                await self._stop.wait()
+        finally:
+            for close in closers:
+                close()
+
+    async def _listen(self, address: ListenAddress) -> Callable[[], None]:
+        close: Callable[[], None]
+        try:
+            if address.protocol == "udp":
+                (
+                    transport,
+                    _,
+                ) = await asyncio.get_running_loop().create_datagram_endpoint(
+                    lambda: _DatagramReceiver(self),
+                    local_addr=(address.host, address.port),
+                )
+                sockname = transport.get_extra_info("sockname")
+                close = transport.close
+            else:
+                handler = (
+                    self._receive_stream
+                    if address.protocol == "tcp"
+                    else self._receive_http
+                )
+                server = await asyncio.start_server(handler, address.host, address.port)
+                sockname = server.sockets[0].getsockname()
+                close = server.close
+        except OSError as e:
+            raise InputError(f"Cannot listen on {address}: {e}") from e
+        bound = address._replace(port=sockname[1])
+        self.bound.append(bound)
+        ConsoleConfig.info(f"Receiving THOR events on {bound}")
+        return close
+
+    async def _receive_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        source = self.source(writer.get_extra_info("peername"))
+        if source is None:
+            writer.close()
+            return
+        framer = SyslogFramer()
+        try:
+            while True:
+                data = await reader.read(RECEIVER_READ_SIZE)
+                if not data:
+                    await source.put(framer.flush())
+                    break
+                await source.put(framer.feed(data))
+        except InputError as e:
+            ConsoleConfig.warning(f"Closing connection from '{source.name}': {e}")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _receive_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        source = self.source(writer.get_extra_info("peername"))
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                status, length, keep_alive = self._parse_request(head)
+                if source is None:
+                    status, keep_alive = "503 Service Unavailable", False
+                elif status == _HTTP_ACCEPTED:
+                    try:
+                        await self._receive_body(reader, source, length)
+                    except InputError:
+                        status, keep_alive = "413 Payload Too Large", False
+                connection = "" if keep_alive else "Connection: close\r\n"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Length: 0\r\n{connection}\r\n".encode()
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_request(head: bytes) -> Tuple[str, int, bool]:
+        request, *lines = head.decode("latin-1").split("\r\n")
+        method, _, target = request.partition(" ")
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+        if method != "POST":
+            return "405 Method Not Allowed", 0, False
+        length = headers.get("content-length", "")
+        if not length.isdigit():
+            return "411 Length Required", 0, False
+        keep_alive = (
+            target.endswith("HTTP/1.1") and headers.get("connection") != "close"
+        )
+        return _HTTP_ACCEPTED, int(length), keep_alive
+
+    @staticmethod
+    async def _receive_body(
+        reader: asyncio.StreamReader, source: ReceivedSource, length: int
+    ) -> None:
+        framer = SyslogFramer()
+        while length > 0:
+            data = await reader.read(min(length, RECEIVER_READ_SIZE))
+            if not data:
+                raise ConnectionResetError("Connection closed before the request body")
+            length -= len(data)
+            await source.put(framer.feed(data))
+        await source.put(framer.flush())
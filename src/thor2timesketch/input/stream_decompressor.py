@@ -0,0 +1,127 @@
+import bz2
+import gzip
+import importlib
+import io
+import lzma
+import threading
+from pathlib import Path
+from queue import Full, Queue
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import DECOMPRESS_QUEUE_BLOCKS, READ_BLOCK_SIZE
+from thor2timesketch.exceptions import DecompressionError, Thor2tsError
+from thor2timesketch.utils.progress_bar import ProgressBar
+
+
+class _EndOfStream:
+    pass
+
+
+class _DecompressFailure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class StreamDecompressor:
+    MAGIC_BYTES: Dict[str, bytes] = {
+        "gzip": b"\x1f\x8b",
+        "bz2": b"BZh",
+        "xz": b"\xfd7zXZ\x00",
+        "zstd": b"\x28\xb5\x2f\xfd",
+    }
+    HEADER_SIZE = max(len(magic) for magic in MAGIC_BYTES.values())
+
+    def __init__(
+        self,
+        block_size: int = READ_BLOCK_SIZE,
+        queue_blocks: int = DECOMPRESS_QUEUE_BLOCKS,
+    ) -> None:
+        self.block_size = block_size
+        self.queue_blocks = queue_blocks
+
+    @classmethod
+    def detect(cls, input_file: Path) -> Optional[str]:
+        with input_file.open("rb") as file:
+            header = file.read(cls.HEADER_SIZE)
+        for compression, magic in cls.MAGIC_BYTES.items():
+            if header.startswith(magic):
+                return compression
+        return None
+
+    def read_blocks(self, input_file: Path, compression: str) -> Iterator[bytes]:
+        blocks: "Queue[Any]" = Queue(maxsize=self.queue_blocks)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._decompress,
+            args=(input_file, compression, blocks, stop),
+            name="thor2ts-decompress",
+            daemon=True,
+        )
+        ConsoleConfig.debug(f"Reading {compression} compressed input '{input_file}'")
+        thread.start()
+        try:
+            while True:
+                item = blocks.get()
+                if isinstance(item, _EndOfStream):
+                    return
+                if isinstance(item, _DecompressFailure):
+                    if isinstance(item.error, Thor2tsError):
+                        raise item.error
+                    raise DecompressionError(
+                        f"Error decompressing '{input_file}': {item.error}"
+                    ) from item.error
+                block, ProgressBar.input_offset = item
+                yield block
+        finally:
+            stop.set()
+            thread.join()
+
+    def _decompress(
+        self,
+        input_file: Path,
+        compression: str,
+        blocks: "Queue[Any]",
+        stop: threading.Event,
+    ) -> None:
+        try:
+            with input_file.open("rb") as raw, self._open(raw, compression) as stream:
+                while not stop.is_set():
+                    block = stream.read(self.block_size)
+                    if not block:
+                        break
+                    self._put(blocks, (block, raw.tell()), stop)
+        except Exception as e:
+            self._put(blocks, _DecompressFailure(e), stop)
+            return
+        self._put(blocks, _EndOfStream(), stop)
+
+    def _put(self, blocks: "Queue[Any]", item: Any, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _open(self, raw: BinaryIO, compression: str) -> io.BufferedIOBase:
+        if compression == "gzip":
+            return gzip.GzipFile(fileobj=raw, mode="rb")
+        if compression == "bz2":
+            return bz2.BZ2File(raw, "rb")
+        if compression == "xz":
+            return lzma.LZMAFile(raw, "rb")
+        if compression == "zstd":
+            return self._open_zstd(raw)
+        raise DecompressionError(f"Unsupported compression '{compression}'")
+
+    def _open_zstd(self, raw: BinaryIO) -> io.BufferedIOBase:
+        try:
+            zstandard: Any = importlib.import_module("zstandard")
+        except ImportError as e:
+            raise DecompressionError(
+                "Reading zstd compressed input requires the 'zstandard' package"
+            ) from e
+        stream: io.BufferedIOBase = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True, closefd=False
+        )
+        return stream
@@ -1,5 +1,12 @@
-from typing import Dict, Any, Type, Callable
-from thor2timesketch.constants import LOG_VERSION, AUDIT_FINDING, AUDIT_INFO
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, Any, FrozenSet, List, Type, Callable, Optional, Tuple
+from thor2timesketch.constants import (
+    LOG_VERSION,
+    AUDIT_FINDING,
+    AUDIT_INFO,
+    MAPPER_ENTRY_POINT_GROUP,
+)
 from thor2timesketch.exceptions import VersionError
 from thor2timesketch.mappers.mapper_json_base import MapperJsonBase
 from thor2timesketch.config.console_config import ConsoleConfig
@@ -7,7 +14,25 @@ from thor2timesketch.config.console_config import ConsoleConfig
 
 class JsonLogVersion:
 
+    MAPPERS: Dict[str, str] = {
+        "v1.0.0": "thor2timesketch.mappers.mapper_json_v1:MapperJsonV1",
+        "v2.0.0": "thor2timesketch.mappers.mapper_json_v2:MapperJsonV2",
+        AUDIT_FINDING: (
+            "thor2timesketch.mappers.mapper_json_audit_findings:"
+            "MapperJsonAuditFindings"
+        ),
+        AUDIT_INFO: "thor2timesketch.mappers.mapper_json_audit_info:MapperJsonAuditInfo",
+    }
+    PREFILTER_VERSIONS: FrozenSet[str] = frozenset({"v1.0.0", "v2.0.0"})
+    PREFILTER_LEVEL_FIELD: str = "level"
+    PREFILTER_MODULE_FIELD: str = "module"
+
     _mapper_log_version: Dict[str, Type["MapperJsonBase"]] = {}
+    _plugin_mappers: Optional[Dict[str, Any]] = None
+
+    def __init__(self) -> None:
+        self._mappers: Dict[str, MapperJsonBase] = {}
+        self._last_mapper: Optional[Tuple[str, MapperJsonBase]] = None
 
     @classmethod
     def log_version(
@@ -22,6 +47,18 @@ class JsonLogVersion:
 
         return map_log_version
 
+    @classmethod
+    def mapper_type(cls, log_version: str) -> Optional[Type["MapperJsonBase"]]:
+        mapper_type = cls._mapper_log_version.get(log_version)
+        if mapper_type is None:
+            mapper_type = cls._load_mapper(log_version)
+        return mapper_type
+
+    @classmethod
+    def load_all(cls) -> None:
+        for log_version in {**cls.MAPPERS, **cls._plugins()}:
+            cls.mapper_type(log_version)
+
     def detect_log_version(self, json_line: Dict[str, Any]) -> str:
         if LOG_VERSION in json_line:
             log_version = json_line[LOG_VERSION]
@@ -39,11 +76,85 @@ class JsonLogVersion:
         raise VersionError("Cannot detect log version")
 
     def get_mapper_for_version(self, json_line: Dict[str, Any]) -> MapperJsonBase:
+        raw_version = json_line.get(LOG_VERSION)
+        if self._last_mapper is not None and raw_version == self._last_mapper[0]:
+            return self._last_mapper[1]
         version_key = self.detect_log_version(json_line)
-        return self._resolve_mapper(version_key)
+        mapper = self._resolve_mapper(version_key)
+        if isinstance(raw_version, str):
+            self._last_mapper = (raw_version, mapper)
+        return mapper
+
+    def group_by_mapper(
+        self,
+        json_lines: List[Dict[str, Any]],
+        on_error: Optional[Callable[[VersionError], None]] = None,
+    ) -> List[Tuple[MapperJsonBase, List[Dict[str, Any]]]]:
+        groups: List[Tuple[MapperJsonBase, List[Dict[str, Any]]]] = []
+        current: Optional[MapperJsonBase] = None
+        group: List[Dict[str, Any]] = []
+        for json_line in json_lines:
+            try:
+                mapper = self.get_mapper_for_version(json_line)
+            except VersionError as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+                continue
+            if mapper is not current:
+                current = mapper
+                group = []
+                groups.append((mapper, group))
+            group.append(json_line)
+        return groups
 
     def _resolve_mapper(self, log_version: str) -> MapperJsonBase:
-        mapper_type = self._mapper_log_version.get(log_version)
+        mapper = self._mappers.get(log_version)
+        if mapper is not None:
+            return mapper
+        mapper_type = self.mapper_type(log_version)
         if not mapper_type:
             raise VersionError(f"No mapper registered for version: {log_version!r}")
-        return mapper_type()
+        mapper = mapper_type()
+        self._mappers[log_version] = mapper
+        ConsoleConfig.debug(f"Created mapper {mapper_type} for version {log_version}")
+        return mapper
+
+    @classmethod
+    def _load_mapper(cls, log_version: str) -> Optional[Type["MapperJsonBase"]]:
+        target = cls.MAPPERS.get(log_version)
+        try:
+            if target is not None:
+                module, _, name = target.partition(":")
+                loaded = getattr(importlib.import_module(module), name)
+            else:
+                entry_point = cls._plugins().get(log_version)
+                if entry_point is None:
+                    return None
+                loaded = entry_point.load()
+        except Exception as e:
+            raise VersionError(
+                f"Failed to load mapper for version {log_version!r}: {e}"
+            ) from e
+        if not isinstance(loaded, type) or not issubclass(loaded, MapperJsonBase):
+            raise VersionError(
+                f"Mapper for version {log_version!r} is not a MapperJsonBase: "
+                f"{loaded!r}"
+            )
+        cls._mapper_log_version[log_version] = loaded
+        ConsoleConfig.debug(f"Mapping log version {log_version} to {loaded}")
+        return loaded
+
+    @classmethod
+    def _plugins(cls) -> Dict[str, Any]:
+        if cls._plugin_mappers is None:
+            discovered: Any = entry_points()
+            group = (
+                discovered.select(group=MAPPER_ENTRY_POINT_GROUP)
+                if hasattr(discovered, "select")
+                else discovered.get(MAPPER_ENTRY_POINT_GROUP, [])
+            )
+            cls._plugin_mappers = {
+                entry_point.name.lower(): entry_point for entry_point in group
+            }
+        return cls._plugin_mappers
@@ -1,7 +1,19 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Mapping, Optional, List, Tuple
 
 
 class MappedEvent:
+    __slots__ = (
+        "message",
+        "datetime",
+        "timestamp_desc",
+        "event_group_id",
+        "tag",
+        "time_thor_scan",
+        "additional_fields",
+        "excluded_fields",
+    )
+    BASE_FIELDS = frozenset(__slots__[:6])
+
     def __init__(
         self,
         message: str,
@@ -17,10 +29,23 @@ class MappedEvent:
         self.time_thor_scan = time_thor_scan
         self.event_group_id = event_group_id
         self.tag = tag or []
-        self.additional_fields: Dict[str, Any] = {}
+        self.additional_fields: Optional[Mapping[str, Any]] = None
+        self.excluded_fields: Tuple[str, ...] = ()
 
-    def add_additional(self, additional: Dict[str, Any]) -> None:
-        self.additional_fields.update(additional)
+    def add_additional(
+        self, additional: Mapping[str, Any], exclude: Iterable[str] = ()
+    ) -> None:
+        if self.additional_fields is None:
+            self.additional_fields = additional
+            self.excluded_fields = tuple(exclude)
+            return
+        merged = self._visible_additional()
+        excluded = set(exclude)
+        merged.update(
+            (key, value) for key, value in additional.items() if key not in excluded
+        )
+        self.additional_fields = merged
+        self.excluded_fields = ()
 
     def to_dict(self) -> Dict[str, Any]:
         event: Dict[str, Any] = {
@@ -32,5 +57,24 @@ class MappedEvent:
         }
         if self.time_thor_scan is not None:
             event["time_thor_scan"] = self.time_thor_scan
-        event.update(self.additional_fields)
+        additional = self.additional_fields
+        if not additional:
+            return event
+        event.update(additional)
+        for key in self.excluded_fields:
+            if key not in additional:
+                continue
+            value = getattr(self, key) if key in self.BASE_FIELDS else None
+            if value is not None:
+                event[key] = value
+            else:
+                del event[key]
         return event
+
+    def _visible_additional(self) -> Dict[str, Any]:
+        additional = self.additional_fields or {}
+        return {
+            key: value
+            for key, value in additional.items()
+            if key not in self.excluded_fields
+        }
@@ -1,11 +1,6 @@
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterable, List, Optional
 from abc import abstractmethod
-from thor2timesketch.exceptions import (
-    MappingError,
-    ProcessingError,
-    TimestampError,
-    FlattenJsonError,
-)
+from thor2timesketch.exceptions import ProcessingError
 from thor2timesketch.mappers.mapped_event import MappedEvent
 from thor2timesketch.mappers.mapper_json_base import MapperJsonBase
 from thor2timesketch.utils.audit_timestamp_extractor import AuditTimestampExtractor
@@ -22,25 +17,32 @@ class MapperJsonAudit(MapperJsonBase):
             normalizer=AuditTrailNormalizer(), time_extractor=AuditTimestampExtractor()
         )
 
-    def map_thor_events(self, json_log: Dict[str, Any]) -> list[dict[str, Any]]:
-        try:
-            ConsoleConfig.debug("Starting to map THOR audit events")
-            events: List[Dict[str, Any]] = []
-            all_timestamps = self.timestamp_extractor.extract(json_log)
-            normalized = self.normalizer.normalize(json_log)
-            event_group_id = ThorFindingId.get_finding_id()
-            for index, time_data in enumerate(all_timestamps):
-                primary = index == 0
-                event = self._create_audit_event(
-                    normalized, time_data, event_group_id, primary
-                )
-                events.append(event.to_dict())
-            ConsoleConfig.debug(f"Mapped '{len(events)}' THOR audit events")
-            return events
-        except (MappingError, TimestampError, FlattenJsonError) as e:
-            raise ProcessingError(f"Error while mapping audit events: {e}") from e
-        except Exception as e:
-            raise ProcessingError(f"Unexpected error while mapping audit events: {e}")
+    def map_thor_events_batch(
+        self,
+        json_logs: Iterable[Dict[str, Any]],
+        on_error: Optional[Callable[[ProcessingError], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        for json_log in json_logs:
+            mapped = len(events)
+            try:
+                all_timestamps = self.timestamp_extractor.extract(json_log)
+                normalized = self.normalizer.normalize(json_log)
+                event_group_id = ThorFindingId.get_finding_id(json_log)
+                for index, time_data in enumerate(all_timestamps):
+                    primary = index == 0
+                    event = self._create_audit_event(
+                        normalized, time_data, event_group_id, primary
+                    )
+                    events.append(event.to_dict())
+            except Exception as e:
+                del events[mapped:]
+                error = self._mapping_error(e, "audit events")
+                if on_error is None:
+                    raise error from e
+                on_error(error)
+        ConsoleConfig.debug(lambda: f"Mapped '{len(events)}' THOR audit events")
+        return events
 
     @abstractmethod
     def _create_audit_event(
@@ -1,13 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from thor2timesketch.exceptions import MappingError
-from thor2timesketch.mappers.json_log_version import JsonLogVersion
 from thor2timesketch.mappers.mapped_event import MappedEvent
 from thor2timesketch.mappers.mapper_json_audit import MapperJsonAudit
 from thor2timesketch.utils.datetime_field import DatetimeField
 from thor2timesketch.constants import AUDIT_FINDING_TAG
 
 
-@JsonLogVersion.log_version("findings")
 class MapperJsonAuditFindings(MapperJsonAudit):
     THOR_MESSAGE_FIELD = "Message"
     THOR_MODULE_FIELD = "Module"
@@ -28,7 +26,7 @@ class MapperJsonAuditFindings(MapperJsonAudit):
             tag=self._get_additional_tags(json_log),
         )
         if primary:
-            event.add_additional(self._get_additional_fields(json_log))
+            self._add_additional_fields(event, json_log)
         return event
 
     def _get_message(self, json_log: Dict[str, Any]) -> str:
@@ -47,12 +45,8 @@ class MapperJsonAuditFindings(MapperJsonAudit):
             )
         return f"{module} - {time_data.path}"
 
-    def _get_additional_fields(self, json_log: Dict[str, Any]) -> Dict[str, Any]:
-        exclude = {self.__class__.THOR_MESSAGE_FIELD}
-        additional_fields = {
-            key: value for key, value in json_log.items() if key not in exclude
-        }
-        return additional_fields
+    def _get_excluded_fields(self) -> Tuple[str, ...]:
+        return (self.__class__.THOR_MESSAGE_FIELD,)
 
     def _get_thor_timestamp(self, json_log: Dict[str, Any]) -> DatetimeField:
         raise MappingError("Audit logs do not have a scan timestamp field")
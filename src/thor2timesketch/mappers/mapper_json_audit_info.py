@@ -1,13 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from thor2timesketch.exceptions import MappingError
-from thor2timesketch.mappers.json_log_version import JsonLogVersion
 from thor2timesketch.mappers.mapped_event import MappedEvent
 from thor2timesketch.mappers.mapper_json_audit import MapperJsonAudit
 from thor2timesketch.utils.datetime_field import DatetimeField
 from thor2timesketch.constants import AUDIT_INFO_TAG
 
 
-@JsonLogVersion.log_version("info")
 class MapperJsonAuditInfo(MapperJsonAudit):
     THOR_NAME_FIELD = "Name"
 
@@ -26,7 +24,7 @@ class MapperJsonAuditInfo(MapperJsonAudit):
             tag=self._get_additional_tags(json_log),
         )
         if primary:
-            event.add_additional(self._get_additional_fields(json_log))
+            self._add_additional_fields(event, json_log)
 
         return event
 
@@ -41,8 +39,8 @@ class MapperJsonAuditInfo(MapperJsonAudit):
     ) -> str:
         return f"{time_data.path}"
 
-    def _get_additional_fields(self, json_log: Dict[str, Any]) -> Dict[str, Any]:
-        return {key: value for key, value in json_log.items()}
+    def _get_excluded_fields(self) -> Tuple[str, ...]:
+        return ()
 
     def _get_thor_timestamp(self, json_log: Dict[str, Any]) -> DatetimeField:
         raise MappingError("Audit info logs do not have a scan timestamp field")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from thor2timesketch.config.console_config import ConsoleConfig
 from thor2timesketch.exceptions import (
     MappingError,
@@ -33,63 +33,101 @@ class MapperJsonBase(ABC):
             normalizer if normalizer is not None else IdentityNormalizer()
         )
 
-    def map_thor_events(self, json_log: Dict[str, Any]) -> List[Dict[str, Any]]:
-        try:
-            ConsoleConfig.debug("Starting to map THOR events")
-            normalized_json = self.normalizer.normalize(json_log)
-            events: List[Dict[str, Any]] = []
+    def map_thor_events(self, json_log: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        yield from self.map_thor_events_batch((json_log,))
 
-            event_group_id = ThorFindingId.get_finding_id()
-
-            thor_timestamp = self._get_thor_timestamp(normalized_json)
-            thor_event = self._create_thor_event(normalized_json, event_group_id)
-            events.append(thor_event.to_dict())
+    def map_thor_events_batch(
+        self,
+        json_logs: Iterable[Dict[str, Any]],
+        on_error: Optional[Callable[[ProcessingError], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        for json_log in json_logs:
+            mapped = len(events)
+            try:
+                self._map_log(json_log, events)
+            except Exception as e:
+                del events[mapped:]
+                error = self._mapping_error(e, "events")
+                if on_error is None:
+                    raise error from e
+                on_error(error)
+        ConsoleConfig.debug(lambda: f"Mapped {len(events)} events")
+        return events
+
+    @staticmethod
+    def _mapping_error(error: Exception, subject: str) -> ProcessingError:
+        if isinstance(error, (MappingError, TimestampError, FlattenJsonError)):
+            return ProcessingError(f"Error while mapping {subject}: {error}")
+        return ProcessingError(f"Unexpected error while mapping {subject}: {error}")
+
+    def _map_log(self, json_log: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+        normalized_json = self.normalizer.normalize(json_log)
+
+        event_group_id = ThorFindingId.get_finding_id(json_log)
+
+        thor_timestamp = self._get_thor_timestamp(normalized_json)
+        thor_event = self._create_thor_event(
+            normalized_json, event_group_id, thor_timestamp
+        )
+        events.append(thor_event.to_dict())
 
-            all_timestamps: List[DatetimeField] = self._get_timestamp_extract(
-                normalized_json
+        all_timestamps: List[DatetimeField] = self._get_timestamp_extract(
+            normalized_json
+        )
+        additional_timestamp = [
+            time
+            for time in all_timestamps
+            if not self.timestamp_extractor.is_same_timestamp(
+                time.datetime, thor_timestamp.datetime
             )
-            additional_timestamp = [
-                time
-                for time in all_timestamps
-                if not self.timestamp_extractor.is_same_timestamp(
-                    time.datetime, thor_timestamp.datetime
-                )
-                and time.path != thor_timestamp.path
-            ]
+            and time.path != thor_timestamp.path
+        ]
 
-            if additional_timestamp:
-                ConsoleConfig.debug(
-                    f"Found {len(additional_timestamp)} additional timestamps"
+        if additional_timestamp:
+            ConsoleConfig.debug(
+                lambda: f"Found {len(additional_timestamp)} additional timestamps"
+            )
+            for timestamp in additional_timestamp:
+                event = self._create_additional_timestamp_event(
+                    normalized_json, timestamp, event_group_id
                 )
-                for timestamp in additional_timestamp:
-                    event = self._create_additional_timestamp_event(
-                        normalized_json, timestamp, event_group_id
-                    )
-                    events.append(event.to_dict())
-
-            ConsoleConfig.debug(f"Mapped {len(events)} events")
-            return events
-        except (MappingError, TimestampError, FlattenJsonError) as e:
-            raise ProcessingError(f"Error while mapping events: {e}") from e
-        except Exception as e:
-            raise ProcessingError(f"Unexpected error while mapping events: {e}") from e
+                events.append(event.to_dict())
 
     def _create_thor_event(
-        self, json_log: Dict[str, Any], event_group_id: str
+        self,
+        json_log: Dict[str, Any],
+        event_group_id: str,
+        thor_timestamp: Optional[DatetimeField] = None,
     ) -> MappedEvent:
+        if thor_timestamp is None:
+            thor_timestamp = self._get_thor_timestamp(json_log)
         event = MappedEvent(
             message=self._get_message(json_log),
-            datetime=self._get_thor_timestamp(json_log).datetime,
-            timestamp_desc=self._get_timestamp_desc(
-                json_log, self._get_thor_timestamp(json_log)
-            ),
+            datetime=thor_timestamp.datetime,
+            timestamp_desc=self._get_timestamp_desc(json_log, thor_timestamp),
             event_group_id=event_group_id,
             tag=self._get_thor_tags(json_log),
         )
 
-        event.add_additional(self._get_additional_fields(json_log))
+        self._add_additional_fields(event, json_log)
         return event
 
+    def _add_additional_fields(
+        self, event: MappedEvent, json_log: Dict[str, Any]
+    ) -> None:
+        if type(self)._get_additional_fields is MapperJsonBase._get_additional_fields:
+            event.add_additional(json_log, self._get_excluded_fields())
+        else:
+            event.add_additional(self._get_additional_fields(json_log))
+
+    def _get_additional_fields(self, json_log: Dict[str, Any]) -> Dict[str, Any]:
+        excluded = self._get_excluded_fields()
+        return {key: value for key, value in json_log.items() if key not in excluded}
+
+    def _get_excluded_fields(self) -> Tuple[str, ...]:
+        return ()
+
     def _create_additional_timestamp_event(
         self, json_log: Dict[str, Any], time_data: DatetimeField, event_group_id: str
     ) -> MappedEvent:
@@ -119,10 +157,6 @@ class MapperJsonBase(ABC):
     ) -> str:
         pass
 
-    @abstractmethod
-    def _get_additional_fields(self, json_log: Dict[str, Any]) -> Dict[str, Any]:
-        pass
-
     @abstractmethod
     def _get_thor_timestamp(self, json_log: Dict[str, Any]) -> DatetimeField:
         pass
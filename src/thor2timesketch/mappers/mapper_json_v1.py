@@ -1,14 +1,12 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from thor2timesketch.exceptions import MappingError, TimestampError
 from thor2timesketch.mappers.mapper_json_base import MapperJsonBase
-from thor2timesketch.mappers.json_log_version import JsonLogVersion
 from thor2timesketch.utils.datetime_field import DatetimeField
 from thor2timesketch.constants import THOR_TAG, EXTRA_TAG
 from thor2timesketch.utils.normalizer import FlatteningNormalizer
 from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
 
 
-@JsonLogVersion.log_version("v1.0.0")
 class MapperJsonV1(MapperJsonBase):
 
     THOR_TIMESTAMP_FIELD: str = "time"
@@ -39,15 +37,11 @@ class MapperJsonV1(MapperJsonBase):
             )
         return f"{module} - {time_data.path}"
 
-    def _get_additional_fields(self, json_log: Dict[str, Any]) -> Dict[str, Any]:
-        exclude = {
+    def _get_excluded_fields(self) -> Tuple[str, ...]:
+        return (
             self.__class__.THOR_TIMESTAMP_FIELD,
             self.__class__.THOR_MESSAGE_FIELD,
-        }
-        additional_fields = {
-            key: value for key, value in json_log.items() if key not in exclude
-        }
-        return additional_fields
+        )
 
     def _get_thor_timestamp(self, json_log: Dict[str, Any]) -> DatetimeField:
         thor_timestamp = json_log.get(self.__class__.THOR_TIMESTAMP_FIELD)
@@ -0,0 +1,130 @@
+import functools
+import gzip
+import importlib
+import os
+import threading
+from pathlib import Path
+from queue import Full, Queue
+from typing import IO, Any, Callable, NamedTuple, Optional
+from thor2timesketch.constants import (
+    OUTPUT_COMPRESSION_EXTENSIONS,
+    OUTPUT_GZIP_LEVEL,
+    OUTPUT_QUEUE_BLOCKS,
+    OUTPUT_ZSTD_LEVEL,
+)
+from thor2timesketch.exceptions import OutputError
+
+Compressor = Callable[[bytes], bytes]
+DurableCallback = Callable[[Path, int, Optional[int]], None]
+
+
+class _Block(NamedTuple):
+    path: Path
+    mode: str
+    data: bytes
+    events: Optional[int]
+
+
+def _no_compression(data: bytes) -> bytes:
+    return data
+
+
+def _zstd_compressor() -> Compressor:
+    try:
+        zstandard: Any = importlib.import_module("zstandard")
+    except ImportError as e:
+        raise OutputError(
+            "Writing zstd compressed output requires the 'zstandard' package"
+        ) from e
+    compress: Compressor = zstandard.ZstdCompressor(level=OUTPUT_ZSTD_LEVEL).compress
+    return compress
+
+
+class BlockWriter(threading.Thread):
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        queue_blocks: int = OUTPUT_QUEUE_BLOCKS,
+        on_durable: Optional[DurableCallback] = None,
+        flush_blocks: bool = False,
+    ) -> None:
+        super().__init__(name="thor2ts-file-writer", daemon=True)
+        self.compress = self._compressor(compression)
+        self.on_durable = on_durable
+        self.flush_blocks = flush_blocks
+        self.queue: "Queue[Optional[_Block]]" = Queue(maxsize=queue_blocks)
+        self.error: Optional[BaseException] = None
+        self._aborted = threading.Event()
+
+    @staticmethod
+    def _compressor(compression: Optional[str]) -> Compressor:
+        if compression is None:
+            return _no_compression
+        if compression == "gzip":
+            return functools.partial(
+                gzip.compress, compresslevel=OUTPUT_GZIP_LEVEL, mtime=0
+            )
+        if compression == "zstd":
+            return _zstd_compressor()
+        raise OutputError(
+            f"Unknown output compression '{compression}'. "
+            f"Expected one of: {list(OUTPUT_COMPRESSION_EXTENSIONS)}"
+        )
+
+    def run(self) -> None:
+        current: Optional[Path] = None
+        file: Optional[IO[bytes]] = None
+        try:
+            while True:
+                block = self.queue.get()
+                if block is None or self._aborted.is_set():
+                    return
+                if file is None or block.path != current:
+                    if file is not None:
+                        file.close()
+                    file = block.path.open(block.mode)
+                    current = block.path
+                    if self.on_durable is not None:
+                        self.on_durable(block.path, file.tell(), None)
+                self._write_block(file, block.data)
+                if self.flush_blocks:
+                    file.flush()
+                if self.on_durable is not None:
+                    file.flush()
+                    os.fsync(file.fileno())
+                    self.on_durable(block.path, file.tell(), block.events)
+        except BaseException as e:
+            self.error = e
+        finally:
+            if file is not None:
+                file.close()
+
+    def _write_block(self, file: IO[bytes], data: bytes) -> None:
+        file.write(self.compress(data))
+
+    def write(
+        self, path: Path, mode: str, data: bytes, events: Optional[int] = None
+    ) -> None:
+        if not self._offer(_Block(path, mode, data, events)):
+            raise OutputError(f"Error writing to file '{path}': {self.error}")
+
+    def close(self) -> None:
+        self._offer(None)
+        self.join()
+        if self.error is not None:
+            raise OutputError(f"Error writing to file: {self.error}")
+
+    def abort(self) -> None:
+        self._aborted.set()
+        self._offer(None)
+        self.join()
+
+    def _offer(self, block: Optional[_Block]) -> bool:
+        while self.is_alive():
+            try:
+                self.queue.put(block, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
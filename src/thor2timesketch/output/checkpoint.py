@@ -0,0 +1,218 @@
+import bisect
+import itertools
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import (
+    CHECKPOINT_PRUNE_SIZE,
+    CHECKPOINT_VERSION,
+    DEFAULT_ENCODING,
+)
+from thor2timesketch.exceptions import CheckpointError
+
+
+class ResumePoint(NamedTuple):
+    offset: int
+    line: int
+    skip: int
+    events: int
+
+
+class CheckpointTracker:
+
+    def __init__(self, checkpoint_file: Path, input_file: Path) -> None:
+        self.checkpoint_file = checkpoint_file
+        self.input_file = input_file
+        self.start = ResumePoint(offset=0, line=1, skip=0, events=0)
+        self.base = 0
+        self.events = 0
+        self.sinks: Dict[str, Dict[str, Any]] = {}
+        self._saved: Optional[Dict[str, Dict[str, Any]]] = None
+        self._input: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._marks: List[int] = [0]
+        self._offsets: List[int] = [0]
+        self._lines: List[int] = [1]
+
+    @property
+    def resuming(self) -> bool:
+        return self._saved is not None
+
+    def exists(self) -> bool:
+        return self.checkpoint_file.is_file()
+
+    def load(self) -> ResumePoint:
+        try:
+            state = json.loads(
+                self.checkpoint_file.read_text(encoding=DEFAULT_ENCODING)
+            )
+            sinks: Dict[str, Dict[str, Any]] = state["sinks"]
+            saved_input = state["input"]
+        except FileNotFoundError:
+            raise CheckpointError(
+                f"No checkpoint '{self.checkpoint_file}' found to resume from"
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise CheckpointError(
+                f"Invalid checkpoint '{self.checkpoint_file}': {e}"
+            ) from e
+        if saved_input != self._input_identity():
+            raise CheckpointError(
+                f"Input file '{self.input_file}' changed since checkpoint "
+                f"'{self.checkpoint_file}' was written, cannot resume"
+            )
+        if not sinks:
+            raise CheckpointError(f"Checkpoint '{self.checkpoint_file}' is empty")
+        for sink, sink_state in sinks.items():
+            if not sink_state.get("resumable", True):
+                raise CheckpointError(
+                    f"The {sink} output of checkpoint '{self.checkpoint_file}' "
+                    f"cannot be resumed"
+                )
+        earliest = min(sinks.values(), key=lambda sink_state: sink_state["events"])
+        self.start = ResumePoint(
+            offset=earliest["offset"],
+            line=earliest["line"],
+            skip=earliest["skip"],
+            events=earliest["events"],
+        )
+        self.base = self.events = self.start.events - self.start.skip
+        self._marks = [self.base]
+        self._offsets = [self.start.offset]
+        self._lines = [self.start.line]
+        self._saved = sinks
+        ConsoleConfig.info(
+            f"Resuming from line {self.start.line} of '{self.input_file}' "
+            f"after {self.start.events} events"
+        )
+        return self.start
+
+    def register(
+        self, sink: str, resumable: bool = True, **details: Any
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if self._saved is not None:
+                saved = self._saved.get(sink)
+                if saved is None or not resumable:
+                    raise CheckpointError(
+                        f"Checkpoint '{self.checkpoint_file}' cannot resume the "
+                        f"{sink} output"
+                    )
+                for key, value in details.items():
+                    if saved.get(key) != value:
+                        raise CheckpointError(
+                            f"Checkpoint '{self.checkpoint_file}' was written for "
+                            f"{sink} {key} '{saved.get(key)}', not '{value}'"
+                        )
+                state = dict(saved)
+            else:
+                state = {
+                    "resumable": resumable,
+                    "events": 0,
+                    "offset": 0,
+                    "line": 1,
+                    "skip": 0,
+                    **details,
+                }
+            self.sinks[sink] = state
+            self._save()
+        return dict(state)
+
+    def mark(self, offset: int, line: int) -> None:
+        with self._lock:
+            self._marks.append(self.events)
+            self._offsets.append(offset)
+            self._lines.append(line)
+
+    def track(self, events: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for event in events:
+            self.events += 1
+            yield event
+
+    def track_batches(
+        self, batches: Iterator[List[Dict[str, Any]]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        for batch in batches:
+            self.events += len(batch)
+            yield batch
+
+    def skip(
+        self, sink: str, events: Iterator[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        done = self.sinks[sink]["events"] - self.base
+        return itertools.islice(events, done, None) if done > 0 else events
+
+    def commit(self, sink: str, events: Optional[int] = None, **details: Any) -> None:
+        with self._lock:
+            state = self.sinks[sink]
+            state.update(details)
+            if events is not None:
+                index = bisect.bisect_right(self._marks, events) - 1
+                state.update(
+                    events=events,
+                    offset=self._offsets[index],
+                    line=self._lines[index],
+                    skip=events - self._marks[index],
+                )
+                self._prune()
+            self._save()
+
+    def remove(self) -> None:
+        for path in (self.checkpoint_file, self._temporary_file()):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                raise CheckpointError(f"Failed to remove checkpoint '{path}': {e}")
+
+    def _prune(self) -> None:
+        durable = [
+            state["events"] for state in self.sinks.values() if state["resumable"]
+        ]
+        if not durable:
+            return
+        index = bisect.bisect_right(self._marks, min(durable)) - 1
+        if index >= CHECKPOINT_PRUNE_SIZE:
+            del self._marks[:index]
+            del self._offsets[:index]
+            del self._lines[:index]
+
+    def _input_identity(self) -> Dict[str, Any]:
+        if self._input is None:
+            try:
+                stat = self.input_file.stat()
+            except OSError as e:
+                raise CheckpointError(
+                    f"Cannot read input file '{self.input_file}': {e}"
+                ) from e
+            self._input = {
+                "path": str(self.input_file.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+        return self._input
+
+    def _temporary_file(self) -> Path:
+        return self.checkpoint_file.with_name(self.checkpoint_file.name + ".tmp")
+
+    def _save(self) -> None:
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "input": self._input_identity(),
+            "sinks": self.sinks,
+        }
+        temporary = self._temporary_file()
+        try:
+            with temporary.open("w", encoding=DEFAULT_ENCODING) as file:
+                json.dump(state, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.checkpoint_file)
+        except OSError as e:
+            raise CheckpointError(
+                f"Failed to write checkpoint '{self.checkpoint_file}': {e}"
+            ) from e
@@ -0,0 +1,107 @@
+import threading
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import TEE_BATCH_SIZE, TEE_QUEUE_BATCHES
+from thor2timesketch.exceptions import OutputError
+
+EventSink = Callable[[Iterator[Dict[str, Any]]], None]
+
+
+class _EndOfStream:
+    pass
+
+
+class _AbortStream:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class _SinkWorker(threading.Thread):
+
+    def __init__(self, sink: EventSink, queue_size: int) -> None:
+        super().__init__(daemon=True)
+        self.sink = sink
+        self.queue: "Queue[Any]" = Queue(maxsize=queue_size)
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            self.sink(self._events())
+        except BaseException as e:
+            self.error = e
+
+    def _events(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            item = self.queue.get()
+            if isinstance(item, _EndOfStream):
+                return
+            if isinstance(item, _AbortStream):
+                if isinstance(item.error, KeyboardInterrupt):
+                    raise KeyboardInterrupt()
+                raise OutputError(f"Event stream aborted: {item.error}")
+            yield from item
+
+    def offer(self, item: Any) -> bool:
+        while self.is_alive():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def put(self, item: Any) -> None:
+        if self.offer(item):
+            return
+        if self.error is not None:
+            raise self.error
+        raise OutputError("Output sink stopped before all events were written")
+
+
+class EventTee:
+
+    def __init__(
+        self,
+        sinks: Sequence[EventSink],
+        batch_size: int = TEE_BATCH_SIZE,
+        queue_batches: int = TEE_QUEUE_BATCHES,
+    ) -> None:
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.queue_batches = queue_batches
+
+    def run(self, events: Iterator[Dict[str, Any]]) -> None:
+        workers = [_SinkWorker(sink, self.queue_batches) for sink in self.sinks]
+        for worker in workers:
+            worker.start()
+        ConsoleConfig.debug(f"Writing events to {len(workers)} outputs")
+        try:
+            batch: List[Dict[str, Any]] = []
+            for event in events:
+                batch.append(event)
+                if len(batch) >= self.batch_size:
+                    self._dispatch(workers, batch)
+                    batch = []
+            if batch:
+                self._dispatch(workers, batch)
+        except BaseException as error:
+            self._stop(workers, _AbortStream(error))
+            raise
+        self._stop(workers, _EndOfStream())
+        for worker in workers:
+            if worker.error is not None:
+                raise worker.error
+
+    def _dispatch(
+        self, workers: List[_SinkWorker], batch: List[Dict[str, Any]]
+    ) -> None:
+        workers[0].put(batch)
+        for worker in workers[1:]:
+            worker.put([dict(event) for event in batch])
+
+    def _stop(self, workers: List[_SinkWorker], marker: Any) -> None:
+        for worker in workers:
+            worker.offer(marker)
+        for worker in workers:
+            worker.join()
@@ -1,27 +1,91 @@
-import json
-from typing import Dict, Any, Iterator
+from itertools import islice
+from typing import Dict, Any, Iterator, List, Optional
 from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.output.block_writer import BlockWriter
+from thor2timesketch.output.checkpoint import CheckpointTracker
+from thor2timesketch.utils.json_codec import JsonCodec
 from thor2timesketch.utils.progress_bar import ProgressBar
 from thor2timesketch.constants import (
     OUTPUT_FILE_EXTENSION,
-    DEFAULT_ENCODING,
     MAX_WRITE_ERRORS,
+    OUTPUT_BUFFER_SIZE,
+    OUTPUT_COMPRESSION_EXTENSIONS,
+    PIPELINE_BATCH_SIZE,
 )
 from thor2timesketch.exceptions import OutputError
 from pathlib import Path
 
 
 class FileWriter:
-    def __init__(self, output_file: Path):
+    CHECKPOINT_SINK = "file"
+
+    def __init__(
+        self,
+        output_file: Path,
+        compression: Optional[str] = None,
+        max_size: Optional[int] = None,
+        max_events: Optional[int] = None,
+        checkpoint: Optional[CheckpointTracker] = None,
+        follow: bool = False,
+    ):
+        if compression and compression not in OUTPUT_COMPRESSION_EXTENSIONS:
+            raise OutputError(
+                f"Unknown output compression '{compression}'. "
+                f"Expected one of: {list(OUTPUT_COMPRESSION_EXTENSIONS)}"
+            )
         self.output_file = output_file
+        self.compression = compression
+        self.max_size = max_size
+        self.max_events = max_events
+        self.part_files: List[Path] = []
+        self.checkpoint = checkpoint
+        self.follow = follow
+        self.durable_files: Dict[str, int] = {}
+        self.events_seen = 0
+
+    @property
+    def rotating(self) -> bool:
+        return bool(self.max_size or self.max_events)
 
     def _normalize_extension(self) -> None:
+        requested = self.output_file
+        suffix = self.output_file.suffix.lower()
+        for compression, extension in OUTPUT_COMPRESSION_EXTENSIONS.items():
+            if suffix == extension:
+                self.compression = self.compression or compression
+                self.output_file = self.output_file.with_suffix("")
         if self.output_file.suffix.lower() != OUTPUT_FILE_EXTENSION:
             self.output_file = self.output_file.with_suffix(OUTPUT_FILE_EXTENSION)
+        if self.compression:
+            self.output_file = self.output_file.with_name(
+                self.output_file.name + OUTPUT_COMPRESSION_EXTENSIONS[self.compression]
+            )
+        if self.output_file != requested:
             ConsoleConfig.info(
                 f"Changed output file to '{self.output_file}' to ensure JSONL format"
             )
 
+    def _part_file(self, index: int) -> Path:
+        name = self.output_file.name
+        stem, _, extension = name.rpartition(OUTPUT_FILE_EXTENSION)
+        return self.output_file.with_name(
+            f"{stem}_part{index:04d}{OUTPUT_FILE_EXTENSION}{extension}"
+        )
+
+    def _next_part_file(self) -> Path:
+        index = len(self.part_files) + 1
+        part_file = self._part_file(index)
+        while part_file.exists():
+            index += 1
+            part_file = self._part_file(index)
+        self.part_files.append(part_file)
+        return part_file
+
+    def _part_full(self, size: int, events: int) -> bool:
+        if self.max_events and events >= self.max_events:
+            return True
+        return bool(self.max_size and size >= self.max_size)
+
     def _prepare_output_dir(self) -> None:
         output_dir = self.output_file.parent
         if output_dir and not output_dir.is_dir():
@@ -34,48 +98,182 @@ class FileWriter:
                 )
 
     def _cleanup_file(self) -> None:
-        if self.output_file.exists():
+        for output_file in self.part_files if self.rotating else [self.output_file]:
+            if output_file.exists():
+                try:
+                    output_file.unlink()
+                    ConsoleConfig.debug(f"Removed output file: '{output_file}'")
+                except OSError as e:
+                    raise OutputError(f"Failed to remove output file: {e}")
+
+    def _restore_checkpoint(self, checkpoint: CheckpointTracker) -> bool:
+        state = checkpoint.register(self.CHECKPOINT_SINK, output=str(self.output_file))
+        if not checkpoint.resuming:
+            return False
+        self.events_seen = state["events"]
+        self.durable_files = dict(state.get("files", {}))
+        for name, size in self.durable_files.items():
             try:
-                self.output_file.unlink()
-                ConsoleConfig.debug(f"Removed output file: '{self.output_file}'")
+                with open(name, "r+b") as file:
+                    file.truncate(size)
             except OSError as e:
-                raise OutputError(f"Failed to remove output file: {e}")
+                raise OutputError(f"Cannot resume output file '{name}': {e}")
+        if self.rotating:
+            self.part_files = [Path(name) for name in self.durable_files]
+        ConsoleConfig.info(
+            f"Resuming '{self.output_file}' after '{self.events_seen}' written events"
+        )
+        return True
+
+    def _durable(self, path: Path, size: int, events: Optional[int]) -> None:
+        if self.checkpoint is None:
+            return
+        self.durable_files[str(path)] = size
+        self.checkpoint.commit(
+            self.CHECKPOINT_SINK, events, files=dict(self.durable_files)
+        )
+
+    @staticmethod
+    def _batches(
+        events: Iterator[Dict[str, Any]], batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            try:
+                batch.extend(islice(events, batch_size))
+            except (Exception, KeyboardInterrupt):
+                if batch:
+                    yield batch
+                raise
+            if not batch:
+                return
+            yield batch
+
+    def _serialize(
+        self, batch: List[Dict[str, Any]], progress: ProgressBar
+    ) -> List[bytes]:
+        try:
+            return JsonCodec.dumps_lines(batch)
+        except (TypeError, ValueError):
+            pass
+        lines: List[bytes] = []
+        for event in batch:
+            try:
+                lines.append(JsonCodec.dumps_line(event))
+            except (TypeError, ValueError) as e:
+                progress.advance(step=0, error=1)
+                if progress.errors >= MAX_WRITE_ERRORS:
+                    raise OutputError(
+                        f"Too many errors encountered while writing to file: {e}"
+                    ) from e
+        return lines
+
+    def _write_events(
+        self,
+        events: Iterator[Dict[str, Any]],
+        writer: BlockWriter,
+        mode: str,
+        progress: ProgressBar,
+    ) -> None:
+        output_file = self._next_part_file() if self.rotating else self.output_file
+        buffer: List[bytes] = []
+        buffered = part_size = part_events = 0
+        batch_size = 1 if self.follow else PIPELINE_BATCH_SIZE
+        for batch in self._batches(events, batch_size):
+            lines = self._serialize(batch, progress)
+            self.events_seen += len(batch) - len(lines)
+            if not self.rotating:
+                buffer.extend(lines)
+                buffered += sum(map(len, lines))
+                part_events += len(lines)
+                self.events_seen += len(lines)
+                progress.advance(len(lines))
+                if buffered >= OUTPUT_BUFFER_SIZE or (self.follow and buffer):
+                    writer.write(output_file, mode, b"".join(buffer), self.events_seen)
+                    buffer, buffered = [], 0
+                continue
+            for line in lines:
+                if part_events and self._part_full(part_size + len(line), part_events):
+                    writer.write(output_file, mode, b"".join(buffer), self.events_seen)
+                    buffer, buffered = [], 0
+                    output_file = self._next_part_file()
+                    part_size = part_events = 0
+                buffer.append(line)
+                buffered += len(line)
+                part_size += len(line)
+                part_events += 1
+                self.events_seen += 1
+                if buffered >= OUTPUT_BUFFER_SIZE:
+                    writer.write(output_file, mode, b"".join(buffer), self.events_seen)
+                    buffer, buffered = [], 0
+            if self.follow and buffer:
+                writer.write(output_file, mode, b"".join(buffer), self.events_seen)
+                buffer, buffered = [], 0
+            progress.advance(len(lines))
+        if buffer or not part_events:
+            writer.write(output_file, mode, b"".join(buffer), self.events_seen)
 
     def write_to_file(self, events: Iterator[Dict[str, Any]]) -> None:
         self._normalize_extension()
         self._prepare_output_dir()
-        mode = "a" if self.output_file.exists() else "w"
-        action = "Appending to " if mode == "a" else "Writing to "
+        resumed = False
+        if self.checkpoint is not None:
+            resumed = self._restore_checkpoint(self.checkpoint)
+            events = self.checkpoint.skip(self.CHECKPOINT_SINK, events)
+        append = resumed or self.output_file.exists()
+        mode = "ab" if append and not self.rotating else "wb"
+        action = "Appending to " if mode == "ab" else "Writing to "
+        writer = BlockWriter(
+            self.compression,
+            on_durable=self._durable if self.checkpoint is not None else None,
+            flush_blocks=self.follow,
+        )
+        writer.start()
         try:
             with ProgressBar(f"{action} {self.output_file.name} ...") as progress:
-                with self.output_file.open(mode, encoding=DEFAULT_ENCODING) as file:
-                    for event in events:
-                        try:
-                            file.write(json.dumps(event) + "\n")
-                            progress.advance()
-                        except (TypeError, ValueError, OSError) as e:
-                            progress.advance(step=0, error=1)
-                            if progress.errors >= MAX_WRITE_ERRORS:
-                                raise OutputError(
-                                    f"Too many errors encountered while writing to file: {e}"
-                                ) from e
-
-            if progress.errors:
-                self._cleanup_file()
-                raise OutputError(
-                    f"Encountered '{progress.errors}' errors while writing '{progress.processed}' events"
-                )
-            ConsoleConfig.success(
-                f"Successfully wrote '{progress.processed}' events to '{self.output_file}'"
-            )
+                self._write_events(events, writer, mode, progress)
+                writer.close()
 
         except KeyboardInterrupt:
-            self._cleanup_file()
-            ConsoleConfig.warning(
-                f"Keyboard interrupt received. File '{self.output_file}' was not written."
-            )
+            if self.follow:
+                writer.close()
+                ConsoleConfig.warning(
+                    f"Keyboard interrupt received. Kept the events written to "
+                    f"'{self.output_file}' so far."
+                )
+                raise
+            writer.abort()
+            if self.checkpoint is None:
+                self._cleanup_file()
+                ConsoleConfig.warning(
+                    f"Keyboard interrupt received. File '{self.output_file}' was not written."
+                )
+            else:
+                ConsoleConfig.warning(
+                    f"Keyboard interrupt received. Kept the events written to "
+                    f"'{self.output_file}' so far for --resume."
+                )
             raise
 
         except Exception as e:
-            self._cleanup_file()
+            writer.abort()
+            if self.checkpoint is None:
+                self._cleanup_file()
             raise OutputError(f"Error writing to file: {e}")
+
+        if progress.errors:
+            self._cleanup_file()
+            if self.checkpoint is not None:
+                self.checkpoint.remove()
+            raise OutputError(
+                f"Encountered '{progress.errors}' errors while writing '{progress.processed}' events"
+            )
+        if self.rotating:
+            ConsoleConfig.success(
+                f"Successfully wrote '{progress.processed}' events to "
+                f"'{len(self.part_files)}' files starting with '{self.part_files[0]}'"
+            )
+        else:
+            ConsoleConfig.success(
+                f"Successfully wrote '{progress.processed}' events to '{self.output_file}'"
+            )
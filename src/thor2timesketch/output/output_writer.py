@@ -1,8 +1,14 @@
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, Optional, List
 
+from thor2timesketch.constants import (
+    FOLLOW_FLUSH_INTERVAL,
+    MB_CONVERTER,
+    TEE_BATCH_SIZE,
+)
 from thor2timesketch.exceptions import OutputError, TimesketchError
+from thor2timesketch.output.checkpoint import CheckpointTracker
+from thor2timesketch.output.event_tee import EventSink, EventTee
 from thor2timesketch.output.file_writer import FileWriter
-from thor2timesketch.output.ts_ingest import TSIngest
 from pathlib import Path
 
 
@@ -13,25 +19,69 @@ class OutputWriter:
         output_file: Optional[Path] = None,
         sketch: Optional[str] = None,
         buffer_size: Optional[int] = None,
+        uploaders: Optional[int] = None,
+        upload_queue_size: Optional[int] = None,
+        output_compression: Optional[str] = None,
+        output_max_size: Optional[int] = None,
+        output_max_events: Optional[int] = None,
+        checkpoint: Optional[CheckpointTracker] = None,
+        ts_client: Any = None,
+        follow: bool = False,
     ) -> None:
         self.input_file = input_file
         self.output_file = output_file
         self.sketch = sketch
         self.buffer_size = buffer_size
+        self.uploaders = uploaders
+        self.upload_queue_size = upload_queue_size
+        self.output_compression = output_compression
+        self.output_max_size = output_max_size
+        self.output_max_events = output_max_events
+        self.checkpoint = checkpoint
+        self.ts_client = ts_client
+        self.follow = follow
 
     def write(self, events: Iterator[Dict[str, Any]]) -> None:
         try:
-            if self.output_file:
-                try:
-                    FileWriter(self.output_file).write_to_file(events)
-                except OutputError:
-                    raise
-            if self.sketch:
-                try:
-                    TSIngest(
-                        self.input_file, self.sketch, self.buffer_size
-                    ).ingest_events(events)
-                except TimesketchError:
-                    raise
+            sinks = self._create_sinks()
+            if len(sinks) == 1:
+                sinks[0](events)
+            elif sinks:
+                batch_size = 1 if self.follow else TEE_BATCH_SIZE
+                EventTee(sinks, batch_size).run(events)
+        except (OutputError, TimesketchError):
+            raise
         except Exception as e:
             raise OutputError(f"Unexpected error during output writing: {e}") from e
+
+    def _create_sinks(self) -> List[EventSink]:
+        sinks: List[EventSink] = []
+        if self.output_file:
+            file_writer = FileWriter(
+                self.output_file,
+                compression=self.output_compression,
+                max_size=(
+                    self.output_max_size * MB_CONVERTER
+                    if self.output_max_size
+                    else None
+                ),
+                max_events=self.output_max_events,
+                checkpoint=self.checkpoint,
+                follow=self.follow,
+            )
+            sinks.append(file_writer.write_to_file)
+        if self.sketch:
+            from thor2timesketch.output.ts_ingest import TSIngest
+
+            ts_ingest = TSIngest(
+                self.input_file,
+                self.sketch,
+                self.buffer_size,
+                uploaders=self.uploaders,
+                queue_size=self.upload_queue_size,
+                checkpoint=self.checkpoint,
+                ts_client=self.ts_client,
+                flush_interval=FOLLOW_FLUSH_INTERVAL if self.follow else None,
+            )
+            sinks.append(ts_ingest.ingest_events)
+        return sinks
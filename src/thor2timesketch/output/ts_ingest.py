@@ -1,21 +1,129 @@
+import sys
+import threading
 import time
+import uuid
 from pathlib import Path
-from typing import Dict, Union, Any, Iterator, Optional
+from queue import Empty, Full, Queue
+from typing import Dict, Union, Any, Iterator, Optional, List, Callable
 from timesketch_import_client import importer
 from timesketch_api_client import config as timesketch_config
 from thor2timesketch.config.console_config import ConsoleConfig
-from thor2timesketch.constants import TS_SCOPE
+from thor2timesketch.constants import (
+    TS_SCOPE,
+    INGEST_BATCH_SIZE,
+    DEFAULT_INGEST_QUEUE_SIZE,
+    DEFAULT_TS_BUFFER_SIZE,
+    DEFAULT_UPLOADERS,
+)
 from thor2timesketch.exceptions import TimesketchError
+from thor2timesketch.output.checkpoint import CheckpointTracker
 from thor2timesketch.utils.progress_bar import ProgressBar
 
+EventBatch = Optional[List[Dict[str, Any]]]
+
+
+class _Streamer(importer.ImportStreamer):  # type: ignore[misc]
+
+    def upload_buffer(self) -> None:
+        self.flush(end_stream=False)
+        self._reset()
+
+
+class _Uploader(threading.Thread):
+
+    def __init__(
+        self,
+        configure_streamer: Callable[[Any], None],
+        batches: "Queue[EventBatch]",
+        progress: ProgressBar,
+        threshold: int = DEFAULT_TS_BUFFER_SIZE,
+        on_flush: Optional[Callable[[int], None]] = None,
+        consumed: int = 0,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        super().__init__(daemon=True)
+        self.configure_streamer = configure_streamer
+        self.batches = batches
+        self.progress = progress
+        self.threshold = threshold
+        self.on_flush = on_flush
+        self.consumed = consumed
+        self.flush_interval = flush_interval
+        self.pending = 0
+        self.pending_since = 0.0
+        self.streamer: Any = None
+        self.received = 0
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            with _Streamer() as streamer:
+                self.streamer = streamer
+                self.configure_streamer(streamer)
+                while True:
+                    batch = self._next_batch(streamer)
+                    if batch is None:
+                        break
+                    self._add_batch(streamer, batch)
+            if self.on_flush is not None:
+                self.on_flush(self.consumed)
+        except BaseException as e:
+            self.error = e
+
+    def _next_batch(self, streamer: Any) -> EventBatch:
+        while self.flush_interval is not None and self.pending:
+            remaining = self.pending_since + self.flush_interval - time.monotonic()
+            if remaining <= 0:
+                self._flush(streamer)
+                break
+            try:
+                return self.batches.get(timeout=remaining)
+            except Empty:
+                continue
+        return self.batches.get()
+
+    def _flush(self, streamer: Any) -> None:
+        streamer.upload_buffer()
+        self.pending = 0
+        if self.on_flush is not None:
+            self.on_flush(self.consumed)
+
+    def _add_batch(self, streamer: Any, batch: List[Dict[str, Any]]) -> None:
+        added = 0
+        errors = 0
+        for event in batch:
+            try:
+                streamer.add_dict(event)
+                added += 1
+                if not self.pending:
+                    self.pending_since = time.monotonic()
+                self.pending += 1
+            except Exception as e:
+                errors += 1
+                ConsoleConfig.debug(f"Error adding event to streamer: '{e}'")
+            self.consumed += 1
+            if self.pending >= self.threshold:
+                self._flush(streamer)
+        self.received += added
+        self.progress.advance(step=added, error=errors)
+
 
 class TSIngest:
+    CHECKPOINT_SINK = "timesketch"
 
     def __init__(
-        self, thor_file: Path, sketch: str, buffer_size: Optional[int] = None
+        self,
+        thor_file: Path,
+        sketch: str,
+        buffer_size: Optional[int] = None,
+        uploaders: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        checkpoint: Optional[CheckpointTracker] = None,
+        ts_client: Any = None,
+        flush_interval: Optional[float] = None,
     ) -> None:
         self.thor_file = thor_file
-        self.ts_client = timesketch_config.get_client()
+        self.ts_client = ts_client or timesketch_config.get_client()
         if not self.ts_client:
             raise TimesketchError(
                 "Failed to connect to Timesketch client. Check your configuration."
@@ -24,6 +132,13 @@ class TSIngest:
         sketch_type: Union[int, str] = self._identify_sketch_type(sketch)
         self.my_sketch: Any = self._load_sketch(sketch_type)
         self.buffer_size: Optional[int] = buffer_size
+        self.uploaders: int = uploaders or DEFAULT_UPLOADERS
+        self.queue_size: int = queue_size or DEFAULT_INGEST_QUEUE_SIZE
+        self.checkpoint = checkpoint
+        self.flush_interval = flush_interval
+        self.batch_size = 1 if flush_interval is not None else INGEST_BATCH_SIZE
+        self.index_name: Optional[str] = None
+        self.ingested = 0
 
     def _identify_sketch_type(self, sketch: str) -> Union[int, str]:
         return int(sketch) if sketch.isdigit() else sketch
@@ -82,24 +197,10 @@ class TSIngest:
 
         with ProgressBar(f"Ingesting to sketch '{self.my_sketch.name}'") as progress:
             try:
-                with importer.ImportStreamer() as streamer:
-                    streamer.set_sketch(self.my_sketch)
-                    streamer.set_timeline_name(self.timeline_name)
-                    streamer.set_provider("thor2ts")
-                    streamer.set_upload_context(self.timeline_name)
-                    if self.buffer_size:
-                        streamer.set_entry_threshold(self.buffer_size)
-
-                    for event in events:
-                        try:
-                            streamer.add_dict(event)
-                            progress.advance()
-                        except Exception as e:
-                            progress.advance(step=0, error=1)
-                            ConsoleConfig.debug(
-                                f"Error adding event to streamer: '{e}'"
-                            )
-                if not streamer.timeline:
+                streamers = self._upload_events(events, progress)
+                if not (streamers or self.ingested) or not all(
+                    streamer.timeline for streamer in streamers
+                ):
                     raise TimesketchError("Error creating timeline, ingestion aborted")
 
             except KeyboardInterrupt:
@@ -111,21 +212,14 @@ class TSIngest:
                 raise TimesketchError(f"Failed to ingest events: {error}")
 
         with ProgressBar(
-            f"Indexing ingested events into sketch '{self.my_sketch.name}' this may take a few moments. Waiting on Timesketch ..."
+            f"Indexing ingested events into sketch '{self.my_sketch.name}' this may take a few moments. Waiting on Timesketch ...",
+            show_input=False,
         ) as index_progress:
             index_progress.processed = progress.processed
             index_progress.errors = progress.errors
-            index_progress.progress.update(
-                index_progress.task_id,
-                completed=index_progress.processed,
-                errors=index_progress.errors,
-            )
             timeout = time.time() + 60
             timeout_reached = False
-            while (
-                streamer.state.lower() not in ("ready", "success")
-                and not timeout_reached
-            ):
+            while not self._indexing_done(streamers) and not timeout_reached:
                 if time.time() > timeout:
                     ConsoleConfig.warning(
                         "Indexing did not complete within 60 seconds - the timeline will continue to be indexed in the background"
@@ -144,3 +238,106 @@ class TSIngest:
             ConsoleConfig.warning(
                 f"Encountered {progress.errors} errors during ingestion"
             )
+
+    def _configure_streamer(self, streamer: Any) -> None:
+        streamer.set_sketch(self.my_sketch)
+        streamer.set_timeline_name(self.timeline_name)
+        streamer.set_provider("thor2ts")
+        streamer.set_upload_context(self.timeline_name)
+        streamer.set_entry_threshold(sys.maxsize)
+        if self.index_name:
+            streamer.set_index_name(self.index_name)
+
+    def _restore_checkpoint(self) -> Optional[Callable[[int], None]]:
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return None
+        details: Dict[str, Any] = {
+            "sketch_id": int(self.my_sketch.id),
+            "timeline": self.timeline_name,
+        }
+        if self.uploaders > 1:
+            checkpoint.register(self.CHECKPOINT_SINK, resumable=False, **details)
+            ConsoleConfig.warning(
+                "Ingestion with several uploaders is not checkpointed and cannot be resumed"
+            )
+            return None
+        state = checkpoint.register(self.CHECKPOINT_SINK, **details)
+        self.ingested = state["events"]
+        self.index_name = state.get("index") or uuid.uuid4().hex
+        if checkpoint.resuming:
+            ConsoleConfig.info(
+                f"Resuming timeline '{self.timeline_name}' after '{self.ingested}' ingested events"
+            )
+
+        def on_flush(events: int) -> None:
+            checkpoint.commit(self.CHECKPOINT_SINK, events, index=self.index_name)
+
+        return on_flush
+
+    def _upload_events(
+        self, events: Iterator[Dict[str, Any]], progress: ProgressBar
+    ) -> List[Any]:
+        batches: "Queue[EventBatch]" = Queue(
+            maxsize=max(1, self.queue_size // self.batch_size)
+        )
+        on_flush = self._restore_checkpoint()
+        if self.checkpoint is not None:
+            events = self.checkpoint.skip(self.CHECKPOINT_SINK, events)
+        uploaders = [
+            _Uploader(
+                self._configure_streamer,
+                batches,
+                progress,
+                threshold=self.buffer_size or DEFAULT_TS_BUFFER_SIZE,
+                on_flush=on_flush,
+                consumed=self.ingested,
+                flush_interval=self.flush_interval,
+            )
+            for _ in range(self.uploaders)
+        ]
+        for uploader in uploaders:
+            uploader.start()
+        try:
+            batch: List[Dict[str, Any]] = []
+            for event in events:
+                batch.append(event)
+                if len(batch) >= self.batch_size:
+                    self._enqueue(batches, batch, uploaders)
+                    batch = []
+            if batch:
+                self._enqueue(batches, batch, uploaders)
+        finally:
+            for _ in uploaders:
+                self._enqueue(batches, None, uploaders, raise_errors=False)
+            for uploader in uploaders:
+                uploader.join()
+        for uploader in uploaders:
+            if uploader.error is not None:
+                raise uploader.error
+        return [uploader.streamer for uploader in uploaders if uploader.received]
+
+    def _enqueue(
+        self,
+        batches: "Queue[EventBatch]",
+        batch: EventBatch,
+        uploaders: List[_Uploader],
+        raise_errors: bool = True,
+    ) -> None:
+        while any(uploader.is_alive() for uploader in uploaders):
+            try:
+                batches.put(batch, timeout=0.1)
+                return
+            except Full:
+                continue
+        if not raise_errors:
+            return
+        for uploader in uploaders:
+            if uploader.error is not None:
+                raise uploader.error
+        raise TimesketchError("Timesketch uploaders stopped unexpectedly")
+
+    def _indexing_done(self, streamers: List[Any]) -> bool:
+        return all(
+            streamer.state.lower() in ("ready", "success") for streamer in streamers
+        )
@@ -0,0 +1,207 @@
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+from rich.table import Table
+from rich.text import Text
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.exceptions import ProcessingError, TimesketchError
+from thor2timesketch.output.output_writer import OutputWriter
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.utils.json_codec import JsonCodec
+from thor2timesketch.utils.progress_bar import ProgressBar
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+from thor2timesketch.utils.stage_profiler import StageProfiler, StageTotals
+from thor2timesketch.utils.thor_finding_id import ThorFindingId
+
+
+class BatchSettings(NamedTuple):
+    filter_path: Optional[Path] = None
+    sketch: Optional[str] = None
+    buffer_size: Optional[int] = None
+    uploaders: Optional[int] = None
+    upload_queue_size: Optional[int] = None
+    output_compression: Optional[str] = None
+    output_max_size: Optional[int] = None
+    output_max_events: Optional[int] = None
+
+
+class FileResult(NamedTuple):
+    input_file: Path
+    output_file: Optional[Path]
+    events: int
+    seconds: float
+    error: Optional[str] = None
+    profile: Optional[StageTotals] = None
+
+
+class _FileWorker:
+
+    def __init__(self, settings: BatchSettings) -> None:
+        self.settings = settings
+        self.transformer = JsonTransformer()
+        self.ts_client: Any = None
+        self.events = 0
+
+    def convert(self, input_file: Path, output_file: Optional[Path]) -> FileResult:
+        started = time.perf_counter()
+        self.events = 0
+        error: Optional[str] = None
+        try:
+            if self.settings.sketch and self.ts_client is None:
+                from timesketch_api_client import config as timesketch_config
+
+                self.ts_client = timesketch_config.get_client()
+            events = self.transformer.transform_thor_logs(
+                input_file, self.settings.filter_path
+            )
+            OutputWriter(
+                input_file,
+                output_file,
+                self.settings.sketch,
+                self.settings.buffer_size,
+                uploaders=self.settings.uploaders,
+                upload_queue_size=self.settings.upload_queue_size,
+                output_compression=self.settings.output_compression,
+                output_max_size=self.settings.output_max_size,
+                output_max_events=self.settings.output_max_events,
+                ts_client=self.ts_client,
+            ).write(self._count(events))
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        profile = StageProfiler.collect() if StageProfiler.enabled else None
+        return FileResult(
+            input_file,
+            output_file,
+            self.events,
+            time.perf_counter() - started,
+            error,
+            profile,
+        )
+
+    def _count(self, events: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for event in events:
+            self.events += 1
+            yield event
+
+
+_worker: Optional[_FileWorker] = None
+
+
+def _init_worker(
+    settings: BatchSettings,
+    min_level: int,
+    json_backend: str,
+    learn_timestamp_paths: bool,
+    deterministic_ids: bool,
+    id_salt: str,
+    profile: bool,
+) -> None:
+    global _worker
+    ConsoleConfig.min_level = max(min_level, ConsoleConfig.LEVELS["WARNING"])
+    ProgressBar.enabled = False
+    JsonCodec.configure(json_backend)
+    RegexTimestampExtractor.configure_path_index(learn_timestamp_paths)
+    ThorFindingId.configure(deterministic_ids, id_salt)
+    if profile:
+        StageProfiler.enable()
+        StageProfiler.reset()
+    _worker = _FileWorker(settings)
+
+
+def _convert_file(input_file: Path, output_file: Optional[Path]) -> FileResult:
+    if _worker is None:
+        raise ProcessingError("File worker has not been initialized")
+    return _worker.convert(input_file, output_file)
+
+
+class BatchConverter:
+
+    def __init__(self, settings: BatchSettings, workers: Optional[int] = None) -> None:
+        self.settings = settings
+        self.workers = workers or os.cpu_count() or 1
+
+    def convert(
+        self, input_files: List[Path], output_files: Optional[List[Path]] = None
+    ) -> List[FileResult]:
+        settings = self.resolve_sketch(input_files[0])
+        outputs: List[Optional[Path]] = (
+            list(output_files) if output_files else [None] * len(input_files)
+        )
+        workers = min(self.workers, len(input_files))
+        ConsoleConfig.info(
+            f"Converting '{len(input_files)}' files with {workers} worker processes"
+        )
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                settings,
+                ConsoleConfig.min_level,
+                JsonCodec.backend,
+                RegexTimestampExtractor.learn_paths,
+                ThorFindingId.deterministic,
+                ThorFindingId.salt,
+                StageProfiler.enabled,
+            ),
+        )
+        results: Dict[Path, FileResult] = {}
+        try:
+            futures: List["Future[FileResult]"] = [
+                executor.submit(_convert_file, input_file, output_file)
+                for input_file, output_file in zip(input_files, outputs)
+            ]
+            with ProgressBar(
+                f"Converted 0/{len(input_files)} files ...", show_input=False
+            ) as progress:
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.input_file] = result
+                    if result.profile:
+                        StageProfiler.merge(result.profile)
+                    if result.error is not None:
+                        ConsoleConfig.error(
+                            f"Failed to convert '{result.input_file}': {result.error}"
+                        )
+                    progress.advance(step=result.events, error=int(bool(result.error)))
+                    progress.update_description(
+                        f"Converted {len(results)}/{len(input_files)} files ..."
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return [results[input_file] for input_file in input_files]
+
+    def resolve_sketch(self, input_file: Path) -> BatchSettings:
+        if not self.settings.sketch:
+            return self.settings
+        from thor2timesketch.output.ts_ingest import TSIngest
+
+        sketch = TSIngest(input_file, self.settings.sketch).my_sketch
+        if sketch is None or not hasattr(sketch, "id"):
+            raise TimesketchError(f"Failed to load sketch '{self.settings.sketch}'")
+        return self.settings._replace(sketch=str(sketch.id))
+
+    @staticmethod
+    def print_summary(
+        results: List[FileResult], title: str = "thor2ts batch conversion"
+    ) -> None:
+        table = Table(title=title, title_justify="left")
+        for column in ("file", "events", "seconds", "events/s", "result"):
+            table.add_column(
+                column, justify="left" if column in ("file", "result") else "right"
+            )
+        for result in results:
+            rate = result.events / result.seconds if result.seconds else 0.0
+            table.add_row(
+                str(result.input_file),
+                f"{result.events:,}",
+                f"{result.seconds:.2f}",
+                f"{rate:,.0f}",
+                (
+                    Text(result.error, style=ConsoleConfig.LEVEL_STYLES["ERROR"])
+                    if result.error is not None
+                    else Text(str(result.output_file or "ingested"))
+                ),
+            )
+        ConsoleConfig.console.print(table)
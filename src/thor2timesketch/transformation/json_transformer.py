@@ -1,77 +1,214 @@
 import os
-from typing import Dict, Any, Iterator, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from thor2timesketch.config.filter_findings import FilterFindings
-from thor2timesketch.constants import MB_CONVERTER
+from thor2timesketch.config.line_prefilter import LinePrefilter
+from thor2timesketch.constants import MB_CONVERTER, PIPELINE_BATCH_SIZE
 from thor2timesketch.config.console_config import ConsoleConfig
 from thor2timesketch.exceptions import (
     ProcessingError,
-    VersionError,
     FilterConfigError,
     FileValidationError,
+    InputError,
 )
+from thor2timesketch.input.file_follower import FileFollower
 from thor2timesketch.input.json_reader import JsonReader
+from thor2timesketch.input.line_reader import RawLine
+from thor2timesketch.input.stream_decompressor import StreamDecompressor
 from thor2timesketch.mappers.json_log_version import JsonLogVersion
-from thor2timesketch.mappers.mapper_json_base import MapperJsonBase
-from thor2timesketch.mappers.mapper_loader import load_all_mappers
+from thor2timesketch.output.checkpoint import CheckpointTracker
 from thor2timesketch.transformation.pretransformation_processor import (
     PreTransformationProcessor,
 )
+from thor2timesketch.utils.progress_bar import ProgressBar
 from pathlib import Path
 
 
 class JsonTransformer:
 
-    def __init__(self) -> None:
-        load_all_mappers()
+    def __init__(
+        self,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+        follower: Optional[FileFollower] = None,
+    ) -> None:
         self.reader = JsonReader()
         self.version_mapper = JsonLogVersion()
+        self.batch_size = batch_size
+        self.follower = follower
 
     def transform_thor_logs(
-        self, input_file: Path, filter_path: Optional[Path]
+        self,
+        input_file: Path,
+        filter_path: Optional[Path],
+        checkpoint: Optional[CheckpointTracker] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        for batch in self.transform_thor_log_batches(
+            input_file, filter_path, checkpoint
+        ):
+            yield from batch
+
+    def transform_thor_log_batches(
+        self,
+        input_file: Path,
+        filter_path: Optional[Path],
+        checkpoint: Optional[CheckpointTracker] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        selectors, pre_transform = self._read_filters(filter_path)
+        if self.follower is None:
+            valid_file = self.reader.validate_input(input_file)
+        elif checkpoint is not None:
+            raise InputError("Following an input file cannot be checkpointed")
+        else:
+            valid_file = self.check_followable(input_file)
+        self._log_start(valid_file)
+        self._track_input(valid_file, checkpoint)
+        batches = self._transform_file(
+            valid_file, filter_path, selectors, pre_transform, checkpoint
+        )
+        yield from checkpoint.track_batches(batches) if checkpoint else batches
+        self._log_end(valid_file)
+
+    def transform_received_logs(
+        self,
+        source: str,
+        lines: Iterator[Optional[RawLine]],
+        filter_path: Optional[Path],
     ) -> Iterator[Dict[str, Any]]:
+        selectors, pre_transform = self._read_filters(filter_path)
+        prefilter = self._line_prefilter(selectors)
+        json_batches = self.reader.receive_valid_batches(
+            source,
+            lines,
+            prefilter.accepts if prefilter is not None else None,
+            self.batch_size,
+        )
+
+        def skip(error: ProcessingError) -> None:
+            ConsoleConfig.warning(f"Skipped a log received from '{source}': {error}")
+
+        for entries in json_batches:
+            yield from self._transform_batch(entries, selectors, pre_transform, skip)
+
+    def _read_filters(
+        self, filter_path: Optional[Path]
+    ) -> Tuple[FilterFindings, PreTransformationProcessor]:
         try:
             selectors = FilterFindings.read_filters_yaml(filter_path)
             pre_transform = PreTransformationProcessor(filter_path)
         except FilterConfigError as e:
             raise FileValidationError(f"Error reading filter configuration: {e}") from e
+        return selectors, pre_transform
 
-        raw_lines = self.reader.get_valid_data(input_file)
-        self._log_start(input_file)
-        yield from self._generate_events(raw_lines, selectors, pre_transform)
-        self._log_end(input_file)
-
-    def _generate_events(
+    def _transform_file(
         self,
-        events: Iterator[Dict[str, Any]],
+        valid_file: Path,
+        filter_path: Optional[Path],
         selectors: FilterFindings,
         pre_transform: PreTransformationProcessor,
-    ) -> Iterator[Dict[str, Any]]:
-        for entry in events:
-            try:
-                logs = pre_transform.transformation(entry)
-            except FilterConfigError as e:
-                raise ProcessingError("Error in pre-transformation processing") from e
-            for json_log in logs:
-                try:
-                    mapper = self.version_mapper.get_mapper_for_version(json_log)
-                except VersionError as e:
-                    raise ProcessingError(f"Error detecting log version: {e}") from e
-
-                if self._is_eligible(json_log, mapper, selectors):
-                    yield from mapper.map_thor_events(json_log)
-
-    def _is_eligible(
+        checkpoint: Optional[CheckpointTracker] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        prefilter = self._line_prefilter(selectors)
+        accepts = prefilter.accepts if prefilter is not None else None
+        if self.follower is not None:
+            json_batches = self.reader.follow_valid_batches(
+                valid_file, self.follower, accepts, self.batch_size
+            )
+        elif checkpoint is None:
+            json_batches = self.reader.read_valid_batches(
+                valid_file, prefilter=accepts, batch_size=self.batch_size
+            )
+        else:
+            json_batches = self.reader.read_valid_batches(
+                valid_file,
+                checkpoint.start.offset,
+                checkpoint.start.line,
+                checkpoint.mark,
+                accepts,
+                self.batch_size,
+            )
+        for entries in json_batches:
+            events = self._transform_batch(entries, selectors, pre_transform)
+            if events:
+                yield events
+        if prefilter is not None:
+            ConsoleConfig.debug(
+                f"Prefilter skipped '{prefilter.skipped}' lines before decoding"
+            )
+
+    def check_followable(self, input_file: Path) -> Path:
+        valid_file = self.reader.validate_input(input_file, allow_empty=True)
+        if StreamDecompressor.detect(valid_file) is not None:
+            raise InputError(f"Cannot follow compressed input file '{valid_file}'")
+        return valid_file
+
+    def _track_input(
+        self, valid_file: Path, checkpoint: Optional[CheckpointTracker]
+    ) -> None:
+        if self.follower is not None:
+            ProgressBar.track_input(0)
+            return
+        start = 0
+        if checkpoint is not None and StreamDecompressor.detect(valid_file) is None:
+            start = checkpoint.start.offset
+        ProgressBar.track_input(valid_file.stat().st_size, start)
+
+    def _line_prefilter(self, selectors: FilterFindings) -> Optional[LinePrefilter]:
+        if not (selectors.levels or selectors.modules):
+            return None
+        return LinePrefilter.compile(
+            selectors,
+            JsonLogVersion.PREFILTER_VERSIONS,
+            JsonLogVersion.PREFILTER_LEVEL_FIELD,
+            JsonLogVersion.PREFILTER_MODULE_FIELD,
+        )
+
+    def _transform_batch(
         self,
-        json_log: Dict[str, Any],
-        mapper: MapperJsonBase,
+        entries: List[Dict[str, Any]],
         selectors: FilterFindings,
-    ) -> bool:
-        if not mapper.requires_filter():
-            return True
-        level, module = mapper.get_filterable_fields(json_log)
-        return selectors.matches_filter_criteria(level, module)
+        pre_transform: PreTransformationProcessor,
+        on_error: Optional[Callable[[ProcessingError], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        json_logs = pre_transform.transformation_batch(
+            entries,
+            on_error=self._stage_error(
+                "Error in pre-transformation processing", on_error
+            ),
+        )
+        groups = self.version_mapper.group_by_mapper(
+            json_logs,
+            on_error=self._stage_error("Error detecting log version", on_error),
+        )
+        events: List[Dict[str, Any]] = []
+        for mapper, logs in groups:
+            if mapper.requires_filter():
+                logs = selectors.select(mapper.get_filterable_fields, logs)
+            if not logs:
+                continue
+            if on_error is None:
+                events.extend(mapper.map_thor_events_batch(logs))
+            else:
+                events.extend(mapper.map_thor_events_batch(logs, on_error=on_error))
+        return events
+
+    @staticmethod
+    def _stage_error(
+        message: str, on_error: Optional[Callable[[ProcessingError], None]]
+    ) -> Callable[[Exception], None]:
+        def report(error: Exception) -> None:
+            processing_error = ProcessingError(f"{message}: {error}")
+            if on_error is None:
+                raise processing_error from error
+            on_error(processing_error)
+
+        return report
 
     def _log_start(self, input_file: Path) -> None:
+        if self.follower is not None:
+            ConsoleConfig.info(
+                f"Following input file `{input_file}` for new events, "
+                f"press Ctrl+C to stop"
+            )
+            return
         size = os.path.getsize(input_file) / MB_CONVERTER
         ConsoleConfig.info(
             f"Starting transforming events from input file: `{input_file}` ({size:.2f} MB)"
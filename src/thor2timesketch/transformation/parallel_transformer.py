@@ -0,0 +1,221 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.config.filter_findings import FilterFindings
+from thor2timesketch.constants import (
+    MAX_PENDING_CHUNKS_PER_WORKER,
+    WORKER_CHUNK_SIZE,
+)
+from thor2timesketch.exceptions import (
+    InputError,
+    JsonParseError,
+    JsonValidationError,
+)
+from thor2timesketch.input.file_chunker import FileChunk, FileChunker
+from thor2timesketch.input.json_validator import JsonValidator
+from thor2timesketch.input.line_reader import LineReader
+from thor2timesketch.input.stream_decompressor import StreamDecompressor
+from thor2timesketch.output.checkpoint import CheckpointTracker, ResumePoint
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.transformation.pretransformation_processor import (
+    PreTransformationProcessor,
+)
+from thor2timesketch.utils.json_codec import JsonCodec
+from thor2timesketch.utils.progress_bar import ProgressBar
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+from thor2timesketch.utils.stage_profiler import StageProfiler, StageTotals
+from thor2timesketch.utils.thor_finding_id import ThorFindingId
+
+
+class ChunkResult(NamedTuple):
+    events: List[Dict[str, Any]]
+    line_count: int
+    error: Optional[str] = None
+    profile: Optional[StageTotals] = None
+
+
+class _ChunkWorker:
+
+    def __init__(self, input_file: Path, filter_path: Optional[Path]) -> None:
+        self.input_file = input_file
+        self.json_validator = JsonValidator()
+        self.line_reader = LineReader()
+        self.transformer = JsonTransformer()
+        self.selectors = FilterFindings.read_filters_yaml(filter_path)
+        self.pre_transform = PreTransformationProcessor(filter_path)
+        self.prefilter = self.transformer._line_prefilter(self.selectors)
+
+    def transform(self, chunk: FileChunk) -> ChunkResult:
+        lines = self.line_reader.read_lines(self.input_file, chunk.start, chunk.end)
+        return self.transform_lines(line.data for line in lines)
+
+    def transform_lines(self, lines: Iterable[bytes]) -> ChunkResult:
+        json_logs: List[Dict[str, Any]] = []
+        line_count = 0
+        error: Optional[str] = None
+        for line_count, data in enumerate(lines, 1):
+            if self.prefilter is not None and not self.prefilter.accepts(data):
+                continue
+            try:
+                json_data = self.json_validator.validate_json_log(data)
+            except (JsonParseError, JsonValidationError) as e:
+                error = str(e)
+                break
+            if json_data is not None:
+                json_logs.append(json_data)
+
+        events = self.transformer._transform_batch(
+            json_logs, self.selectors, self.pre_transform
+        )
+        profile = StageProfiler.collect() if StageProfiler.enabled else None
+        return ChunkResult(
+            events=events, line_count=line_count, error=error, profile=profile
+        )
+
+
+_worker: Optional[_ChunkWorker] = None
+
+
+def _init_worker(
+    input_file: Path,
+    filter_path: Optional[Path],
+    min_level: int,
+    json_backend: str,
+    learn_timestamp_paths: bool,
+    deterministic_ids: bool,
+    id_salt: str,
+    profile: bool,
+) -> None:
+    global _worker
+    ConsoleConfig.min_level = max(min_level, ConsoleConfig.LEVELS["WARNING"])
+    JsonCodec.configure(json_backend)
+    RegexTimestampExtractor.configure_path_index(learn_timestamp_paths)
+    ThorFindingId.configure(deterministic_ids, id_salt)
+    if profile:
+        StageProfiler.enable()
+        StageProfiler.reset()
+    _worker = _ChunkWorker(input_file, filter_path)
+
+
+def _transform_chunk(chunk: FileChunk) -> ChunkResult:
+    if _worker is None:
+        raise InputError("Chunk worker has not been initialized")
+    return _worker.transform(chunk)
+
+
+def _transform_lines(lines: List[bytes]) -> ChunkResult:
+    if _worker is None:
+        raise InputError("Chunk worker has not been initialized")
+    return _worker.transform_lines(lines)
+
+
+class ParallelTransformer(JsonTransformer):
+
+    def __init__(self, workers: int, chunk_size: int = WORKER_CHUNK_SIZE) -> None:
+        super().__init__()
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.chunker = FileChunker(chunk_size)
+        self.line_reader = LineReader()
+        self.max_pending = workers * MAX_PENDING_CHUNKS_PER_WORKER
+
+    def _transform_file(
+        self,
+        valid_file: Path,
+        filter_path: Optional[Path],
+        selectors: FilterFindings,
+        pre_transform: PreTransformationProcessor,
+        checkpoint: Optional[CheckpointTracker] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        ConsoleConfig.info(f"Transforming events with {self.workers} workers")
+        start = checkpoint.start if checkpoint is not None else ResumePoint(0, 1, 0, 0)
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(
+                valid_file,
+                filter_path,
+                ConsoleConfig.min_level,
+                JsonCodec.backend,
+                RegexTimestampExtractor.learn_paths,
+                ThorFindingId.deterministic,
+                ThorFindingId.salt,
+                StageProfiler.enabled,
+            ),
+        )
+        pending: Deque[Tuple["Future[ChunkResult]", int, Optional[int]]] = deque()
+        lines_before = start.line - 1
+        try:
+            for task, payload, offset, end in self._tasks(valid_file, start.offset):
+                pending.append((executor.submit(task, payload), offset, end))
+                if len(pending) >= self.max_pending:
+                    lines_before = yield from self._emit_chunk(
+                        *pending.popleft(), lines_before, checkpoint
+                    )
+            while pending:
+                lines_before = yield from self._emit_chunk(
+                    *pending.popleft(), lines_before, checkpoint
+                )
+        finally:
+            for future, _, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _tasks(
+        self, valid_file: Path, start: int = 0
+    ) -> Iterator[Tuple[Callable[[Any], ChunkResult], Any, int, Optional[int]]]:
+        if StreamDecompressor.detect(valid_file) is None:
+            for chunk in self.chunker.split(valid_file, start):
+                yield _transform_chunk, chunk, chunk.start, chunk.end
+            return
+        ConsoleConfig.debug("Compressed input, sending decompressed lines to workers")
+        batch: List[bytes] = []
+        batch_size = 0
+        batch_start = start
+        for line in self.line_reader.read_lines(valid_file, start):
+            if not batch:
+                batch_start = line.start
+            batch.append(line.data)
+            batch_size += len(line.data) + 1
+            if batch_size >= self.chunk_size:
+                yield _transform_lines, batch, batch_start, None
+                batch = []
+                batch_size = 0
+        if batch:
+            yield _transform_lines, batch, batch_start, None
+
+    def _emit_chunk(
+        self,
+        future: "Future[ChunkResult]",
+        offset: int,
+        end: Optional[int],
+        lines_before: int,
+        checkpoint: Optional[CheckpointTracker] = None,
+    ) -> Generator[List[Dict[str, Any]], None, int]:
+        result = future.result()
+        if checkpoint is not None:
+            checkpoint.mark(offset, lines_before + 1)
+        if result.profile:
+            StageProfiler.merge(result.profile)
+        if result.events:
+            yield result.events
+        if end is not None:
+            ProgressBar.input_offset = end
+        line_num = lines_before + result.line_count
+        if result.error is not None:
+            raise InputError(f"Error parsing JSON at line {line_num}: {result.error}")
+        return line_num
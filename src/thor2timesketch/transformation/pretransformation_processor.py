@@ -1,7 +1,8 @@
-from typing import Dict, Any, Iterator, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 from thor2timesketch.constants import LOG_VERSION, AUDIT_FINDING, AUDIT_INFO
 from thor2timesketch.utils.audit_events_extractor import AuditEventsExtractor
 from thor2timesketch.config.filter_audit import FilterAudit
+from thor2timesketch.exceptions import FilterConfigError
 from pathlib import Path
 
 
@@ -13,6 +14,27 @@ class PreTransformationProcessor:
         if LOG_VERSION in valid_json:
             yield valid_json
             return
+        yield from self._audit_logs(valid_json)
+
+    def transformation_batch(
+        self,
+        valid_jsons: Iterable[Dict[str, Any]],
+        on_error: Optional[Callable[[FilterConfigError], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        json_logs: List[Dict[str, Any]] = []
+        for valid_json in valid_jsons:
+            if LOG_VERSION in valid_json:
+                json_logs.append(valid_json)
+                continue
+            try:
+                json_logs.extend(list(self._audit_logs(valid_json)))
+            except FilterConfigError as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+        return json_logs
+
+    def _audit_logs(self, valid_json: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         selector = self._audit_filter.get_audit_trail_selector(valid_json)
 
         if selector == AUDIT_FINDING:
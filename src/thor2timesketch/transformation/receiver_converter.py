@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import OUTPUT_FILE_EXTENSION
+from thor2timesketch.input.network_receiver import (
+    ListenAddress,
+    NetworkReceiver,
+    ReceivedSource,
+)
+from thor2timesketch.output.output_writer import OutputWriter
+from thor2timesketch.transformation.batch_converter import (
+    BatchConverter,
+    BatchSettings,
+    FileResult,
+)
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+
+
+class ReceiverConverter:
+
+    def __init__(
+        self,
+        addresses: List[ListenAddress],
+        settings: BatchSettings,
+        output_dir: Optional[Path] = None,
+    ) -> None:
+        self.settings = settings
+        self.output_dir = output_dir
+        self.receiver = NetworkReceiver(addresses, self._start)
+        self.ts_client: Any = None
+        self.events: "Counter[str]" = Counter()
+        self.results: Dict[str, FileResult] = {}
+        self._threads: List[threading.Thread] = []
+
+    def receive(self) -> List[FileResult]:
+        if self.settings.sketch:
+            from timesketch_api_client import config as timesketch_config
+
+            self.settings = BatchConverter(self.settings).resolve_sketch(
+                Path("thor2ts-receiver.json")
+            )
+            self.ts_client = timesketch_config.get_client()
+        ConsoleConfig.info(
+            "Waiting for THOR events, one timeline per source, press Ctrl+C to stop"
+        )
+        try:
+            self.receiver.run()
+        finally:
+            for thread in self._threads:
+                thread.join()
+        return [self.results[name] for name in sorted(self.results)]
+
+    def _start(self, source: ReceivedSource) -> None:
+        output_file = (
+            self.output_dir / f"{source.name}{OUTPUT_FILE_EXTENSION}"
+            if self.output_dir
+            else None
+        )
+        thread = threading.Thread(
+            target=self._convert,
+            args=(source, output_file),
+            name=f"thor2ts-receive-{source.name}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _convert(self, source: ReceivedSource, output_file: Optional[Path]) -> None:
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            events = JsonTransformer().transform_received_logs(
+                source.name, source.lines(), self.settings.filter_path
+            )
+            OutputWriter(
+                Path(f"{source.name}.json"),
+                output_file,
+                self.settings.sketch,
+                self.settings.buffer_size,
+                uploaders=self.settings.uploaders,
+                upload_queue_size=self.settings.upload_queue_size,
+                output_compression=self.settings.output_compression,
+                output_max_size=self.settings.output_max_size,
+                output_max_events=self.settings.output_max_events,
+                ts_client=self.ts_client,
+                follow=True,
+            ).write(self._count(source.name, events))
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            source.failed = True
+            ConsoleConfig.error(
+                f"Stopped converting events from '{source.name}': {error}"
+            )
+        self.results[source.name] = FileResult(
+            Path(source.name),
+            output_file,
+            self.events[source.name],
+            time.perf_counter() - started,
+            error,
+        )
+
+    def _count(
+        self, name: str, events: Iterator[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        for event in events:
+            self.events[name] += 1
+            yield event
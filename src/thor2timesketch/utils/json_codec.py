@@ -0,0 +1,144 @@
+import importlib
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, List, Union
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import (
+    AUTO_JSON_BACKENDS,
+    DEFAULT_ENCODING,
+    DEFAULT_JSON_BACKEND,
+    JSON_BACKENDS,
+)
+from thor2timesketch.exceptions import JsonCodecError
+
+JsonInput = Union[str, bytes]
+Loads = Callable[[JsonInput], Any]
+DumpsLine = Callable[[Any], bytes]
+DumpsSorted = Callable[[Any], bytes]
+Backend = tuple[Loads, DumpsLine, DumpsSorted]
+
+_DIGIT_TABLE = bytes(48 if 48 <= byte <= 57 else 32 for byte in range(256))
+_WIDE_INTEGER = b"0" * 20
+_WIDE_INTEGER_TEXT = re.compile(r"[0-9]{20}")
+
+
+def _json_dumps_line(obj: Any) -> bytes:
+    return (json.dumps(obj) + "\n").encode(DEFAULT_ENCODING)
+
+
+def _json_dumps_sorted(obj: Any) -> bytes:
+    return json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode(DEFAULT_ENCODING)
+
+
+def _has_wide_integer(data: JsonInput) -> bool:
+    if isinstance(data, bytes):
+        return _WIDE_INTEGER in data.translate(_DIGIT_TABLE)
+    return _WIDE_INTEGER_TEXT.search(data) is not None
+
+
+def _load_orjson() -> Backend:
+    orjson: Any = importlib.import_module("orjson")
+    option = orjson.OPT_APPEND_NEWLINE
+    sorted_option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def loads(data: JsonInput) -> Any:
+        return json.loads(data) if _has_wide_integer(data) else orjson.loads(data)
+
+    def dumps_line(obj: Any) -> bytes:
+        try:
+            data: bytes = orjson.dumps(obj, option=option)
+        except TypeError:
+            return _json_dumps_line(obj)
+        return data
+
+    def dumps_sorted(obj: Any) -> bytes:
+        try:
+            data: bytes = orjson.dumps(obj, default=str, option=sorted_option)
+        except TypeError:
+            return _json_dumps_sorted(obj)
+        return data
+
+    return loads, dumps_line, dumps_sorted
+
+
+def _load_msgspec() -> Backend:
+    msgspec_json: Any = importlib.import_module("msgspec.json")
+    encoder = msgspec_json.Encoder()
+    sorted_encoder = msgspec_json.Encoder(enc_hook=str, order="sorted")
+    decoder = msgspec_json.Decoder()
+
+    def dumps_line(obj: Any) -> bytes:
+        data: bytes = encoder.encode(obj)
+        return data + b"\n"
+
+    def dumps_sorted(obj: Any) -> bytes:
+        try:
+            data: bytes = sorted_encoder.encode(obj)
+        except TypeError:
+            return _json_dumps_sorted(obj)
+        return data
+
+    return decoder.decode, dumps_line, dumps_sorted
+
+
+def _load_json() -> Backend:
+    return json.loads, _json_dumps_line, _json_dumps_sorted
+
+
+class JsonCodec:
+    _loaders: Dict[str, Callable[[], Backend]] = {
+        "orjson": _load_orjson,
+        "msgspec": _load_msgspec,
+        "json": _load_json,
+    }
+
+    backend: str = "json"
+    _loads: Loads = json.loads
+    _dumps_line: DumpsLine = _json_dumps_line
+    _dumps_sorted: DumpsSorted = _json_dumps_sorted
+
+    @classmethod
+    def configure(cls, backend: str = DEFAULT_JSON_BACKEND) -> str:
+        backend = backend.lower()
+        if backend not in JSON_BACKENDS:
+            raise JsonCodecError(
+                f"Unknown JSON backend '{backend}'. Expected one of: {JSON_BACKENDS}"
+            )
+        candidates = AUTO_JSON_BACKENDS if backend == "auto" else [backend]
+        for candidate in candidates:
+            try:
+                loads, dumps_line, dumps_sorted = cls._loaders[candidate]()
+            except ImportError:
+                ConsoleConfig.debug(f"JSON backend '{candidate}' is not installed")
+                continue
+            cls.backend = candidate
+            cls._loads = loads
+            cls._dumps_line = dumps_line
+            cls._dumps_sorted = dumps_sorted
+            ConsoleConfig.debug(f"Using JSON backend '{candidate}'")
+            return candidate
+        raise JsonCodecError(
+            f"JSON backend '{backend}' is not installed. "
+            f"Install it or use '--json-backend json'"
+        )
+
+    @classmethod
+    def loads(cls, data: JsonInput) -> Any:
+        return cls._loads(data)
+
+    @classmethod
+    def dumps_line(cls, obj: Any) -> bytes:
+        return cls._dumps_line(obj)
+
+    @classmethod
+    def dumps_sorted(cls, obj: Any) -> bytes:
+        return cls._dumps_sorted(obj)
+
+    @classmethod
+    def dumps_lines(cls, objs: Iterable[Any]) -> List[bytes]:
+        return list(map(cls._dumps_line, objs))
+
+
+JsonCodec.configure()
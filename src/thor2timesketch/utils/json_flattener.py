@@ -1,34 +1,61 @@
-from typing import Any, Dict
-from collections import deque
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Tuple
 from thor2timesketch.config.console_config import ConsoleConfig
-from thor2timesketch.constants import DELIMITER
+from thor2timesketch.constants import DELIMITER, FLATTEN_PLAN_CACHE_SIZE
 from thor2timesketch.exceptions import FlattenJsonError
 
 
 class JSONFlattener:
+    _key_plans: Dict[Tuple[str, Tuple[Hashable, ...]], Tuple[Any, ...]] = {}
+
+    @classmethod
+    def _flat_keys(cls, path: str, keys: Tuple[Hashable, ...]) -> Tuple[Any, ...]:
+        plan = (path, keys)
+        flat_keys = cls._key_plans.get(plan)
+        if flat_keys is None:
+            if len(cls._key_plans) >= FLATTEN_PLAN_CACHE_SIZE:
+                cls._key_plans.clear()
+            flat_keys = tuple(
+                sys.intern(f"{path}{DELIMITER}{key}") if path else key for key in keys
+            )
+            cls._key_plans[plan] = flat_keys
+        return flat_keys
 
     @staticmethod
-    def _is_list_of_dicts(value: Any) -> bool:
-        return isinstance(value, list) and bool(value) and isinstance(value[0], dict)
+    @lru_cache(maxsize=FLATTEN_PLAN_CACHE_SIZE)
+    def _index_keys(path: str, count: int) -> Tuple[str, ...]:
+        return tuple(
+            sys.intern(f"{path}{DELIMITER}{index}") for index in range(1, count + 1)
+        )
 
     @staticmethod
     def flatten_json(json_line: Dict[str, Any]) -> Dict[str, Any]:
         flattened: Dict[str, Any] = {}
-        queue = deque([(json_line, "")])
+        root = json_line if isinstance(json_line, dict) else {"": json_line}
+        level: List[Tuple[Dict[Any, Any], str]] = [(root, "")]
+        key_plans = JSONFlattener._key_plans
         try:
-            while queue:
-                current, path = queue.popleft()
-                if isinstance(current, dict):
-                    for key, value in current.items():
-                        new_key = f"{path}{DELIMITER}{key}" if path else key
-                        queue.append((value, new_key))
-                elif JSONFlattener._is_list_of_dicts(current):
-                    for index, item in enumerate(current, start=1):
-                        key = f"{path}{DELIMITER}{index}"
-                        flattened[key] = item
-                else:
-                    flattened[path] = current
+            while level:
+                next_level: List[Tuple[Dict[Any, Any], str]] = []
+                for current, path in level:
+                    keys = tuple(current)
+                    flat_keys = key_plans.get((path, keys))
+                    if flat_keys is None:
+                        flat_keys = JSONFlattener._flat_keys(path, keys)
+                    for key, value in zip(flat_keys, current.values()):
+                        if isinstance(value, dict):
+                            next_level.append((value, key))
+                        elif isinstance(value, list) and value:
+                            if isinstance(value[0], dict):
+                                index_keys = JSONFlattener._index_keys(key, len(value))
+                                flattened.update(zip(index_keys, value))
+                            else:
+                                flattened[key] = value
+                        else:
+                            flattened[key] = value
+                level = next_level
         except Exception as e:
             raise FlattenJsonError(f"Error flattening JSON: {e}")
-        ConsoleConfig.debug(f"Successfully flattened JSON: '{flattened}'")
+        ConsoleConfig.debug(lambda: f"Successfully flattened JSON: '{flattened}'")
         return flattened
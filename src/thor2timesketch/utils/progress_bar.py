@@ -1,20 +1,87 @@
+import threading
 from types import TracebackType
-from typing import Optional, Type
+from typing import ClassVar, List, Optional, Type
 from rich.progress import Progress, SpinnerColumn, TextColumn, ProgressColumn, Task
 from rich.text import Text
 from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import PROGRESS_REFRESH_PER_SECOND
+
+
+def _clock(seconds: float) -> str:
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
 
 
 class ElapsedColumn(ProgressColumn):
     def render(self, task: Task) -> Text:
-        elapsed = task.elapsed or 0
-        m, s = divmod(int(elapsed), 60)
-        return Text(f"{m:02d}:{s:02d}", style=ConsoleConfig.LEVEL_STYLES["INFO"])
+        return Text(_clock(task.elapsed or 0), style=ConsoleConfig.LEVEL_STYLES["INFO"])
+
+
+class CounterColumn(ProgressColumn):
+    def __init__(self, template: str, counter: str, style: str) -> None:
+        super().__init__()
+        self.template = template
+        self.counter = counter
+        self.style = style
+
+    def render(self, task: Task) -> Text:
+        bar = task.fields["bar"]
+        return Text(self.template.format(getattr(bar, self.counter)), style=self.style)
+
+
+class InputColumn(ProgressColumn):
+    def render(self, task: Task) -> Text:
+        if not task.fields["bar"].show_input or not ProgressBar.input_size:
+            return Text("")
+        offset = min(ProgressBar.input_offset, ProgressBar.input_size)
+        text = f"{offset * 100 // ProgressBar.input_size}%"
+        done = offset - ProgressBar.input_start
+        if done > 0 and task.elapsed:
+            remaining = task.elapsed * (ProgressBar.input_size - offset) / done
+            text += f" • ETA {_clock(remaining)}"
+        return Text(text, style=ConsoleConfig.LEVEL_STYLES["INFO"])
 
 
 class ProgressBar:
-    def __init__(self, description: str):
-        columns = [
+    enabled: ClassVar[bool] = True
+    input_size: ClassVar[int] = 0
+    input_start: ClassVar[int] = 0
+    input_offset: ClassVar[int] = 0
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _shared_progress: ClassVar[Optional[Progress]] = None
+    _active_bars: ClassVar[int] = 0
+
+    def __init__(self, description: str, show_input: bool = True):
+        self.processed: int = 0
+        self.errors: int = 0
+        self.show_input = show_input
+        self._counter_lock = threading.Lock()
+        self.progress = self._get_shared_progress()
+        self.task_id = self.progress.add_task(description, bar=self)
+
+    @classmethod
+    def track_input(cls, size: int, start: int = 0) -> None:
+        cls.input_size = size
+        cls.input_start = cls.input_offset = start
+
+    @classmethod
+    def _get_shared_progress(cls) -> Progress:
+        with cls._lock:
+            if cls._shared_progress is None:
+                cls._shared_progress = Progress(
+                    *cls._columns(),
+                    console=ConsoleConfig.console,
+                    redirect_stdout=False,
+                    redirect_stderr=False,
+                    transient=True,
+                    refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+                )
+            return cls._shared_progress
+
+    @staticmethod
+    def _columns() -> List[ProgressColumn]:
+        return [
             TextColumn(" " * 22),
             ElapsedColumn(),
             SpinnerColumn(
@@ -23,28 +90,18 @@ class ProgressBar:
             TextColumn(
                 "   {task.description}", style=ConsoleConfig.LEVEL_STYLES["INFO"]
             ),
-            TextColumn(
-                "{task.completed} processed",
-                style=ConsoleConfig.LEVEL_STYLES["SUCCESS"],
-            ),
-            TextColumn(
-                "• {task.fields[errors]} errors",
-                style=ConsoleConfig.LEVEL_STYLES["ERROR"],
+            CounterColumn(
+                "{} processed", "processed", ConsoleConfig.LEVEL_STYLES["SUCCESS"]
             ),
+            CounterColumn("• {} errors", "errors", ConsoleConfig.LEVEL_STYLES["ERROR"]),
+            InputColumn(),
         ]
-        self.processed: int = 0
-        self.errors: int = 0
-        self.progress = Progress(
-            *columns,
-            console=ConsoleConfig.console,
-            redirect_stdout=False,
-            redirect_stderr=False,
-            transient=True,
-        )
-        self.task_id = self.progress.add_task(description, completed=0, errors=0)
 
     def __enter__(self) -> "ProgressBar":
-        self.progress.start()
+        with ProgressBar._lock:
+            if ProgressBar._active_bars == 0 and ProgressBar.enabled:
+                self.progress.start()
+            ProgressBar._active_bars += 1
         return self
 
     def __exit__(
@@ -53,12 +110,16 @@ class ProgressBar:
         exception_value: Optional[BaseException],
         exception_traceback: Optional[TracebackType],
     ) -> None:
-        self.progress.stop()
+        with ProgressBar._lock:
+            self.progress.remove_task(self.task_id)
+            ProgressBar._active_bars -= 1
+            if ProgressBar._active_bars == 0:
+                self.progress.stop()
 
     def advance(self, step: int = 1, error: int = 0) -> None:
-        self.processed += step
-        self.errors += error
-        self.progress.update(self.task_id, completed=self.processed, errors=self.errors)
+        with self._counter_lock:
+            self.processed += step
+            self.errors += error
 
     def update_description(self, description: str) -> None:
         self.progress.update(self.task_id, description=description)
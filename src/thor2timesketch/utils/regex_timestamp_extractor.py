@@ -1,19 +1,29 @@
 import re
 from collections import deque
-from datetime import timezone
-from typing import Dict, Any, List, Tuple
-from dateutil import parser
+from typing import Dict, Any, List, Optional, Tuple
 from thor2timesketch.constants import ISO8601_PATTERN
 from thor2timesketch.config.console_config import ConsoleConfig
 from thor2timesketch.exceptions import TimestampError
 from thor2timesketch.utils.datetime_field import DatetimeField
 from thor2timesketch.utils.timestamp_extractor import TimestampExtractor
+from thor2timesketch.utils.timestamp_normalizer import TimestampNormalizer
+from thor2timesketch.utils.timestamp_path_index import (
+    TimestampPath,
+    TimestampPathIndex,
+)
 
 
 class RegexTimestampExtractor(TimestampExtractor):
+    ISO8601 = re.compile(ISO8601_PATTERN, re.IGNORECASE)
+    learn_paths: bool = False
 
     def __init__(self) -> None:
-        self.ISO8601 = re.compile(ISO8601_PATTERN, re.IGNORECASE)
+        self.path_index = TimestampPathIndex()
+
+    @classmethod
+    def configure_path_index(cls, learn_paths: bool) -> None:
+        cls.learn_paths = learn_paths
+        ConsoleConfig.debug(f"Learned timestamp paths enabled: {learn_paths}")
 
     def extract(self, data_json: Dict[str, Any]) -> List[DatetimeField]:
 
@@ -21,39 +31,85 @@ class RegexTimestampExtractor(TimestampExtractor):
             raise TimestampError(
                 "Received an empty THOR log as input for timestamp extractor."
             )
+        if not self.learn_paths:
+            return self._scan(data_json)
+
+        signature = self.path_index.signature(data_json)
+        paths = self.path_index.get(signature)
+        if paths is not None:
+            timestamps = self._extract_paths(data_json, paths)
+            if timestamps is not None:
+                return timestamps
+        located: List[TimestampPath] = []
+        timestamps = self._scan(data_json, located)
+        self.path_index.learn(signature, located)
+        return timestamps
 
+    def _extract_paths(
+        self, data_json: Dict[str, Any], paths: Tuple[TimestampPath, ...]
+    ) -> Optional[List[DatetimeField]]:
         timestamps: List[DatetimeField] = []
-        queue: deque[Tuple[Dict[str, Any], str]] = deque([(data_json, "")])
+        debug_enabled = ConsoleConfig.is_enabled("DEBUG")
+        try:
+            for path, keys in paths:
+                try:
+                    log_value = self.path_index.resolve(data_json, keys)
+                except (KeyError, IndexError, TypeError):
+                    return None
+                if isinstance(log_value, str) and self.ISO8601.match(log_value):
+                    timestamps.append(
+                        self._to_datetime_field(log_value, path, debug_enabled)
+                    )
+        except Exception as e:
+            raise TimestampError(f"Unexpected error during timestamp extraction: {e}")
+        return timestamps
+
+    def _scan(
+        self, data_json: Dict[str, Any], located: Optional[List[TimestampPath]] = None
+    ) -> List[DatetimeField]:
+        timestamps: List[DatetimeField] = []
+        debug_enabled = ConsoleConfig.is_enabled("DEBUG")
+        keys: Optional[Tuple[Any, ...]] = () if located is not None else None
+        queue: deque[Tuple[Any, str, Optional[Tuple[Any, ...]]]] = deque(
+            [(data_json, "", keys)]
+        )
 
         try:
             while queue:
-                log_json, path = queue.popleft()
+                log_json, path, keys = queue.popleft()
 
                 if isinstance(log_json, dict):
                     for log_field, log_value in log_json.items():
                         new_path = f"{path} {log_field}" if path else log_field
-                        queue.append((log_value, new_path))
+                        new_keys = keys + (log_field,) if keys is not None else None
+                        queue.append((log_value, new_path, new_keys))
                 elif isinstance(log_json, list):
-                    for log_value in log_json:
-                        queue.append((log_value, path))
+                    for index, log_value in enumerate(log_json):
+                        new_keys = keys + (index,) if keys is not None else None
+                        queue.append((log_value, path, new_keys))
                 else:
                     if isinstance(log_json, str) and self.ISO8601.match(log_json):
-                        try:
-                            parsed_date = parser.isoparse(log_json)
-                            if parsed_date.tzinfo is None:
-                                parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-                            iso_data = parsed_date.isoformat()
-                            ConsoleConfig.debug(
-                                f"Found ISO8601 date {iso_data} at path {path}"
-                            )
-                            timestamps.append(
-                                DatetimeField(path=path, datetime=iso_data)
-                            )
-                        except (ValueError, TypeError) as e:
-                            raise TimestampError(
-                                f"Error parsing date '{log_json}' at path '{path}': {e}"
-                            )
+                        timestamps.append(
+                            self._to_datetime_field(log_json, path, debug_enabled)
+                        )
+                        if located is not None and keys is not None:
+                            located.append(TimestampPath(path, keys))
+                    elif log_json in (None, "") and located is not None and keys:
+                        located.append(TimestampPath(path, keys))
 
         except Exception as e:
             raise TimestampError(f"Unexpected error during timestamp extraction: {e}")
         return timestamps
+
+    def _to_datetime_field(
+        self, log_value: str, path: str, debug_enabled: bool
+    ) -> DatetimeField:
+        try:
+            iso_data = TimestampNormalizer.normalize(log_value)
+        except (ValueError, TypeError) as e:
+            raise TimestampError(
+                f"Error parsing date '{log_value}' at path '{path}': {e}"
+            )
+        if debug_enabled:
+            ConsoleConfig.debug(f"Found ISO8601 date {iso_data} at path {path}")
+        return DatetimeField(path=path, datetime=iso_data)
@@ -0,0 +1,428 @@
+import functools
+import importlib
+import inspect
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from rich.table import Table
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.exceptions import OutputError
+
+StageTotals = Dict[str, Tuple[int, int, float, float]]
+ItemCounter = Callable[[Tuple[Any, ...], Any], int]
+
+
+def _result_items(args: Tuple[Any, ...], result: Any) -> int:
+    return len(result) if isinstance(result, list) else 1
+
+
+def _no_items(args: Tuple[Any, ...], result: Any) -> int:
+    return 0
+
+
+def _batch_items(args: Tuple[Any, ...], result: Any) -> int:
+    return len(args[-1])
+
+
+class _StageStats:
+    __slots__ = ("calls", "cpu", "items", "wall")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.items = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def add(self, calls: int, items: int, wall: float, cpu: float) -> None:
+        self.calls += calls
+        self.items += items
+        self.wall += wall
+        self.cpu += cpu
+
+    def totals(self) -> Tuple[int, int, float, float]:
+        return self.calls, self.items, self.wall, self.cpu
+
+
+class _ThreadState:
+    def __init__(self) -> None:
+        self.stack: List[List[float]] = []
+        self.stages: Dict[str, _StageStats] = {}
+
+
+class StageProfiler:
+    TARGETS: List[Tuple[str, str, str, str, ItemCounter]] = [
+        (
+            "transform",
+            "thor2timesketch.transformation.json_transformer",
+            "JsonTransformer",
+            "transform_thor_logs",
+            _result_items,
+        ),
+        (
+            "read",
+            "thor2timesketch.input.line_reader",
+            "LineReader",
+            "read_lines",
+            _result_items,
+        ),
+        (
+            "prefilter",
+            "thor2timesketch.config.line_prefilter",
+            "LinePrefilter",
+            "accepts",
+            _result_items,
+        ),
+        (
+            "json_loads",
+            "thor2timesketch.utils.json_codec",
+            "JsonCodec",
+            "loads",
+            _result_items,
+        ),
+        (
+            "validate",
+            "thor2timesketch.input.json_validator",
+            "JsonValidator",
+            "validate_json_log",
+            _result_items,
+        ),
+        (
+            "pretransform",
+            "thor2timesketch.transformation.pretransformation_processor",
+            "PreTransformationProcessor",
+            "transformation_batch",
+            _result_items,
+        ),
+        (
+            "version",
+            "thor2timesketch.mappers.json_log_version",
+            "JsonLogVersion",
+            "group_by_mapper",
+            _batch_items,
+        ),
+        (
+            "filter",
+            "thor2timesketch.config.filter_findings",
+            "FilterFindings",
+            "select",
+            _batch_items,
+        ),
+        (
+            "map",
+            "thor2timesketch.mappers.mapper_json_base",
+            "MapperJsonBase",
+            "map_thor_events_batch",
+            _result_items,
+        ),
+        (
+            "map",
+            "thor2timesketch.mappers.mapper_json_audit",
+            "MapperJsonAudit",
+            "map_thor_events_batch",
+            _result_items,
+        ),
+        (
+            "normalize",
+            "thor2timesketch.utils.normalizer",
+            "FlatteningNormalizer",
+            "normalize",
+            _result_items,
+        ),
+        (
+            "normalize",
+            "thor2timesketch.utils.normalizer",
+            "AuditTrailNormalizer",
+            "normalize",
+            _result_items,
+        ),
+        (
+            "flatten",
+            "thor2timesketch.utils.json_flattener",
+            "JSONFlattener",
+            "flatten_json",
+            _result_items,
+        ),
+        (
+            "timestamps",
+            "thor2timesketch.utils.regex_timestamp_extractor",
+            "RegexTimestampExtractor",
+            "extract",
+            _result_items,
+        ),
+        (
+            "timestamps",
+            "thor2timesketch.utils.audit_timestamp_extractor",
+            "AuditTimestampExtractor",
+            "extract",
+            _result_items,
+        ),
+        (
+            "serialize",
+            "thor2timesketch.utils.json_codec",
+            "JsonCodec",
+            "dumps_line",
+            _result_items,
+        ),
+        (
+            "serialize",
+            "thor2timesketch.utils.json_codec",
+            "JsonCodec",
+            "dumps_lines",
+            _result_items,
+        ),
+        (
+            "write",
+            "thor2timesketch.output.file_writer",
+            "FileWriter",
+            "_write_events",
+            _no_items,
+        ),
+        (
+            "write_queue",
+            "thor2timesketch.output.block_writer",
+            "BlockWriter",
+            "write",
+            _no_items,
+        ),
+        (
+            "disk_write",
+            "thor2timesketch.output.block_writer",
+            "BlockWriter",
+            "_write_block",
+            _no_items,
+        ),
+        (
+            "tee_dispatch",
+            "thor2timesketch.output.event_tee",
+            "_SinkWorker",
+            "offer",
+            _no_items,
+        ),
+        (
+            "tee_wait",
+            "thor2timesketch.output.event_tee",
+            "_SinkWorker",
+            "_events",
+            _result_items,
+        ),
+        (
+            "upload_queue",
+            "thor2timesketch.output.ts_ingest",
+            "TSIngest",
+            "_upload_events",
+            _no_items,
+        ),
+        (
+            "upload",
+            "thor2timesketch.output.ts_ingest",
+            "_Uploader",
+            "_add_batch",
+            _batch_items,
+        ),
+    ]
+
+    enabled: bool = False
+    _patched: List[Tuple[Any, str, Any]] = []
+    _local = threading.local()
+    _lock = threading.Lock()
+    _threads: List[_ThreadState] = []
+    _merged: Dict[str, _StageStats] = {}
+    _started: float = 0.0
+
+    @classmethod
+    def enable(cls) -> None:
+        if cls.enabled:
+            return
+        for stage, module, owner, name, counter in cls.TARGETS:
+            target = getattr(importlib.import_module(module), owner)
+            original = target.__dict__[name]
+            cls._patched.append((target, name, original))
+            setattr(target, name, cls._instrument(stage, target, name, counter))
+        cls.enabled = True
+        cls.reset()
+        ConsoleConfig.debug("Stage profiling enabled")
+
+    @classmethod
+    def disable(cls) -> None:
+        while cls._patched:
+            target, name, original = cls._patched.pop()
+            setattr(target, name, original)
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._local = threading.local()
+            cls._threads = []
+            cls._merged = {}
+        cls._started = time.perf_counter()
+
+    @classmethod
+    def collect(cls) -> StageTotals:
+        totals = cls.snapshot()
+        cls.reset()
+        return totals
+
+    @classmethod
+    def merge(cls, totals: StageTotals) -> None:
+        with cls._lock:
+            for stage, values in totals.items():
+                cls._merged.setdefault(stage, _StageStats()).add(*values)
+
+    @classmethod
+    def snapshot(cls) -> StageTotals:
+        combined: Dict[str, _StageStats] = {}
+        with cls._lock:
+            sources = [cls._merged] + [state.stages for state in cls._threads]
+            for stages in sources:
+                for stage, stats in stages.items():
+                    combined.setdefault(stage, _StageStats()).add(*stats.totals())
+        return {stage: stats.totals() for stage, stats in combined.items()}
+
+    @classmethod
+    def report(cls) -> Dict[str, Any]:
+        totals = cls.snapshot()
+        order = list(dict.fromkeys(target[0] for target in cls.TARGETS))
+        stages = []
+        for stage in order:
+            if stage not in totals:
+                continue
+            calls, items, wall, cpu = totals[stage]
+            stages.append(
+                {
+                    "stage": stage,
+                    "calls": calls,
+                    "items": items,
+                    "wall_seconds": round(wall, 6),
+                    "cpu_seconds": round(cpu, 6),
+                    "items_per_second": (
+                        round(items / wall, 1) if items and wall else None
+                    ),
+                }
+            )
+        return {
+            "elapsed_seconds": round(time.perf_counter() - cls._started, 6),
+            "stages": stages,
+        }
+
+    @classmethod
+    def print_summary(cls, report: Dict[str, Any]) -> None:
+        table = Table(
+            title=f"thor2ts profile ({report['elapsed_seconds']:.2f}s elapsed)",
+            title_justify="left",
+        )
+        for column in ("stage", "calls", "items", "wall s", "cpu s", "items/s"):
+            table.add_column(column, justify="left" if column == "stage" else "right")
+        for stage in report["stages"]:
+            rate = stage["items_per_second"]
+            table.add_row(
+                stage["stage"],
+                f"{stage['calls']:,}",
+                f"{stage['items']:,}",
+                f"{stage['wall_seconds']:.3f}",
+                f"{stage['cpu_seconds']:.3f}",
+                f"{rate:,.0f}" if rate is not None else "-",
+            )
+        ConsoleConfig.console.print(table)
+        ConsoleConfig.info(
+            "Stage times exclude nested stages; worker process times are summed"
+        )
+
+    @classmethod
+    def write_report(cls, report: Dict[str, Any], report_file: Path) -> None:
+        try:
+            report_file.write_text(json.dumps(report, indent=2) + "\n")
+        except OSError as e:
+            raise OutputError(f"Failed to write profile report '{report_file}': {e}")
+        ConsoleConfig.success(f"Profile report written to '{report_file}'")
+
+    @classmethod
+    def _state(cls) -> _ThreadState:
+        try:
+            state: _ThreadState = cls._local.state
+        except AttributeError:
+            state = _ThreadState()
+            cls._local.state = state
+            with cls._lock:
+                cls._threads.append(state)
+        return state
+
+    @classmethod
+    def _enter(cls) -> List[float]:
+        frame = [0.0, 0.0, time.perf_counter(), time.thread_time()]
+        cls._state().stack.append(frame)
+        return frame
+
+    @classmethod
+    def _exit(cls, stage: str, frame: List[float], calls: int, items: int) -> None:
+        wall = time.perf_counter() - frame[2]
+        cpu = time.thread_time() - frame[3]
+        state = cls._state()
+        if state.stack and state.stack[-1] is frame:
+            state.stack.pop()
+        if state.stack:
+            state.stack[-1][0] += wall
+            state.stack[-1][1] += cpu
+        stats = state.stages.get(stage)
+        if stats is None:
+            stats = state.stages[stage] = _StageStats()
+        stats.add(calls, items, wall - frame[0], cpu - frame[1])
+
+    @classmethod
+    def _instrument(
+        cls, stage: str, target: Any, name: str, counter: ItemCounter
+    ) -> Any:
+        original = target.__dict__[name]
+        if isinstance(original, (staticmethod, classmethod)):
+            return staticmethod(cls._timed(stage, getattr(target, name), counter))
+        return cls._timed(stage, original, counter)
+
+    @classmethod
+    def _timed(
+        cls, stage: str, func: Callable[..., Any], counter: ItemCounter
+    ) -> Callable[..., Any]:
+        if inspect.isgeneratorfunction(func):
+            return cls._timed_generator(stage, func)
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            frame = cls._enter()
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            finally:
+                cls._exit(stage, frame, 1, counter(args, result))
+
+        return timed
+
+    @classmethod
+    def _timed_generator(
+        cls, stage: str, func: Callable[..., Iterator[Any]]
+    ) -> Callable[..., Iterator[Any]]:
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            items = func(*args, **kwargs)
+            calls = 1
+            try:
+                while True:
+                    frame = cls._enter()
+                    produced = 0
+                    try:
+                        item = next(items)
+                        produced = 1
+                    except StopIteration:
+                        return
+                    finally:
+                        cls._exit(stage, frame, calls, produced)
+                        calls = 0
+                    yield item
+            finally:
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+
+        return timed
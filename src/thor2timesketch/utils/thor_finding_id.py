@@ -1,12 +1,36 @@
-import uuid
 import base64
-from thor2timesketch.constants import PREFIX
+import hashlib
+import uuid
+from typing import Any, Dict, Optional
+from thor2timesketch.config.console_config import ConsoleConfig
+from thor2timesketch.constants import DEFAULT_ENCODING, FINDING_ID_SIZE, PREFIX
+from thor2timesketch.utils.json_codec import JsonCodec
 
 
 class ThorFindingId:
-    @staticmethod
-    def get_finding_id() -> str:
-        raw_data = uuid.uuid4().bytes
+    deterministic: bool = False
+    salt: str = ""
+    _key: bytes = b""
+
+    @classmethod
+    def configure(cls, deterministic: bool = False, salt: Optional[str] = None) -> None:
+        cls.deterministic = deterministic or bool(salt)
+        cls.salt = salt or ""
+        cls._key = hashlib.blake2b(
+            cls.salt.encode(DEFAULT_ENCODING), digest_size=hashlib.blake2b.MAX_KEY_SIZE
+        ).digest()
+        ConsoleConfig.debug(f"Deterministic finding IDs enabled: {cls.deterministic}")
+
+    @classmethod
+    def get_finding_id(cls, content: Optional[Dict[str, Any]] = None) -> str:
+        if cls.deterministic and content is not None:
+            raw_data = hashlib.blake2b(
+                JsonCodec.dumps_sorted(content),
+                key=cls._key,
+                digest_size=FINDING_ID_SIZE,
+            ).digest()
+        else:
+            raw_data = uuid.uuid4().bytes
         base32 = base64.b32encode(raw_data).decode("ascii")
         id_part = base32.rstrip("=").lower()
         return f"{PREFIX}-{id_part}"
@@ -1,15 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
-from dateutil import parser
 from thor2timesketch.exceptions import MappingError
 from thor2timesketch.utils.datetime_field import DatetimeField
+from thor2timesketch.utils.timestamp_normalizer import TimestampNormalizer
 
 
 class TimestampExtractor(ABC):
     def is_same_timestamp(self, time1: str, time2: str) -> bool:
+        if time1 == time2:
+            return True
         try:
-            datetime1 = parser.isoparse(time1)
-            datetime2 = parser.isoparse(time2)
+            datetime1 = TimestampNormalizer.parse(time1)
+            datetime2 = TimestampNormalizer.parse(time2)
             ts_check = datetime1 == datetime2
             return ts_check
         except ValueError as e:
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from dateutil import parser
+from thor2timesketch.constants import TIMESTAMP_CACHE_SIZE
+
+
+class TimestampNormalizer:
+
+    @staticmethod
+    @lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def parse(timestamp: str) -> datetime:
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            return parser.isoparse(timestamp)
+
+    @staticmethod
+    @lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def normalize(timestamp: str) -> str:
+        parsed = TimestampNormalizer.parse(timestamp)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.isoformat()
+
+    @staticmethod
+    def clear_cache() -> None:
+        TimestampNormalizer.parse.cache_clear()
+        TimestampNormalizer.normalize.cache_clear()
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+from thor2timesketch.constants import LOG_VERSION, TIMESTAMP_INDEX_SIZE
+
+
+class TimestampPath(NamedTuple):
+    path: str
+    keys: Tuple[Any, ...]
+
+
+class TimestampPathIndex:
+    MODULE_FIELD = "module"
+
+    def __init__(self, max_signatures: int = TIMESTAMP_INDEX_SIZE) -> None:
+        self.max_signatures = max_signatures
+        self._paths: Dict[Hashable, Tuple[TimestampPath, ...]] = {}
+
+    def signature(self, data: Dict[str, Any]) -> Hashable:
+        log_version = data.get(LOG_VERSION)
+        module = data.get(self.MODULE_FIELD)
+        return (
+            log_version if isinstance(log_version, str) else None,
+            module if isinstance(module, str) else None,
+            tuple(data),
+        )
+
+    def get(self, signature: Hashable) -> Optional[Tuple[TimestampPath, ...]]:
+        return self._paths.get(signature)
+
+    def learn(self, signature: Hashable, paths: List[TimestampPath]) -> None:
+        if signature not in self._paths and len(self._paths) >= self.max_signatures:
+            self._paths.clear()
+        self._paths[signature] = tuple(paths)
+
+    @staticmethod
+    def resolve(data: Dict[str, Any], keys: Tuple[Any, ...]) -> Any:
+        value: Any = data
+        for key in keys:
+            value = value[key]
+        return value
@@ -0,0 +1,57 @@
+import json
+from benchmarks.generator import ThorLogGenerator
+from benchmarks.stages import StageBenchmarks
+from thor2timesketch.mappers.json_log_version import JsonLogVersion
+from thor2timesketch.mappers.mapper_loader import load_all_mappers
+from thor2timesketch.transformation.pretransformation_processor import (
+    PreTransformationProcessor,
+)
+
+
+def test_generator_is_deterministic():
+    first = list(ThorLogGenerator(seed=7).logs(200))
+    second = list(ThorLogGenerator(seed=7).logs(200))
+    other = list(ThorLogGenerator(seed=8).logs(200))
+    assert first == second
+    assert first != other
+
+
+def test_generator_respects_mix():
+    logs = list(
+        ThorLogGenerator(
+            seed=1, versions={"v2.0.0": 1}, modules={"Registry": 1}, levels={"Alert": 1}
+        ).logs(50)
+    )
+    assert {log["log_version"] for log in logs} == {"v2.0.0"}
+    assert {log["module"] for log in logs} == {"Registry"}
+    assert {log["level"] for log in logs} == {"Alert"}
+
+
+def test_generated_logs_map_to_events():
+    load_all_mappers()
+    pre_transform = PreTransformationProcessor()
+    resolver = JsonLogVersion()
+    events = [
+        event
+        for raw in ThorLogGenerator(seed=3).logs(300)
+        for log in pre_transform.transformation(json.loads(json.dumps(raw)))
+        for event in resolver.get_mapper_for_version(log).map_thor_events(log)
+    ]
+    assert len(events) > 300
+    assert all(event["datetime"] and event["message"] for event in events)
+
+
+def test_stage_benchmarks_report_every_stage(tmp_path):
+    input_file = ThorLogGenerator(seed=5).write(tmp_path / "thor.json", 100)
+    results = StageBenchmarks(input_file, tmp_path, repeat=1).run()
+    assert [result.stage for result in results] == [
+        "read",
+        "pretransform",
+        "version",
+        "flatten",
+        "timestamps",
+        "map",
+        "write",
+    ]
+    assert results[0].items == 100
+    assert all(result.seconds > 0 for result in results)
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from typer.testing import CliRunner
 from thor2timesketch.cli.controller import app
 
@@ -32,3 +34,26 @@ def test_require_output_or_sketch(tmp_path):
     result = runner.invoke(app, [str(input_file)])
     assert result.exit_code == 1
     assert "Use -o/--output for file output or --sketch" in result.stdout
+
+
+def test_file_conversion_skips_optional_stacks(tmp_path):
+    input_file = tmp_path / "thor.json"
+    input_file.write_text(
+        '{"log_version": "v2.0.0", "time": "2024-01-02T03:04:05Z", '
+        '"message": "Suspicious file", "module": "Filescan", "level": "Alert"}\n'
+    )
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from thor2timesketch.cli.controller import app\n"
+        f"result = CliRunner().invoke(app, [{str(input_file)!r}, '-o', "
+        f"{str(tmp_path / 'out.jsonl')!r}])\n"
+        "assert result.exit_code == 0, result.stdout\n"
+        "heavy = ('timesketch_api_client', 'timesketch_import_client', 'yaml',\n"
+        "         'concurrent.futures.process', 'thor2timesketch.mappers.mapper_json_audit')\n"
+        "print(sorted(name for name in heavy if name in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,43 @@
+import pytest
+from thor2timesketch.config.console_config import ConsoleConfig
+
+
+@pytest.fixture(autouse=True)
+def restore_level():
+    min_level = ConsoleConfig.min_level
+    yield
+    ConsoleConfig.min_level = min_level
+
+
+def test_is_enabled_follows_verbose_flag():
+    ConsoleConfig.set_verbose(False)
+    assert not ConsoleConfig.is_enabled("DEBUG")
+    assert ConsoleConfig.is_enabled("INFO")
+    ConsoleConfig.set_verbose(True)
+    assert ConsoleConfig.is_enabled("DEBUG")
+
+
+def test_lazy_message_not_built_when_disabled():
+    ConsoleConfig.set_verbose(False)
+
+    def build() -> str:
+        raise AssertionError("message must not be formatted")
+
+    ConsoleConfig.debug(build)
+
+
+def test_lazy_message_printed_when_enabled(capsys):
+    ConsoleConfig.set_verbose(True)
+    ConsoleConfig.debug(lambda: "lazy debug message")
+    assert "lazy debug message" in capsys.readouterr().out
+
+
+def test_headless_console_is_not_forced_to_terminal():
+    console = ConsoleConfig.console
+    try:
+        ConsoleConfig.set_headless(True)
+        assert not ConsoleConfig.console.is_terminal
+        ConsoleConfig.set_headless(False)
+        assert ConsoleConfig.console.is_terminal
+    finally:
+        ConsoleConfig.console = console
@@ -0,0 +1,78 @@
+import pytest
+from thor2timesketch.config.field_predicate import FieldPredicate
+from thor2timesketch.config.filter_findings import FilterFindings
+from thor2timesketch.exceptions import FilterConfigError
+
+LOG = {
+    "time": "2025-05-07T11:45:01Z",
+    "hostname": "WKS-001",
+    "score": 75,
+    "module": "Filescan",
+    "file": {"path": "C:\\Windows\\Temp\\x.exe", "signed": False},
+}
+
+
+@pytest.mark.parametrize(
+    "condition, matched",
+    [
+        ({"field": "hostname", "equals": "WKS-001"}, True),
+        ({"field": "hostname", "equals": "wks-001"}, False),
+        ({"field": "hostname", "equals": "wks-001", "ignore_case": True}, True),
+        ({"field": "hostname", "not_equals": "WKS-002"}, True),
+        ({"field": "module", "in": ["Filescan", "ProcessCheck"]}, True),
+        ({"field": "file.path", "regex": r"\\temp\\", "ignore_case": True}, True),
+        ({"field": "file.path", "prefix": "C:\\Windows"}, True),
+        ({"field": "file.signed", "equals": False}, True),
+        ({"field": "score", "gte": 70}, True),
+        ({"field": "score", "gt": 70, "lt": 75}, False),
+        ({"field": "time", "after": "2025-05-07T00:00:00Z"}, True),
+        ({"field": "time", "before": "2025-05-07T11:45:00"}, False),
+        ({"field": "file.missing", "not_equals": "x"}, False),
+        ({"field": "hostname.name", "equals": "x"}, False),
+    ],
+)
+def test_conditions(condition, matched):
+    assert FieldPredicate.compile([condition])(LOG) is matched
+
+
+def test_all_conditions_must_match():
+    predicate = FieldPredicate.compile(
+        [{"field": "score", "gte": 70}, {"field": "hostname", "prefix": "SRV-"}]
+    )
+    assert predicate(LOG) is False
+    assert predicate({**LOG, "hostname": "SRV-9"}) is True
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"field": "score"},
+        [{"equals": 1}],
+        [{"field": "score"}],
+        [{"field": "score", "approx": 1}],
+        [{"field": "score", "gte": "high"}],
+        [{"field": "time", "after": "yesterday"}],
+        [{"field": "message", "regex": "("}],
+        [{"field": "module", "equals": ["a", "b"]}],
+    ],
+)
+def test_invalid_conditions_raise(conditions):
+    with pytest.raises(FilterConfigError):
+        FieldPredicate.compile(conditions)
+
+
+def test_fields_only_filter_from_yaml(tmp_path):
+    path = tmp_path / "filters.yaml"
+    path.write_text("filters:\n  fields:\n    - field: score\n      gte: 70\n")
+    selectors = FilterFindings.read_filters_yaml(path)
+    assert selectors.matches_filter_criteria("Info", "Anything") is True
+    assert selectors.matches_fields(LOG) is True
+    assert selectors.matches_fields({**LOG, "score": 40}) is False
+
+
+def test_unquoted_yaml_date_is_midnight_utc(tmp_path):
+    path = tmp_path / "filters.yaml"
+    path.write_text("filters:\n  fields:\n    - field: time\n      after: 2025-05-07\n")
+    selectors = FilterFindings.read_filters_yaml(path)
+    assert selectors.matches_fields(LOG) is True
+    assert selectors.matches_fields({**LOG, "time": "2025-05-06T23:59:59Z"}) is False
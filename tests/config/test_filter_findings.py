@@ -172,3 +172,18 @@ def test_matches_filter_both_filters(lvl, mod, expected):
 def test_matches_filter_both_filters_none_or_empty(lvl, mod):
     f = FilterFindings({"L"}, {"M"})
     assert f.matches_filter_criteria(lvl, mod) is False
+
+
+def _level_and_module(log):
+    return log["level"], log["module"]
+
+
+def test_select_keeps_matching_logs_in_order():
+    logs = [
+        {"level": "Alert", "module": "Filescan"},
+        {"level": "Info", "module": "Filescan"},
+        {"level": "alert", "module": "ProcessCheck"},
+    ]
+    selected = FilterFindings({"Alert"}, set()).select(_level_and_module, logs)
+    assert selected == [logs[0], logs[2]]
+    assert FilterFindings.null_filter().select(_level_and_module, logs) is logs
@@ -0,0 +1,53 @@
+import json
+import pytest
+from thor2timesketch.config.filter_findings import FilterFindings
+from thor2timesketch.config.line_prefilter import LinePrefilter
+
+
+def _prefilter(levels=(), modules=()):
+    return LinePrefilter.compile(
+        FilterFindings(set(levels), set(modules)),
+        ["v1.0.0", "v2.0.0"],
+        "level",
+        "module",
+    )
+
+
+def _line(**fields):
+    log = {"time": "2025-05-07T11:45:01Z", "log_version": "v2.0.0", **fields}
+    return json.dumps(log).encode()
+
+
+def test_null_filter_compiles_to_nothing():
+    assert (
+        LinePrefilter.compile(
+            FilterFindings.null_filter(), ["v2.0.0"], "level", "module"
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "line, accepted",
+    [
+        (_line(level="Alert", module="Filescan"), True),
+        (_line(level="WARNING", module="Filescan"), True),
+        (_line(level="Info", module="Filescan"), False),
+        (_line(level="Info", module="Filescan", log_version="v9"), True),
+        (_line(module="Filescan"), True),
+        (_line(level="Info", details={"level": "Alert"}), True),
+        (_line(level="Infö"), True),
+        (b'{"findings": [{"Level": "Info", "Module": "x"}]}', True),
+        (_line(level="Info", module="Filescan")[:-1], True),
+    ],
+)
+def test_rejects_only_definite_mismatches(line, accepted):
+    assert _prefilter(levels={"alert", "warning"}).accepts(line) is accepted
+
+
+def test_levels_and_modules_both_checked():
+    prefilter = _prefilter(levels={"alert"}, modules={"filescan"})
+    assert prefilter.accepts(_line(level="Alert", module="FileScan"))
+    assert not prefilter.accepts(_line(level="Alert", module="Registry"))
+    assert not prefilter.accepts(_line(level="Notice", module="Filescan"))
+    assert prefilter.skipped == 2
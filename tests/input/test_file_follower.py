@@ -0,0 +1,75 @@
+import pytest
+from thor2timesketch.input.file_follower import FileFollower
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    file_path = tmp_path / "live.json"
+    file_path.write_bytes(b"")
+    return file_path
+
+
+def _append(file_path, data):
+    with file_path.open("ab") as file:
+        file.write(data)
+
+
+def _until_idle(lines):
+    pulled = []
+    for line in lines:
+        if line is None:
+            return pulled
+        pulled.append(line.data)
+    return pulled
+
+
+def test_appended_lines_are_yielded_once_complete(input_file):
+    lines = FileFollower(poll_interval=0, block_size=4).follow(input_file)
+    assert _until_idle(lines) == []
+    _append(input_file, b'{"a": 1}\n{"b"')
+    assert _until_idle(lines) == [b'{"a": 1}']
+    _append(input_file, b": 2}\n")
+    assert _until_idle(lines) == [b'{"b": 2}']
+
+
+def test_offsets_and_line_numbers_continue(input_file):
+    input_file.write_bytes(b"one\ntwo\n")
+    lines = FileFollower(poll_interval=0).follow(input_file, start=4, first_line=2)
+    (line,) = [next(lines)]
+    assert (line.line_num, line.start, line.end, line.data) == (2, 4, 8, b"two")
+
+
+def test_rotated_file_is_drained_then_reopened(input_file):
+    lines = FileFollower(poll_interval=0).follow(input_file)
+    _append(input_file, b"one\n")
+    assert _until_idle(lines) == [b"one"]
+    _append(input_file, b"two")
+    input_file.rename(input_file.with_name("live.json.1"))
+    _append(input_file, b"three\n")
+    assert _until_idle(lines) == [b"two", b"three"]
+
+
+def test_truncated_file_is_read_from_start(input_file):
+    lines = FileFollower(poll_interval=0).follow(input_file)
+    _append(input_file, b"one\ntwo\n")
+    assert _until_idle(lines) == [b"one", b"two"]
+    input_file.write_bytes(b"")
+    assert _until_idle(lines) == []
+    _append(input_file, b"new\n")
+    (line,) = [next(lines)]
+    assert (line.line_num, line.start, line.data) == (1, 0, b"new")
+
+
+def test_timeout_stops_and_yields_pending_line(input_file):
+    input_file.write_bytes(b"one\ntwo")
+    lines = list(FileFollower(poll_interval=0, timeout=0).follow(input_file))
+    assert [line.data for line in lines if line is not None] == [b"one", b"two"]
+
+
+def test_stop_ends_following_with_pending_line(input_file):
+    follower = FileFollower(poll_interval=0)
+    lines = follower.follow(input_file)
+    _append(input_file, b"one\ntwo")
+    assert _until_idle(lines) == [b"one"]
+    follower.stop()
+    assert [line.data for line in lines if line is not None] == [b"two"]
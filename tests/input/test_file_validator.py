@@ -44,3 +44,20 @@ def test_invalid_file_cases(tmp_path, filename, content, expected_exc, validator
         file_path.write_text(content)
     with pytest.raises(expected_exc):
         validator.validate_file(file_path)
+
+
+@pytest.mark.parametrize(
+    "filename, valid",
+    [("scan.json.gz", True), ("scan.jsonl.zst", True), ("scan.gz", False)],
+)
+def test_compressed_extensions(tmp_path, filename, valid):
+    validator = FileValidator(
+        valid_extensions=[".json", ".jsonl"], compressed_extensions=[".gz", ".zst"]
+    )
+    file_path = tmp_path / filename
+    file_path.write_bytes(b"x")
+    if valid:
+        assert validator.validate_file(file_path) == file_path
+    else:
+        with pytest.raises(InvalidFileExtensionError):
+            validator.validate_file(file_path)
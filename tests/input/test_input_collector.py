@@ -0,0 +1,64 @@
+from pathlib import Path
+import pytest
+from thor2timesketch.exceptions import InputError
+from thor2timesketch.input.input_collector import InputCollector
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    for name in ("a/scan.json", "b/scan.json.gz", "b/other.jsonl", "notes.txt"):
+        path = tmp_path / "logs" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}\n")
+    return tmp_path / "logs"
+
+
+def test_directory_and_glob_are_batch_inputs(log_dir):
+    assert InputCollector.is_batch(log_dir)
+    assert InputCollector.is_batch(log_dir / "*.json")
+    assert not InputCollector.is_batch(log_dir / "a" / "scan.json")
+
+
+def test_existing_file_with_glob_characters_is_single_input(tmp_path):
+    input_file = tmp_path / "scan[1].json"
+    input_file.write_text("{}\n")
+    assert not InputCollector.is_batch(input_file)
+
+
+def test_collects_thor_logs_recursively(log_dir):
+    assert InputCollector().collect(log_dir) == [
+        log_dir / "a" / "scan.json",
+        log_dir / "b" / "other.jsonl",
+        log_dir / "b" / "scan.json.gz",
+    ]
+
+
+def test_collects_glob_matches(log_dir):
+    assert InputCollector().collect(log_dir / "*" / "scan.json*") == [
+        log_dir / "a" / "scan.json",
+        log_dir / "b" / "scan.json.gz",
+    ]
+
+
+def test_no_matches_raises(log_dir):
+    with pytest.raises(InputError, match="No THOR log files"):
+        InputCollector().collect(log_dir / "*.yaml")
+
+
+def test_output_files_keep_relative_layout(log_dir):
+    input_files = InputCollector().collect(log_dir)
+    assert InputCollector.output_files(input_files, Path("out")) == [
+        Path("out/a/scan.jsonl"),
+        Path("out/b/other.jsonl"),
+        Path("out/b/scan.jsonl"),
+    ]
+
+
+def test_output_files_keep_input_suffix_when_names_collide(tmp_path):
+    input_files = [tmp_path / "a" / name for name in ("scan.json", "scan.json.gz")]
+    input_files.append(tmp_path / "a" / "other.json")
+    assert InputCollector.output_files(input_files, Path("out")) == [
+        Path("out/scan.json.jsonl"),
+        Path("out/scan.json.gz.jsonl"),
+        Path("out/other.jsonl"),
+    ]
@@ -6,7 +6,7 @@ from thor2timesketch.exceptions import JsonParseError, InputError
 
 @pytest.fixture(autouse=True)
 def skip_file_validation(monkeypatch):
-    monkeypatch.setattr(JsonReader, "_validate_file", lambda self, f: Path(f))
+    monkeypatch.setattr(JsonReader, "_validate_file", lambda self, f, *a: Path(f))
 
 
 @pytest.fixture
@@ -38,3 +38,23 @@ def test_input_error_on_file_read(tmp_path, reader, monkeypatch):
     )
     with pytest.raises(InputError):
         list(reader.get_valid_data(file_path))
+
+
+def test_read_valid_batches_marks_first_line_of_each_batch(tmp_path, reader):
+    file_path = tmp_path / "data.json"
+    file_path.write_text("\n" + "".join(f'{{"n": {n}}}\n' for n in range(5)))
+    marks = []
+    batches = reader.read_valid_batches(
+        file_path, mark=lambda offset, line: marks.append((offset, line)), batch_size=2
+    )
+    assert [[log["n"] for log in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+    assert marks == [(1, 2), (19, 4), (37, 6)]
+
+
+def test_read_valid_batches_yields_partial_batch_before_error(tmp_path, reader):
+    file_path = tmp_path / "mixed.json"
+    file_path.write_text('{"ok": 1}\n' "{bad json}\n" '{"never": "reached"}\n')
+    batches = reader.read_valid_batches(file_path)
+    assert next(batches) == [{"ok": 1}]
+    with pytest.raises(InputError, match="line 2"):
+        next(batches)
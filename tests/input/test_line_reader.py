@@ -0,0 +1,41 @@
+import pytest
+from thor2timesketch.input.line_reader import LineReader
+
+CONTENT = b'{"a": 1}\n\n{"b": 2}\r\n{"c": "long value"}\n{"d": 4}'
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    file_path = tmp_path / "data.json"
+    file_path.write_bytes(CONTENT)
+    return file_path
+
+
+@pytest.fixture(params=[True, False], ids=["mmap", "blocks"])
+def reader(request):
+    return LineReader(use_mmap=request.param, block_size=5)
+
+
+def test_lines_offsets_and_numbers(input_file, reader):
+    lines = list(reader.read_lines(input_file))
+    assert [line.line_num for line in lines] == [1, 2, 3, 4, 5]
+    assert [line.data for line in lines] == [
+        b'{"a": 1}',
+        b"",
+        b'{"b": 2}\r',
+        b'{"c": "long value"}',
+        b'{"d": 4}',
+    ]
+    for line in lines:
+        assert CONTENT[line.start : line.end].rstrip(b"\n") == line.data
+    assert lines[-1].end == len(CONTENT)
+
+
+def test_byte_range_read(input_file, reader):
+    start = CONTENT.index(b'{"b"')
+    end = CONTENT.index(b'{"d"')
+    lines = list(reader.read_lines(input_file, start, end, first_line=3))
+    assert [(line.line_num, line.data) for line in lines] == [
+        (3, b'{"b": 2}\r'),
+        (4, b'{"c": "long value"}'),
+    ]
@@ -0,0 +1,147 @@
+import socket
+import threading
+import pytest
+from thor2timesketch.exceptions import InputError
+from thor2timesketch.input.network_receiver import (
+    ListenAddress,
+    NetworkReceiver,
+    ReceivedSource,
+    SyslogFramer,
+)
+
+
+def test_listen_address_parse():
+    assert ListenAddress.parse("tcp://127.0.0.1:1514") == ("tcp", "127.0.0.1", 1514)
+    assert ListenAddress.parse("UDP://:514") == ("udp", "0.0.0.0", 514)
+    assert str(ListenAddress.parse("http://[::1]:8080")) == "http://::1:8080"
+    for value in ("127.0.0.1:1514", "ftp://host:21", "tcp://host", "tcp://h:99999"):
+        with pytest.raises(InputError, match="Invalid listen address"):
+            ListenAddress.parse(value)
+
+
+def test_framer_splits_newline_and_octet_counted_messages():
+    stream = b'{"a": 1}\n8 {"b": 2}<14>host: {"c": 3}\n12 {"d": "x\n"}'
+    framer = SyslogFramer()
+    messages = []
+    for index in range(len(stream)):
+        messages += framer.feed(stream[index : index + 1])
+    assert messages == [b'{"a": 1}', b'{"b": 2}', b'<14>host: {"c": 3}']
+    assert framer.flush() == [b'12 {"d": "x\n"}']
+
+
+def test_framer_rejects_oversized_message():
+    framer = SyslogFramer(max_message=8)
+    with pytest.raises(InputError, match="maximum size"):
+        framer.feed(b'{"message": "too long"')
+    assert framer.feed(b"{}\n") == [b"{}"]
+
+
+def test_source_lines_strip_syslog_header_and_flush_when_idle():
+    source = ReceivedSource("host", poll_interval=0)
+    source.offer([b'<14>Oct 18 11:00:00 host THOR: {"a": 1}', b'{"b": 2}'])
+    source.offer([b"no json"])
+    lines = source.lines()
+    assert [next(lines).data for _ in range(3)] == [
+        b'{"a": 1}',
+        b'{"b": 2}',
+        b"no json",
+    ]
+    assert next(lines) is None
+    assert next(lines) is None
+    source.close()
+    assert list(lines) == []
+
+
+def test_udp_offer_drops_messages_when_queue_is_full():
+    source = ReceivedSource("host", queue_chunks=1)
+    source.offer([b"{}"])
+    source.offer([b"{}", b"{}"])
+    assert source.dropped == 2
+
+
+class _Sources(list):
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+
+    def __call__(self, source):
+        self.append(source)
+        self.started.set()
+
+
+def _serve(receiver):
+    thread = threading.Thread(target=receiver.run, daemon=True)
+    thread.start()
+    assert receiver.ready.wait(5)
+    return thread
+
+
+def test_tcp_connections_from_one_host_share_a_source():
+    sources = _Sources()
+    receiver = NetworkReceiver([ListenAddress.parse("tcp://127.0.0.1:0")], sources)
+    thread = _serve(receiver)
+    port = receiver.bound[0].port
+    for payload in (b'{"a": 1}\n{"b"', b'{"c": 3}\n'):
+        with socket.create_connection(("127.0.0.1", port)) as client:
+            client.sendall(payload)
+    assert sources.started.wait(5)
+    (source,) = sources
+    received = []
+    for line in source.lines():
+        if line is not None:
+            received.append(line.data)
+        if len(received) == 3:
+            break
+    receiver.stop()
+    thread.join(5)
+    assert source.name == "127.0.0.1"
+    assert sorted(received) == [b'{"a": 1}', b'{"b"', b'{"c": 3}']
+
+
+def test_http_post_is_accepted_and_other_methods_rejected():
+    sources = _Sources()
+    receiver = NetworkReceiver([ListenAddress.parse("http://127.0.0.1:0")], sources)
+    thread = _serve(receiver)
+    port = receiver.bound[0].port
+    body = b'{"a": 1}\n{"b": 2}'
+    with socket.create_connection(("127.0.0.1", port)) as client:
+        client.sendall(
+            b"POST / HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+            + b"GET / HTTP/1.1\r\n\r\n"
+        )
+        responses = b""
+        while b"405" not in responses:
+            data = client.recv(1024)
+            if not data:
+                break
+            responses += data
+    receiver.stop()
+    thread.join(5)
+    assert responses.startswith(b"HTTP/1.1 202 Accepted\r\n")
+    assert b"HTTP/1.1 405 Method Not Allowed\r\n" in responses
+    (source,) = sources
+    assert [line.data for line in source.lines() if line is not None] == [
+        b'{"a": 1}',
+        b'{"b": 2}',
+    ]
+
+
+def test_http_request_over_source_limit_gets_503():
+    receiver = NetworkReceiver(
+        [ListenAddress.parse("http://127.0.0.1:0")], _Sources(), max_sources=0
+    )
+    thread = _serve(receiver)
+    with socket.create_connection(("127.0.0.1", receiver.bound[0].port)) as client:
+        client.sendall(b"POST / HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}")
+        responses = b""
+        while True:
+            data = client.recv(1024)
+            if not data:
+                break
+            responses += data
+    receiver.stop()
+    thread.join(5)
+    assert responses == (
+        b"HTTP/1.1 503 Service Unavailable\r\n"
+        b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+    )
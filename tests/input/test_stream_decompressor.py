@@ -0,0 +1,104 @@
+import bz2
+import gzip
+import lzma
+import pytest
+from thor2timesketch.exceptions import DecompressionError, InputError
+from thor2timesketch.input.json_reader import JsonReader
+from thor2timesketch.input.line_reader import LineReader
+from thor2timesketch.input.stream_decompressor import StreamDecompressor
+from thor2timesketch.utils.progress_bar import ProgressBar
+
+CONTENT = b'{"a": 1}\n\n{"b": 2}\n{"c": "long value"}\n{"d": 4}'
+
+
+def _zstd(data):
+    zstandard = pytest.importorskip("zstandard")
+    compressor = zstandard.ZstdCompressor()
+    half = len(data) // 2
+    return compressor.compress(data[:half]) + compressor.compress(data[half:])
+
+
+COMPRESSORS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+    "zstd": _zstd,
+}
+
+
+@pytest.fixture(params=sorted(COMPRESSORS))
+def compressed_file(request, tmp_path):
+    file_path = tmp_path / "data.json"
+    file_path.write_bytes(COMPRESSORS[request.param](CONTENT))
+    return request.param, file_path
+
+
+def test_detects_compression_by_magic_bytes(compressed_file, tmp_path):
+    compression, file_path = compressed_file
+    assert StreamDecompressor.detect(file_path) == compression
+    plain = tmp_path / "plain.json"
+    plain.write_bytes(CONTENT)
+    assert StreamDecompressor.detect(plain) is None
+
+
+def test_compressed_lines_match_plain(compressed_file, tmp_path):
+    _, file_path = compressed_file
+    plain = tmp_path / "plain.json"
+    plain.write_bytes(CONTENT)
+    reader = LineReader(block_size=7)
+    assert list(reader.read_lines(file_path)) == list(reader.read_lines(plain))
+    start = CONTENT.index(b'{"b"')
+    end = CONTENT.index(b'{"d"')
+    assert list(reader.read_lines(file_path, start, end, 3)) == list(
+        reader.read_lines(plain, start, end, 3)
+    )
+
+
+def test_tracks_compressed_input_offset(compressed_file):
+    compression, file_path = compressed_file
+    ProgressBar.track_input(file_path.stat().st_size)
+    try:
+        offsets = []
+        for _ in StreamDecompressor(block_size=8).read_blocks(file_path, compression):
+            offsets.append(ProgressBar.input_offset)
+        assert offsets == sorted(offsets)
+        assert offsets[-1] == file_path.stat().st_size
+    finally:
+        ProgressBar.track_input(0)
+
+
+def test_concatenated_gzip_members(tmp_path):
+    file_path = tmp_path / "data.json.gz"
+    file_path.write_bytes(gzip.compress(CONTENT[:20]) + gzip.compress(CONTENT[20:]))
+    data = [line.data for line in LineReader().read_lines(file_path)]
+    assert b"\n".join(data) == CONTENT
+
+
+def test_early_close_stops_decompression(tmp_path):
+    file_path = tmp_path / "data.json.gz"
+    file_path.write_bytes(gzip.compress(CONTENT * 1000))
+    blocks = StreamDecompressor(block_size=16, queue_blocks=1).read_blocks(
+        file_path, "gzip"
+    )
+    next(blocks)
+    blocks.close()
+
+
+def test_truncated_input_raises(tmp_path):
+    file_path = tmp_path / "data.json.gz"
+    file_path.write_bytes(gzip.compress(CONTENT * 100)[:-20])
+    with pytest.raises(DecompressionError):
+        list(LineReader().read_lines(file_path))
+
+
+def test_reader_accepts_compressed_suffix(tmp_path):
+    file_path = tmp_path / "scan.jsonl.gz"
+    file_path.write_bytes(gzip.compress(b'{"log_version": "v2.0.0"}\n{"x": 1}\n'))
+    assert list(JsonReader().get_valid_data(file_path)) == [
+        {"log_version": "v2.0.0"},
+        {"x": 1},
+    ]
+    with pytest.raises(InputError):
+        bad = tmp_path / "scan.txt.gz"
+        bad.write_bytes(gzip.compress(CONTENT))
+        JsonReader().validate_input(bad)
@@ -0,0 +1,86 @@
+import pytest
+from thor2timesketch.exceptions import VersionError
+from thor2timesketch.mappers.json_log_version import JsonLogVersion
+from thor2timesketch.mappers.mapper_json_base import MapperJsonBase
+from thor2timesketch.mappers.mapper_loader import load_all_mappers
+from thor2timesketch.mappers.mapper_json_v1 import MapperJsonV1
+from thor2timesketch.mappers.mapper_json_v2 import MapperJsonV2
+
+
+@pytest.fixture
+def resolver():
+    load_all_mappers()
+    return JsonLogVersion()
+
+
+def test_mapper_instances_are_reused(resolver):
+    first = resolver.get_mapper_for_version({"log_version": "v1.0.0"})
+    second = resolver.get_mapper_for_version({"log_version": "V1.0.0"})
+    assert isinstance(first, MapperJsonV1)
+    assert first is second
+
+
+def test_version_switch_resolves_new_mapper(resolver):
+    v1 = resolver.get_mapper_for_version({"log_version": "v1.0.0"})
+    v2 = resolver.get_mapper_for_version({"log_version": "v2.0.0"})
+    assert isinstance(v2, MapperJsonV2)
+    assert v1 is not v2
+    assert resolver.get_mapper_for_version({"log_version": "v1.0.0"}) is v1
+
+
+def test_fast_path_does_not_hide_audit_lines(resolver):
+    resolver.get_mapper_for_version({"log_version": "v2.0.0"})
+    audit = resolver.get_mapper_for_version({"Module": "Filescan", "Level": "Alert"})
+    assert type(audit).__name__ == "MapperJsonAuditFindings"
+
+
+def test_invalid_version_type_raises(resolver):
+    with pytest.raises(VersionError):
+        resolver.get_mapper_for_version({"log_version": 2})
+
+
+def test_static_registry_loads_every_mapper():
+    for log_version in JsonLogVersion.MAPPERS:
+        mapper_type = JsonLogVersion.mapper_type(log_version)
+        assert mapper_type is not None and issubclass(mapper_type, MapperJsonBase)
+
+
+def test_entry_point_mappers_extend_registry(monkeypatch):
+    class EntryPoint:
+        name = "V9.0.0"
+
+        @staticmethod
+        def load():
+            return MapperJsonV2
+
+    monkeypatch.setattr(JsonLogVersion, "_plugin_mappers", {"v9.0.0": EntryPoint()})
+    monkeypatch.setattr(JsonLogVersion, "_mapper_log_version", {})
+    mapper = JsonLogVersion().get_mapper_for_version({"log_version": "V9.0.0"})
+    assert isinstance(mapper, MapperJsonV2)
+
+
+def test_invalid_entry_point_mapper_raises(monkeypatch):
+    class EntryPoint:
+        @staticmethod
+        def load():
+            return dict
+
+    monkeypatch.setattr(JsonLogVersion, "_plugin_mappers", {"v9.0.0": EntryPoint()})
+    with pytest.raises(VersionError):
+        JsonLogVersion().get_mapper_for_version({"log_version": "v9.0.0"})
+
+
+def test_group_by_mapper_keeps_consecutive_runs(resolver):
+    logs = [
+        {"log_version": "v1.0.0", "n": 0},
+        {"log_version": "v1.0.0", "n": 1},
+        {"log_version": "v2.0.0", "n": 2},
+        {"log_version": "v1.0.0", "n": 3},
+    ]
+    groups = resolver.group_by_mapper(logs)
+    assert [type(mapper) for mapper, _ in groups] == [
+        MapperJsonV1,
+        MapperJsonV2,
+        MapperJsonV1,
+    ]
+    assert [[log["n"] for log in group] for _, group in groups] == [[0, 1], [2], [3]]
@@ -0,0 +1,94 @@
+import types
+from thor2timesketch.mappers.json_log_version import JsonLogVersion
+from thor2timesketch.mappers.mapped_event import MappedEvent
+from thor2timesketch.mappers.mapper_loader import load_all_mappers
+
+BASE_KEYS = ["message", "datetime", "timestamp_desc", "event_group_id", "tag"]
+
+
+def _event(**kwargs):
+    return MappedEvent("msg", "2024-01-01T00:00:00+00:00", "desc", "TF-1", **kwargs)
+
+
+def test_additional_fields_are_referenced_not_copied():
+    additional = {"module": "Filescan", "time": "x", "message": "raw"}
+    event = _event()
+    event.add_additional(additional, exclude=("time", "message"))
+    result = event.to_dict()
+    assert event.additional_fields is additional
+    assert additional == {"module": "Filescan", "time": "x", "message": "raw"}
+    assert list(result) == BASE_KEYS + ["module"]
+    assert result["message"] == "msg"
+
+
+def test_additional_fields_keep_key_order_and_override_base():
+    event = _event(time_thor_scan="2024-01-01T00:00:00+00:00")
+    event.add_additional({"b": 1, "tag": ["x"], "a": 2})
+    result = event.to_dict()
+    assert list(result) == BASE_KEYS + ["time_thor_scan", "b", "a"]
+    assert result["tag"] == ["x"]
+
+
+def test_repeated_additional_fields_are_merged():
+    event = _event()
+    event.add_additional({"a": 1, "skip": 2}, exclude=("skip",))
+    event.add_additional({"b": 3, "a": 4})
+    assert event.to_dict() == {**_event().to_dict(), "a": 4, "b": 3}
+
+
+def test_mapper_streams_events():
+    load_all_mappers()
+    log = {
+        "log_version": "v1.0.0",
+        "time": "2024-01-02T03:04:05Z",
+        "message": "Suspicious file",
+        "module": "Filescan",
+        "level": "Alert",
+        "file": {"modified": "2023-05-06T07:08:09Z"},
+    }
+    events = JsonLogVersion().get_mapper_for_version(log).map_thor_events(log)
+    assert isinstance(events, types.GeneratorType)
+    first, *rest = list(events)
+    assert "time" not in first and first["message"] == "Suspicious file"
+    assert first["file_modified"] == "2023-05-06T07:08:09Z"
+    assert [event["datetime"] for event in rest] == ["2023-05-06T07:08:09+00:00"]
+
+
+def test_mapper_batch_matches_single_events():
+    load_all_mappers()
+    logs = [
+        {
+            "log_version": "v2.0.0",
+            "time": f"2024-01-0{day}T03:04:05Z",
+            "message": f"Finding {day}",
+            "module": "Filescan",
+            "level": "Alert",
+            "file": {"created": "2023-05-06T07:08:09Z"},
+        }
+        for day in range(1, 4)
+    ]
+    mapper = JsonLogVersion().get_mapper_for_version(logs[0])
+    events = mapper.map_thor_events_batch(logs)
+    single = [event for log in logs for event in mapper.map_thor_events(log)]
+    assert len(events) == 6
+    for event in events + single:
+        del event["event_group_id"]
+    assert events == single
+
+
+def test_mapper_additional_fields_hook_is_still_used():
+    from thor2timesketch.mappers.mapper_json_v2 import MapperJsonV2
+
+    class LegacyMapper(MapperJsonV2):
+        def _get_additional_fields(self, json_log):
+            return {"module": json_log["module"]}
+
+    log = {
+        "log_version": "v2.0.0",
+        "time": "2024-01-02T03:04:05Z",
+        "message": "Suspicious file",
+        "module": "Filescan",
+        "level": "Alert",
+    }
+    (event,) = LegacyMapper().map_thor_events(log)
+    assert list(event) == BASE_KEYS + ["module"]
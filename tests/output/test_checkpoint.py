@@ -0,0 +1,69 @@
+import json
+import pytest
+from thor2timesketch.exceptions import CheckpointError, OutputError
+from thor2timesketch.output import file_writer
+from thor2timesketch.output.checkpoint import CheckpointTracker
+from thor2timesketch.output.file_writer import FileWriter
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "scan.json"
+    path.write_text("{}\n" * 50)
+    return path
+
+
+def _source(tracker, first_line=1, fail_at=None):
+    def lines():
+        for index in range(first_line - 1, 50):
+            if index == fail_at:
+                raise RuntimeError("interrupted")
+            tracker.mark(index * 3, index + 1)
+            yield {"message": f"event {index}"}
+
+    return tracker.track(lines())
+
+
+def test_commit_records_line_of_durable_events(tmp_path, input_file):
+    tracker = CheckpointTracker(tmp_path / "scan.ckpt", input_file)
+    tracker.register("file")
+    for _ in _source(tracker):
+        pass
+    tracker.commit("file", 7, files={"out.jsonl": 70})
+    state = json.loads((tmp_path / "scan.ckpt").read_text())["sinks"]["file"]
+    assert state["events"] == 7
+    assert (state["offset"], state["line"], state["skip"]) == (21, 8, 0)
+    assert state["files"] == {"out.jsonl": 70}
+
+
+def test_file_output_resumes_without_duplicates(tmp_path, input_file, monkeypatch):
+    monkeypatch.setattr(file_writer, "OUTPUT_BUFFER_SIZE", 1)
+    checkpoint_file = tmp_path / "out.jsonl.thor2ts-checkpoint"
+    output_file = tmp_path / "out.jsonl"
+
+    tracker = CheckpointTracker(checkpoint_file, input_file)
+    with pytest.raises(OutputError):
+        FileWriter(output_file, checkpoint=tracker).write_to_file(
+            _source(tracker, fail_at=20)
+        )
+    assert checkpoint_file.is_file()
+    assert output_file.is_file()
+
+    tracker = CheckpointTracker(checkpoint_file, input_file)
+    start = tracker.load()
+    assert start.events <= 20
+    FileWriter(output_file, checkpoint=tracker).write_to_file(
+        _source(tracker, first_line=start.line)
+    )
+    tracker.remove()
+    messages = [json.loads(line)["message"] for line in output_file.open()]
+    assert messages == [f"event {index}" for index in range(50)]
+    assert not checkpoint_file.exists()
+
+
+def test_changed_input_cannot_resume(tmp_path, input_file):
+    tracker = CheckpointTracker(tmp_path / "scan.ckpt", input_file)
+    tracker.register("file")
+    input_file.write_text("{}\n" * 51)
+    with pytest.raises(CheckpointError, match="changed"):
+        CheckpointTracker(tmp_path / "scan.ckpt", input_file).load()
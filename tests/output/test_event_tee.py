@@ -0,0 +1,66 @@
+import pytest
+from thor2timesketch.exceptions import OutputError, ProcessingError
+from thor2timesketch.output.event_tee import EventTee
+from thor2timesketch.output.file_writer import FileWriter
+
+
+def _events(count):
+    for index in range(count):
+        yield {"message": f"event {index}", "datetime": "2025-05-07T11:45:01+00:00"}
+
+
+def test_every_sink_receives_all_events(tmp_path):
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+    sinks = [FileWriter(first).write_to_file, FileWriter(second).write_to_file]
+    EventTee(sinks, batch_size=7, queue_batches=2).run(_events(100))
+    assert first.read_bytes() == second.read_bytes()
+    assert len(first.read_text().splitlines()) == 100
+
+
+def test_sinks_get_independent_dicts():
+    received = []
+
+    def mutating_sink(events):
+        for event in events:
+            event["message"] = "changed"
+
+    def collecting_sink(events):
+        received.extend(events)
+
+    EventTee([mutating_sink, collecting_sink], batch_size=3).run(_events(10))
+    assert [event["message"] for event in received] == [
+        f"event {index}" for index in range(10)
+    ]
+
+
+def test_sink_failure_is_raised_and_stops_other_sinks():
+    seen = []
+
+    def failing_sink(events):
+        next(events)
+        raise OutputError("disk full")
+
+    def collecting_sink(events):
+        for event in events:
+            seen.append(event)
+
+    with pytest.raises(OutputError, match="disk full"):
+        EventTee([failing_sink, collecting_sink], batch_size=1, queue_batches=1).run(
+            _events(1000)
+        )
+    assert len(seen) < 1000
+
+
+def test_source_error_aborts_sinks(tmp_path):
+    output = tmp_path / "out.jsonl"
+
+    def broken_events():
+        yield from _events(5)
+        raise ProcessingError("mapping failed")
+
+    with pytest.raises(ProcessingError):
+        EventTee([FileWriter(output).write_to_file, lambda events: list(events)]).run(
+            broken_events()
+        )
+    assert not output.exists()
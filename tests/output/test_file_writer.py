@@ -0,0 +1,130 @@
+import gzip
+import json
+import time
+from pathlib import Path
+import pytest
+from thor2timesketch.exceptions import OutputError
+from thor2timesketch.output.file_writer import FileWriter
+
+
+def _events(count):
+    for index in range(count):
+        yield {"message": f"event {index}", "datetime": "2025-05-07T11:45:01+00:00"}
+
+
+def _messages(data):
+    return [json.loads(line)["message"] for line in data.splitlines()]
+
+
+def test_plain_output_normalizes_extension(tmp_path):
+    writer = FileWriter(tmp_path / "out.json")
+    writer.write_to_file(_events(3))
+    assert writer.output_file == tmp_path / "out.jsonl"
+    assert _messages(writer.output_file.read_text()) == [
+        "event 0",
+        "event 1",
+        "event 2",
+    ]
+
+
+def test_gzip_output(tmp_path):
+    writer = FileWriter(tmp_path / "out.jsonl", compression="gzip")
+    writer.write_to_file(_events(50))
+    assert writer.output_file == tmp_path / "out.jsonl.gz"
+    assert len(_messages(gzip.decompress(writer.output_file.read_bytes()))) == 50
+
+
+def test_compression_inferred_from_suffix(tmp_path):
+    writer = FileWriter(tmp_path / "out.jsonl.gz")
+    writer.write_to_file(_events(5))
+    assert writer.compression == "gzip"
+    assert len(_messages(gzip.decompress(writer.output_file.read_bytes()))) == 5
+
+
+def test_zstd_output(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    writer = FileWriter(tmp_path / "out.jsonl", compression="zstd", max_events=7)
+    writer.write_to_file(_events(20))
+    reader = zstandard.ZstdDecompressor()
+    counts = [
+        len(_messages(reader.decompress(part.read_bytes())))
+        for part in writer.part_files
+    ]
+    assert counts == [7, 7, 6]
+
+
+def test_rotation_by_events(tmp_path):
+    writer = FileWriter(tmp_path / "out.jsonl", max_events=4)
+    writer.write_to_file(_events(10))
+    assert [part.name for part in writer.part_files] == [
+        "out_part0001.jsonl",
+        "out_part0002.jsonl",
+        "out_part0003.jsonl",
+    ]
+    messages = [
+        message for part in writer.part_files for message in _messages(part.read_text())
+    ]
+    assert messages == [f"event {index}" for index in range(10)]
+
+
+@pytest.mark.parametrize(
+    "name, part",
+    [
+        ("my.jsonl.bak.jsonl", "my.jsonl.bak_part0001.jsonl"),
+        ("my.jsonl.bak.jsonl.gz", "my.jsonl.bak_part0001.jsonl.gz"),
+    ],
+)
+def test_rotation_splits_name_at_real_suffix(tmp_path, name, part):
+    writer = FileWriter(tmp_path / name, max_events=5)
+    writer.write_to_file(_events(5))
+    assert [part_file.name for part_file in writer.part_files] == [part]
+
+
+def test_rotation_by_size_keeps_whole_lines(tmp_path):
+    line_size = len(json.dumps(next(_events(1)))) + 1
+    writer = FileWriter(tmp_path / "out.jsonl", max_size=line_size * 3 + 1)
+    writer.write_to_file(_events(10))
+    sizes = [len(part.read_text().splitlines()) for part in writer.part_files]
+    assert sizes == [3, 3, 3, 1]
+
+
+def test_rotation_does_not_overwrite_existing_parts(tmp_path):
+    existing = tmp_path / "out_part0001.jsonl"
+    existing.write_text("keep\n")
+    writer = FileWriter(tmp_path / "out.jsonl", max_events=5)
+    writer.write_to_file(_events(5))
+    assert existing.read_text() == "keep\n"
+    assert writer.part_files == [tmp_path / "out_part0002.jsonl"]
+
+
+def test_failure_removes_written_parts(tmp_path):
+    def failing_events():
+        yield from _events(6)
+        raise ValueError("broken source")
+
+    writer = FileWriter(tmp_path / "out.jsonl", compression="gzip", max_events=2)
+    with pytest.raises(OutputError):
+        writer.write_to_file(failing_events())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unknown_compression():
+    with pytest.raises(OutputError):
+        FileWriter(Path("out.jsonl"), compression="lz4")
+
+
+def test_follow_writes_each_event_and_keeps_output_on_interrupt(tmp_path):
+    output_file = tmp_path / "out.jsonl"
+
+    def followed_events():
+        yield from _events(2)
+        for _ in range(100):
+            if output_file.exists() and len(output_file.read_text().splitlines()) == 2:
+                break
+            time.sleep(0.01)
+        raise KeyboardInterrupt()
+
+    writer = FileWriter(output_file, follow=True)
+    with pytest.raises(KeyboardInterrupt):
+        writer.write_to_file(followed_events())
+    assert _messages(output_file.read_text()) == ["event 0", "event 1"]
@@ -0,0 +1,127 @@
+import threading
+from pathlib import Path
+import pytest
+from thor2timesketch.exceptions import TimesketchError
+from thor2timesketch.output import ts_ingest
+from thor2timesketch.output.ts_ingest import TSIngest
+
+
+class StubSketch:
+    id = 7
+    name = "THOR APT SCANNER"
+
+
+class StubClient:
+    def list_sketches(self, scope, include_archived):
+        return [StubSketch()]
+
+    def get_sketch(self, sketch_id):
+        return StubSketch()
+
+
+class StubStreamer:
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.events = []
+        self.uploaded = []
+        self.threads = set()
+        self.timeline_name = None
+        with StubStreamer.lock:
+            StubStreamer.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def set_sketch(self, sketch):
+        pass
+
+    def set_timeline_name(self, name):
+        self.timeline_name = name
+
+    def set_provider(self, provider):
+        pass
+
+    def set_upload_context(self, context):
+        pass
+
+    def set_entry_threshold(self, threshold):
+        pass
+
+    def add_dict(self, event):
+        self.threads.add(threading.current_thread().name)
+        self.events.append(event)
+
+    def upload_buffer(self):
+        self.uploaded.append(len(self.events))
+
+    @property
+    def timeline(self):
+        return object() if self.events else None
+
+    @property
+    def state(self):
+        return "ready"
+
+
+@pytest.fixture(autouse=True)
+def stub_timesketch(monkeypatch):
+    StubStreamer.instances = []
+    monkeypatch.setattr(ts_ingest.timesketch_config, "get_client", StubClient)
+    monkeypatch.setattr(ts_ingest, "_Streamer", StubStreamer)
+
+
+def _events(count):
+    return ({"message": f"event {index}"} for index in range(count))
+
+
+def test_events_uploaded_in_order_from_uploader_thread():
+    ingest = TSIngest(Path("scan.json"), "7", queue_size=2_000)
+    ingest.ingest_events(_events(5_000))
+    (streamer,) = StubStreamer.instances
+    assert [event["message"] for event in streamer.events] == [
+        f"event {index}" for index in range(5_000)
+    ]
+    assert streamer.timeline_name == "scan"
+    assert threading.current_thread().name not in streamer.threads
+
+
+def test_multiple_uploaders_share_the_stream():
+    ingest = TSIngest(Path("scan.json"), "7", uploaders=3, queue_size=1_000)
+    ingest.ingest_events(_events(10_000))
+    messages = [
+        event["message"]
+        for streamer in StubStreamer.instances
+        for event in streamer.events
+    ]
+    assert len(StubStreamer.instances) == 3
+    assert sorted(messages) == sorted(f"event {index}" for index in range(10_000))
+
+
+def test_no_events_raises_timeline_error():
+    with pytest.raises(TimesketchError, match="Error creating timeline"):
+        TSIngest(Path("scan.json"), "7").ingest_events(_events(0))
+
+
+def test_buffer_is_uploaded_at_threshold():
+    TSIngest(Path("scan.json"), "7", buffer_size=2).ingest_events(_events(5))
+    (streamer,) = StubStreamer.instances
+    assert streamer.uploaded == [2, 4]
+
+
+def test_flush_interval_uploads_pending_events(monkeypatch):
+    flushed = threading.Event()
+    monkeypatch.setattr(StubStreamer, "upload_buffer", lambda self: flushed.set())
+
+    def events():
+        yield {"message": "event 0"}
+        assert flushed.wait(5)
+        yield {"message": "event 1"}
+
+    TSIngest(Path("scan.json"), "7", flush_interval=0.01).ingest_events(events())
+    (streamer,) = StubStreamer.instances
+    assert [event["message"] for event in streamer.events] == ["event 0", "event 1"]
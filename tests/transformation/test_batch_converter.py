@@ -0,0 +1,58 @@
+import json
+from thor2timesketch.transformation.batch_converter import (
+    BatchConverter,
+    BatchSettings,
+)
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+
+
+def _thor_line(index: int) -> str:
+    return json.dumps(
+        {
+            "time": "2025-05-07T11:45:01Z",
+            "hostname": "host",
+            "level": "Alert",
+            "module": "Filescan",
+            "message": f"Malicious file {index}",
+            "log_version": "v2.0.0",
+        }
+    )
+
+
+def _messages(path):
+    return [json.loads(line)["message"] for line in path.read_text().splitlines()]
+
+
+def test_files_converted_to_own_outputs(tmp_path):
+    input_files = []
+    for number in range(3):
+        input_file = tmp_path / f"scan{number}.json"
+        input_file.write_text("".join(_thor_line(i) + "\n" for i in range(number + 2)))
+        input_files.append(input_file)
+    output_files = [tmp_path / "out" / f"scan{number}.jsonl" for number in range(3)]
+
+    results = BatchConverter(BatchSettings(), workers=2).convert(
+        input_files, output_files
+    )
+
+    assert [result.input_file for result in results] == input_files
+    assert [result.events for result in results] == [2, 3, 4]
+    assert all(result.error is None for result in results)
+    expected = [
+        event["message"]
+        for event in JsonTransformer().transform_thor_logs(input_files[2], None)
+    ]
+    assert _messages(output_files[2]) == expected
+
+
+def test_failed_file_does_not_stop_the_batch(tmp_path):
+    good, bad = tmp_path / "good.json", tmp_path / "bad.json"
+    good.write_text(_thor_line(0) + "\n")
+    bad.write_text("{not json\n")
+    outputs = [tmp_path / "good.jsonl", tmp_path / "bad.jsonl"]
+
+    results = BatchConverter(BatchSettings(), workers=2).convert([good, bad], outputs)
+
+    assert results[0].error is None and results[0].events == 1
+    assert results[1].error is not None
+    assert _messages(outputs[0]) == ["Malicious file 0"]
@@ -0,0 +1,76 @@
+import json
+import subprocess
+import sys
+import pytest
+from thor2timesketch.input.line_reader import RawLine
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.utils.stage_profiler import StageProfiler
+
+
+def _thor_line(index: int, log_version: str = "v2.0.0") -> bytes:
+    return json.dumps(
+        {
+            "time": "2025-05-07T11:45:01Z",
+            "hostname": "host",
+            "level": "Alert",
+            "module": "Filescan",
+            "message": f"Malicious file {index}",
+            "log_version": log_version,
+        }
+    ).encode()
+
+
+def test_unmappable_received_log_skips_only_that_log(capsys):
+    data = [_thor_line(0), _thor_line(1, "v9.0.0"), _thor_line(2)]
+    lines = iter(
+        [RawLine(index + 1, 0, 0, line) for index, line in enumerate(data)] + [None]
+    )
+    events = JsonTransformer().transform_received_logs("host", lines, None)
+    assert [event["message"] for event in events] == [
+        "Malicious file 0",
+        "Malicious file 2",
+    ]
+    assert "v9.0.0" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "bad_line, normalized",
+    [
+        (_thor_line(1, "v9.0.0"), 2),
+        (_thor_line(1).replace(b'"2025-05-07T11:45:01Z"', b"5"), 3),
+    ],
+)
+def test_bad_log_does_not_map_the_batch_twice(bad_line, normalized):
+    data = [_thor_line(0), bad_line, _thor_line(2)]
+    lines = iter(
+        [RawLine(index + 1, 0, 0, line) for index, line in enumerate(data)] + [None]
+    )
+    StageProfiler.enable()
+    try:
+        events = list(JsonTransformer().transform_received_logs("host", lines, None))
+        stages = {stage["stage"]: stage for stage in StageProfiler.report()["stages"]}
+    finally:
+        StageProfiler.disable()
+    assert [event["message"] for event in events] == [
+        "Malicious file 0",
+        "Malicious file 2",
+    ]
+    assert (stages["pretransform"]["calls"], stages["pretransform"]["items"]) == (1, 3)
+    assert (stages["version"]["calls"], stages["version"]["items"]) == (1, 3)
+    assert (stages["map"]["calls"], stages["map"]["items"]) == (1, 2)
+    assert stages["normalize"]["calls"] == normalized
+
+
+def test_line_prefilter_does_not_import_mappers():
+    script = (
+        "import sys\n"
+        "from thor2timesketch.config.filter_findings import FilterFindings\n"
+        "from thor2timesketch.transformation.json_transformer import JsonTransformer\n"
+        "prefilter = JsonTransformer()._line_prefilter(FilterFindings({'alert'}, set()))\n"
+        "print(sorted(prefilter.log_versions))\n"
+        "print(sorted(name for name in sys.modules if 'mapper_json_v' in name))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.splitlines() == ["[b'v1.0.0', b'v2.0.0']", "[]"]
@@ -0,0 +1,105 @@
+import gzip
+import json
+import pytest
+from thor2timesketch.exceptions import InputError
+from thor2timesketch.input.file_chunker import FileChunker
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.transformation.parallel_transformer import ParallelTransformer
+
+
+def _thor_line(index: int) -> str:
+    return json.dumps(
+        {
+            "time": "2025-05-07T11:45:01Z",
+            "hostname": "host",
+            "level": "Alert" if index % 2 else "Info",
+            "module": "Filescan",
+            "message": f"Malicious file {index}",
+            "log_version": "v2.0.0",
+            "file": {"path": f"C:\\file{index}", "created": "2024-01-01T00:00:00Z"},
+        }
+    )
+
+
+def _without_group_id(events):
+    return [
+        {key: value for key, value in event.items() if key != "event_group_id"}
+        for event in events
+    ]
+
+
+def test_chunks_end_on_line_boundaries(tmp_path):
+    file_path = tmp_path / "scan.json"
+    file_path.write_text("".join(_thor_line(i) + "\n" for i in range(50)))
+    data = file_path.read_bytes()
+    chunks = list(FileChunker(chunk_size=500).split(file_path))
+    assert chunks[0].start == 0
+    assert chunks[-1].end == len(data)
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous.end == current.start
+        assert data[previous.end - 1 : previous.end] == b"\n"
+
+
+def test_parallel_output_matches_serial(tmp_path):
+    file_path = tmp_path / "scan.json"
+    lines = [_thor_line(i) for i in range(200)]
+    lines.insert(10, "")
+    file_path.write_text("\n".join(lines))
+    serial = list(JsonTransformer().transform_thor_logs(file_path, None))
+    parallel = list(
+        ParallelTransformer(workers=3, chunk_size=1024).transform_thor_logs(
+            file_path, None
+        )
+    )
+    assert len(serial) == 400
+    assert _without_group_id(parallel) == _without_group_id(serial)
+
+
+def test_parallel_reports_absolute_line_number(tmp_path):
+    file_path = tmp_path / "scan.json"
+    lines = [_thor_line(i) for i in range(100)]
+    lines[76] = "{bad json}"
+    file_path.write_text("\n".join(lines) + "\n")
+    events = ParallelTransformer(workers=2, chunk_size=512).transform_thor_logs(
+        file_path, None
+    )
+    with pytest.raises(InputError, match="at line 77"):
+        list(events)
+
+
+def test_parallel_compressed_input_matches_serial(tmp_path):
+    file_path = tmp_path / "scan.json.gz"
+    lines = [_thor_line(i) for i in range(120)]
+    lines[90] = "{bad json}"
+    with gzip.open(file_path, "wt") as file:
+        file.write("\n".join(lines[:90]))
+    serial = list(JsonTransformer().transform_thor_logs(file_path, None))
+    parallel = list(
+        ParallelTransformer(workers=2, chunk_size=1024).transform_thor_logs(
+            file_path, None
+        )
+    )
+    assert len(serial) == 180
+    assert _without_group_id(parallel) == _without_group_id(serial)
+
+    with gzip.open(file_path, "wt") as file:
+        file.write("\n".join(lines))
+    with pytest.raises(InputError, match="line 91"):
+        list(
+            ParallelTransformer(workers=2, chunk_size=1024).transform_thor_logs(
+                file_path, None
+            )
+        )
+
+
+def test_batches_match_single_event_stream(tmp_path):
+    file_path = tmp_path / "scan.json"
+    file_path.write_text("".join(_thor_line(i) + "\n" for i in range(25)))
+    events = list(JsonTransformer().transform_thor_logs(file_path, None))
+    batches = list(
+        JsonTransformer(batch_size=4).transform_thor_log_batches(file_path, None)
+    )
+    assert len(batches) == 7
+    assert _without_group_id(event for batch in batches for event in batch) == (
+        _without_group_id(events)
+    )
@@ -0,0 +1,50 @@
+import json
+import socket
+import threading
+from thor2timesketch.input.network_receiver import ListenAddress
+from thor2timesketch.transformation.batch_converter import BatchSettings
+from thor2timesketch.transformation.receiver_converter import ReceiverConverter
+
+
+def _thor_line(index: int) -> bytes:
+    return json.dumps(
+        {
+            "time": "2025-05-07T11:45:01Z",
+            "hostname": "host",
+            "level": "Alert",
+            "module": "Filescan",
+            "message": f"Malicious file {index}",
+            "log_version": "v2.0.0",
+        }
+    ).encode()
+
+
+def test_received_events_written_per_source(tmp_path):
+    converter = ReceiverConverter(
+        [ListenAddress.parse("tcp://127.0.0.1:0")], BatchSettings(), tmp_path
+    )
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.extend(converter.receive()), daemon=True
+    )
+    thread.start()
+    assert converter.receiver.ready.wait(5)
+    messages = [b"<14>Oct 18 11:00:00 host THOR: " + _thor_line(0), b"not json"]
+    messages += [_thor_line(index) for index in range(1, 4)]
+    with socket.create_connection(
+        ("127.0.0.1", converter.receiver.bound[0].port)
+    ) as client:
+        client.sendall(b"\n".join(messages) + b"\n")
+    output_file = tmp_path / "127.0.0.1.jsonl"
+    for _ in range(200):
+        if converter.events["127.0.0.1"] == 4:
+            break
+        thread.join(0.05)
+    converter.receiver.stop()
+    thread.join(10)
+
+    (result,) = results
+    assert (result.events, result.error, result.output_file) == (4, None, output_file)
+    assert [
+        json.loads(line)["message"] for line in output_file.read_text().splitlines()
+    ] == [f"Malicious file {index}" for index in range(4)]
@@ -0,0 +1,48 @@
+import importlib.util
+import pytest
+from thor2timesketch.exceptions import JsonCodecError
+from thor2timesketch.utils.json_codec import JsonCodec
+
+BACKENDS = [
+    backend
+    for backend in ("orjson", "msgspec")
+    if importlib.util.find_spec(backend) is not None
+] + ["json"]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = JsonCodec.backend
+    yield
+    JsonCodec.configure(backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_round_trip_from_bytes(backend):
+    JsonCodec.configure(backend)
+    event = {"message": "Malware found", "path": "C:\\Windows\\ü.exe", "score": 70}
+    line = JsonCodec.dumps_line(event)
+    assert line.endswith(b"\n")
+    assert JsonCodec.loads(line) == event
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_integers_beyond_64_bits_round_trip(backend):
+    JsonCodec.configure(backend)
+    event = {"id": 2**70, "path": "C:\\1234567890123456789012.exe"}
+    assert JsonCodec.loads(JsonCodec.dumps_line(event)) == event
+    assert JsonCodec.loads(b'{"id": %d}' % -(2**70)) == {"id": -(2**70)}
+
+
+def test_json_backend_matches_stdlib_format():
+    JsonCodec.configure("json")
+    assert JsonCodec.dumps_line({"a": 1, "b": "ü"}) == b'{"a": 1, "b": "\\u00fc"}\n'
+
+
+def test_auto_selects_installed_backend():
+    assert JsonCodec.configure("auto") == BACKENDS[0]
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(JsonCodecError):
+        JsonCodec.configure("simdjson")
@@ -0,0 +1,53 @@
+from thor2timesketch.utils.json_flattener import JSONFlattener
+
+
+def test_nested_dicts_are_flattened_in_breadth_first_order():
+    data = {
+        "module": "Filescan",
+        "file": {"path": "C:\\x", "hashes": {"md5": "abc"}, "size": 10},
+        "level": "Alert",
+    }
+    flattened = JSONFlattener.flatten_json(data)
+    assert list(flattened.items()) == [
+        ("module", "Filescan"),
+        ("level", "Alert"),
+        ("file_path", "C:\\x"),
+        ("file_size", 10),
+        ("file_hashes_md5", "abc"),
+    ]
+
+
+def test_list_of_dicts_is_indexed_and_other_lists_are_kept():
+    data = {
+        "reasons": [{"name": "r1"}, {"name": "r2"}],
+        "tags": ["a", "b"],
+        "empty": [],
+        "nothing": {},
+    }
+    assert JSONFlattener.flatten_json(data) == {
+        "reasons_1": {"name": "r1"},
+        "reasons_2": {"name": "r2"},
+        "tags": ["a", "b"],
+        "empty": [],
+    }
+
+
+def test_colliding_keys_keep_first_position_and_last_value():
+    flattened = JSONFlattener.flatten_json({"a_b": 1, "a": {"b": 2}, "c": 3})
+    assert list(flattened.items()) == [("a_b", 2), ("c", 3)]
+
+
+def test_cached_plans_are_reused_for_new_values():
+    first = JSONFlattener.flatten_json({"file": {"path": "one"}, "list": [{"x": 1}]})
+    second = JSONFlattener.flatten_json({"file": {"path": "two"}, "list": [{"x": 2}]})
+    assert first == {"file_path": "one", "list_1": {"x": 1}}
+    assert second == {"file_path": "two", "list_1": {"x": 2}}
+    assert next(iter(first)) is next(iter(second))
+
+
+def test_shape_change_builds_new_plan():
+    JSONFlattener.flatten_json({"file": {"path": "one"}})
+    assert JSONFlattener.flatten_json({"file": {"name": "x", "path": "y"}}) == {
+        "file_name": "x",
+        "file_path": "y",
+    }
@@ -0,0 +1,39 @@
+import pytest
+from thor2timesketch.utils.progress_bar import InputColumn, ProgressBar
+
+
+@pytest.fixture(autouse=True)
+def disabled_display():
+    enabled = ProgressBar.enabled
+    ProgressBar.enabled = False
+    yield
+    ProgressBar.enabled = enabled
+    ProgressBar.track_input(0)
+
+
+def _task(bar):
+    return bar.progress._tasks[bar.task_id]
+
+
+def test_advance_only_counts():
+    with ProgressBar("Writing") as bar:
+        for _ in range(1000):
+            bar.advance()
+        bar.advance(step=0, error=2)
+        assert (bar.processed, bar.errors) == (1000, 2)
+        assert _task(bar).completed == 0
+
+
+def test_input_column_shows_percentage_and_eta(monkeypatch):
+    with ProgressBar("Writing") as bar:
+        ProgressBar.track_input(1000, start=200)
+        ProgressBar.input_offset = 600
+        task = _task(bar)
+        monkeypatch.setattr(type(task), "elapsed", property(lambda _: 10.0))
+        assert InputColumn().render(task).plain == "60% • ETA 00:10"
+
+
+def test_input_column_hidden_without_input_tracking():
+    with ProgressBar("Ingesting", show_input=False) as bar:
+        ProgressBar.track_input(1000)
+        assert InputColumn().render(_task(bar)).plain == ""
@@ -0,0 +1,66 @@
+import pytest
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+
+
+def _event(index, created="2024-01-01T00:00:00Z"):
+    return {
+        "time": f"2025-05-07T11:45:{index:02d}Z",
+        "module": "Filescan",
+        "log_version": "v2.0.0",
+        "message": f"file {index}",
+        "file": {"path": f"C:\\file{index}", "created": created},
+        "reasons": [{"name": "r1", "matched": "2023-02-03T04:05:06"}],
+    }
+
+
+@pytest.fixture
+def learning():
+    RegexTimestampExtractor.configure_path_index(True)
+    yield RegexTimestampExtractor()
+    RegexTimestampExtractor.configure_path_index(False)
+
+
+def test_full_scan_order_and_paths():
+    timestamps = RegexTimestampExtractor().extract(_event(1))
+    assert timestamps == [
+        ("time", "2025-05-07T11:45:01+00:00"),
+        ("file created", "2024-01-01T00:00:00+00:00"),
+        ("reasons matched", "2023-02-03T04:05:06+00:00"),
+    ]
+
+
+def test_learned_paths_match_full_scan(learning):
+    full = RegexTimestampExtractor()
+    for index in range(5):
+        assert learning.extract(_event(index)) == full.extract(_event(index))
+    assert len(learning.path_index._paths) == 1
+
+
+def test_learned_paths_fall_back_when_shape_changes(learning):
+    learning.extract(_event(1))
+    changed = _event(2)
+    changed["file"] = "C:\\moved"
+    changed["extra"] = "2020-01-01T00:00:00Z"
+    assert [t.path for t in learning.extract(changed)] == [
+        "time",
+        "extra",
+        "reasons matched",
+    ]
+    nested_change = _event(3)
+    nested_change["reasons"] = []
+    assert [t.path for t in learning.extract(nested_change)] == [
+        "time",
+        "file created",
+    ]
+
+
+def test_empty_values_are_learned_as_candidates(learning):
+    assert [t.path for t in learning.extract(_event(1, created=""))] == [
+        "time",
+        "reasons matched",
+    ]
+    assert [t.path for t in learning.extract(_event(2))] == [
+        "time",
+        "file created",
+        "reasons matched",
+    ]
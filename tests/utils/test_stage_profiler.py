@@ -0,0 +1,86 @@
+import json
+import pytest
+from thor2timesketch.output.file_writer import FileWriter
+from thor2timesketch.transformation.json_transformer import JsonTransformer
+from thor2timesketch.transformation.parallel_transformer import ParallelTransformer
+from thor2timesketch.utils.json_codec import JsonCodec
+from thor2timesketch.utils.stage_profiler import StageProfiler
+
+
+def _thor_line(index: int) -> str:
+    return json.dumps(
+        {
+            "time": "2025-05-07T11:45:01Z",
+            "hostname": "host",
+            "level": "Alert",
+            "module": "Filescan",
+            "message": f"Malicious file {index}",
+            "log_version": "v2.0.0",
+            "file": {"path": f"C:\\file{index}", "created": "2024-01-01T00:00:00Z"},
+        }
+    )
+
+
+@pytest.fixture
+def profiler():
+    StageProfiler.enable()
+    yield StageProfiler
+    StageProfiler.disable()
+
+
+@pytest.fixture
+def thor_file(tmp_path):
+    file_path = tmp_path / "scan.json"
+    file_path.write_text("".join(_thor_line(i) + "\n" for i in range(20)))
+    return file_path
+
+
+def _stages(report):
+    return {stage["stage"]: stage for stage in report["stages"]}
+
+
+def test_disabled_profiler_leaves_methods_untouched():
+    original = JsonCodec.__dict__["loads"]
+    StageProfiler.enable()
+    assert JsonCodec.__dict__["loads"] is not original
+    StageProfiler.disable()
+    assert JsonCodec.__dict__["loads"] is original
+    assert not StageProfiler.enabled
+
+
+def test_profiler_counts_pipeline_stages(profiler, thor_file, tmp_path):
+    events = JsonTransformer().transform_thor_logs(thor_file, None)
+    FileWriter(tmp_path / "out.jsonl").write_to_file(events)
+    stages = _stages(profiler.report())
+    assert stages["transform"]["items"] == 40
+    assert stages["json_loads"]["calls"] == 20
+    assert stages["map"]["calls"] == 1
+    assert stages["map"]["items"] == 40
+    assert stages["version"]["items"] == 20
+    assert stages["serialize"]["calls"] == 1
+    assert stages["serialize"]["items"] == 40
+    assert stages["write"]["calls"] == 1
+    assert all(stage["wall_seconds"] >= 0 for stage in stages.values())
+    assert len((tmp_path / "out.jsonl").read_text().splitlines()) == 40
+
+
+def test_profiler_merges_worker_stages(profiler, thor_file):
+    events = list(ParallelTransformer(2).transform_thor_logs(thor_file, None))
+    stages = _stages(profiler.report())
+    assert len(events) == 40
+    assert stages["map"]["calls"] == 1
+    assert stages["map"]["items"] == 40
+    assert stages["transform"]["items"] == 40
+
+
+def test_collect_resets_and_merge_adds(profiler):
+    profiler.merge({"map": (2, 4, 0.5, 0.25)})
+    profiler.merge({"map": (1, 2, 0.5, 0.25)})
+    assert profiler.collect() == {"map": (3, 6, 1.0, 0.5)}
+    assert profiler.snapshot() == {}
+
+
+def test_write_report(profiler, tmp_path):
+    report_file = tmp_path / "profile.json"
+    profiler.write_report(profiler.report(), report_file)
+    assert "elapsed_seconds" in json.loads(report_file.read_text())
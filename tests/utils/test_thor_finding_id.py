@@ -0,0 +1,55 @@
+import importlib.util
+import re
+import pytest
+from thor2timesketch.utils.json_codec import JsonCodec
+from thor2timesketch.utils.thor_finding_id import ThorFindingId
+
+LOG = {"module": "Filescan", "file": {"path": "C:\\x.exe", "size": 3}, "score": 70}
+
+
+@pytest.fixture(autouse=True)
+def random_ids():
+    backend = JsonCodec.backend
+    yield
+    ThorFindingId.configure()
+    JsonCodec.configure(backend)
+
+
+def test_random_ids_by_default():
+    ThorFindingId.configure()
+    first, second = ThorFindingId.get_finding_id(LOG), ThorFindingId.get_finding_id(LOG)
+    assert first != second
+    assert re.fullmatch(r"TF-[a-z2-7]{26}", first)
+
+
+def test_deterministic_ids_depend_only_on_content():
+    ThorFindingId.configure(deterministic=True)
+    reordered = {"score": 70, "file": {"size": 3, "path": "C:\\x.exe"}}
+    reordered["module"] = "Filescan"
+    finding_id = ThorFindingId.get_finding_id(LOG)
+    assert re.fullmatch(r"TF-[a-z2-7]{26}", finding_id)
+    assert ThorFindingId.get_finding_id(reordered) == finding_id
+    assert ThorFindingId.get_finding_id({**LOG, "score": 71}) != finding_id
+
+
+def test_salt_implies_deterministic_and_changes_ids():
+    ThorFindingId.configure(deterministic=True)
+    unsalted = ThorFindingId.get_finding_id(LOG)
+    ThorFindingId.configure(salt="scan-1")
+    assert ThorFindingId.deterministic
+    salted = ThorFindingId.get_finding_id(LOG)
+    assert salted == ThorFindingId.get_finding_id(LOG)
+    assert salted != unsalted
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)],
+)
+def test_deterministic_ids_do_not_depend_on_json_backend(backend):
+    ThorFindingId.configure(deterministic=True)
+    log = {**LOG, "path": "C:\\ü.exe", "ratio": 0.5, "id": 2**70}
+    JsonCodec.configure("json")
+    expected = ThorFindingId.get_finding_id(log)
+    JsonCodec.configure(backend)
+    assert ThorFindingId.get_finding_id(log) == expected
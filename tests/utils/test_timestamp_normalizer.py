@@ -0,0 +1,55 @@
+from datetime import timezone
+import pytest
+from dateutil import parser
+from thor2timesketch.exceptions import MappingError, TimestampError
+from thor2timesketch.utils.regex_timestamp_extractor import RegexTimestampExtractor
+from thor2timesketch.utils.timestamp_normalizer import TimestampNormalizer
+
+TIMESTAMPS = [
+    "2025-05-07T11:45:01Z",
+    "2025-05-07T11:45:01z",
+    "2025-05-07T11:45:01",
+    "2025-05-07T11:45:01.5",
+    "2025-05-07T11:45:01.123Z",
+    "2025-05-07T11:45:01.123456+02:00",
+    "2025-05-07T11:45:01.1234567-05:30",
+    "2025-05-07T11:45:01+00:00",
+    "2025-05-07T11:45:01.000000Z",
+]
+
+
+def _reference(timestamp):
+    parsed = parser.isoparse(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.isoformat()
+
+
+@pytest.mark.parametrize("timestamp", TIMESTAMPS)
+def test_normalize_matches_isoparse(timestamp):
+    assert TimestampNormalizer.normalize(timestamp) == _reference(timestamp)
+    assert TimestampNormalizer.parse(timestamp) == parser.isoparse(timestamp)
+
+
+def test_repeated_timestamps_are_cached():
+    TimestampNormalizer.clear_cache()
+    for _ in range(3):
+        TimestampNormalizer.normalize("2025-05-07T11:45:01Z")
+    assert TimestampNormalizer.normalize.cache_info().hits == 2
+
+
+def test_is_same_timestamp_compares_instants():
+    extractor = RegexTimestampExtractor()
+    assert extractor.is_same_timestamp(
+        "2025-05-07T11:45:01Z", "2025-05-07T13:45:01+02:00"
+    )
+    assert not extractor.is_same_timestamp(
+        "2025-05-07T11:45:01Z", "2025-05-07T11:45:02Z"
+    )
+    with pytest.raises(MappingError):
+        extractor.is_same_timestamp("2025-05-07T11:45:01Z", "not a date")
+
+
+def test_invalid_date_raises_timestamp_error():
+    with pytest.raises(TimestampError):
+        RegexTimestampExtractor().extract({"created": "2025-02-30T00:00:00Z"})